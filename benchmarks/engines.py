@@ -0,0 +1,308 @@
+"""
+    © Jürgen Schoenemeyer, 20.10.2026 10:30
+
+    benchmarks/engines.py
+
+    uv run benchmarks/engines.py [rounds] [set_name ...]
+    uv run benchmarks/engines.py compare <old.json> <new.json>
+
+    all engines (helper/workers.py ENGINES) over all sample sets (settings/settings.yaml)
+     - sets with missing files are skipped
+     - before the timing: dict/hyph_<language>.hyb is compiled/validated once (helper/liang.py load_patterns)
+       in its own process (peak RSS is inherited by spawned processes)
+       -> Liang init and peak RSS do not depend on an existing .hyb, the time is in "prepare"
+     - each (set, engine) in a fresh process (spawn) -> init time and peak RSS of this engine only
+     - init: init_pyphen/init_pyhyphen/init_liang (loading the dictionary, without cache)
+     - warmup: the first WARMUP_WORDS words, then ROUNDS rounds over the whole set
+     - each round: hyphenate_masks (as check_all in main.py), the result cache (helper/cache.py) is off,
+       the positions cache of Pyphen is cleared before each round -> every round does the same work
+     - statistics of the rounds: median, quartiles (IQR), min, max -> words/sec of the median
+
+    -> results/benchmarks/ENGINES_<commit>.json (commit, python, platform, cpus, prepare + all results)
+
+    compare: median, words/sec, init and peak RSS of each (set, engine) old -> new (LIMITS)
+     - regression: worse by more than the threshold and the minimum difference,
+       median and words/sec: the IQRs do not overlap (new q1 > old q3)
+     - exit code 1: at least one regression, 2: a report could not be read
+
+    PUBLIC:
+     - run_benchmarks( set_names: List[str] | None = None, rounds: int = ROUNDS, language: str = "de_DE" ) -> Dict[str, Any]
+     - compare_reports( old: Dict[str, Any], new: Dict[str, Any] ) -> List[Dict[str, Any]]
+
+    PRIVATE:
+     - compare_metric( metric: str, before: Dict[str, Any], result: Dict[str, Any] ) -> Dict[str, Any] | None
+     - prepare_engines( language: str ) -> Dict[str, float]
+     - set_available( set_name: str, language: str ) -> bool
+     - run_engine( engine: str, set_name: str, language: str, rounds: int ) -> Dict[str, Any]
+     - round_stats( times: List[float], words: int ) -> Dict[str, float]
+     - clear_pyphen() -> None
+     - peak_rss() -> float | None
+     - git_commit() -> Tuple[str, bool]
+"""
+from __future__ import annotations
+
+import gc
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from result import is_err, is_ok  # noqa: E402
+
+from helper.cache import use_cache  # noqa: E402
+from helper.liang import load_patterns  # noqa: E402
+from helper.pyphen import get_pyphen_dic  # noqa: E402
+from helper.samples import SAMPLES_DIR, SUB_SETS, import_samples  # noqa: E402
+from helper.settings import get_sample, sample_names  # noqa: E402
+from helper.workers import ENGINES  # noqa: E402
+from utils.files import read_file, write_file  # noqa: E402
+from utils.globals import BASE_PATH  # noqa: E402
+from utils.trace import Color, Trace  # noqa: E402
+
+try:
+    import resource
+except ModuleNotFoundError: # Windows
+    pass
+
+RESULT_DIR = BASE_PATH / "results" / "benchmarks"
+
+ROUNDS = 5
+WARMUP_WORDS = 10_000
+
+# compare: metric -> relative threshold, minimum absolute difference (init is a single measurement), unit
+
+LIMITS: Dict[str, Tuple[float, float, str]] = {
+    "median":        (0.05, 0.0,  "sec"),
+    "words_per_sec": (0.05, 0.0,  "words/sec"),
+    "init":          (0.20, 0.05, "sec"),
+    "peak_rss":      (0.10, 5.0,  "MB"),
+}
+
+HIGHER_IS_BETTER = ("words_per_sec",)
+TIMED_ROUNDS     = ("median", "words_per_sec") # regression only if the IQRs do not overlap
+
+def run_benchmarks( set_names: List[str] | None = None, rounds: int = ROUNDS, language: str = "de_DE" ) -> Dict[str, Any]:
+    """
+    ### all engines over all sample sets
+
+    #### Arguments
+     - set_names: e.g. ["wortliste"] (None: all sets of settings.yaml)
+     - rounds: timed rounds per (set, engine)
+     - language: e.g. "de_DE"
+
+    #### Return
+     - report: {"commit": ..., "results": {set_name: {engine: {"words", "init", "median", "q1", "q3", ...}}}}
+    """
+
+    if set_names is None:
+        set_names = sample_names()
+
+    commit, dirty = git_commit()
+
+    report: Dict[str, Any] = {
+        "commit":   commit,
+        "dirty":    dirty,
+        "date":     datetime.now().astimezone().isoformat(timespec="seconds"),
+        "python":   platform.python_version(),
+        "platform": platform.platform(),
+        "cpus":     os.cpu_count(),
+        "language": language,
+        "rounds":   rounds,
+        "warmup":   WARMUP_WORDS,
+        "results":  {},
+    }
+
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        report["prepare"] = executor.submit(prepare_engines, language).result()
+
+    for set_name in set_names:
+        if not set_available(set_name, language):
+            Trace.warning(f"{set_name}: sample files not found - skipped")
+            continue
+
+        results: Dict[str, Any] = {}
+        report["results"][set_name] = results
+
+        for engine in ENGINES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = results[engine] = executor.submit(run_engine, engine, set_name, language, rounds).result()
+
+            rss = "-" if result["peak_rss"] is None else f"{result["peak_rss"]:.0f} MB"
+            Trace.result(
+                f"{set_name} {engine:16} init {result["init"]:6.3f} sec, median {result["median"]:7.3f} sec "
+                f"(IQR {result["iqr"]:.3f}), {Color.GREEN}{result["words_per_sec"]:>9} words/sec{Color.RESET}, peak RSS {rss}",
+            )
+
+    filepath = RESULT_DIR / f"ENGINES_{commit}{"-dirty" if dirty else ""}.json"
+    ret = write_file(filepath, report)
+    if is_err(ret):
+        Trace.error(f"Error: {ret.err_value}")
+
+    return report
+
+def compare_reports( old: Dict[str, Any], new: Dict[str, Any] ) -> List[Dict[str, Any]]:
+    """
+    ### median, words/sec, init and peak RSS of each (set, engine) in both reports
+
+    #### Return
+     - [{"set", "engine", "metric", "old", "new", "change", "regression"}] (change: new / old - 1)
+    """
+
+    changes: List[Dict[str, Any]] = []
+    for set_name, engines in new["results"].items():
+        for engine, result in engines.items():
+            before = old["results"].get(set_name, {}).get(engine)
+            if before is None:
+                continue
+
+            for metric, (_, _, unit) in LIMITS.items():
+                change = compare_metric(metric, before, result)
+                if change is None:
+                    continue
+
+                changes.append({"set": set_name, "engine": engine, **change})
+
+                text = f"{set_name} {engine:16} {metric:13} {change["old"]:10} -> {change["new"]:10} {unit:9} ({change["change"]:+.1%})"
+                if change["regression"]:
+                    Trace.warning(f"{text} regression")
+                else:
+                    Trace.result(text)
+
+    return changes
+
+# PRIVATE
+
+def compare_metric( metric: str, before: Dict[str, Any], result: Dict[str, Any] ) -> Dict[str, Any] | None:
+    old_value, new_value = before.get(metric), result.get(metric)
+    if old_value is None or new_value is None: # peak_rss: no resource module, init: older reports
+        return None
+
+    threshold, minimum, _ = LIMITS[metric]
+
+    change = new_value / old_value - 1 if old_value else 0.0
+    worse = -change if metric in HIGHER_IS_BETTER else change
+
+    regression = worse > threshold and abs(new_value - old_value) > minimum
+    if metric in TIMED_ROUNDS:
+        regression = regression and result["q1"] > before["q3"]
+
+    return {"metric": metric, "old": old_value, "new": new_value, "change": round(change, 4), "regression": regression}
+
+# in a spawned process: compiled data shared by the engines, built once -> every engine only loads it
+
+def prepare_engines( language: str ) -> Dict[str, float]:
+    start = time.perf_counter()
+    load_patterns(language)
+    prepare = {"Liang .hyb": round(time.perf_counter() - start, 4)}
+
+    Trace.info(f"prepare: {prepare}")
+    return prepare
+
+def set_available( set_name: str, language: str ) -> bool:
+    sample = get_sample(set_name)
+    dirpath = SAMPLES_DIR / language if sample.type == "yaml" else SAMPLES_DIR / language / sample.directory
+    return all((dirpath / str(file)).is_file() for file in sample.files)
+
+# in the spawned process
+
+def run_engine( engine: str, set_name: str, language: str, rounds: int ) -> Dict[str, Any]:
+    Trace.set(hide=["info", "decorator"])
+    use_cache(False)
+
+    words = list(import_samples(set_name, SUB_SETS.get(set_name, []), language)[1])
+    _, init, _, hyphenate_masks = ENGINES[engine]
+
+    start = time.perf_counter()
+    init(language)
+    init_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hyphenate_masks(words[:WARMUP_WORDS])
+    warmup_time = time.perf_counter() - start
+
+    times: List[float] = []
+    for _ in range(rounds):
+        if engine == "Pyphen":
+            clear_pyphen()
+        gc.collect()
+
+        start = time.perf_counter()
+        hyphenate_masks(words)
+        times.append(time.perf_counter() - start)
+
+    return {
+        "words":    len(words),
+        "init":     round(init_time, 4),
+        "warmup":   round(warmup_time, 4),
+        **round_stats(times, len(words)),
+        "peak_rss": peak_rss(),
+    }
+
+def round_stats( times: List[float], words: int ) -> Dict[str, float]:
+    median = statistics.median(times)
+    if len(times) > 1:
+        q1, _, q3 = statistics.quantiles(times, n=4, method="inclusive")
+    else:
+        q1 = q3 = median
+
+    return {
+        "median":        round(median, 4),
+        "q1":            round(q1, 4),
+        "q3":            round(q3, 4),
+        "iqr":           round(q3 - q1, 4),
+        "min":           round(min(times), 4),
+        "max":           round(max(times), 4),
+        "words_per_sec": round(words / median) if median else 0,
+    }
+
+def clear_pyphen() -> None:
+    get_pyphen_dic().hd.cache.clear() # LRUCache of the positions (helper/pyphen.py load_pyphen_dic)
+
+# peak resident set size of this process in MB (None: no resource module)
+
+def peak_rss() -> float | None:
+    if "resource" not in sys.modules:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss # Linux: KB, macOS: bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def git_commit() -> Tuple[str, bool]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_PATH, capture_output=True, text=True, check=True).stdout.strip()  # noqa: S607
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=BASE_PATH, capture_output=True, text=True, check=True).stdout  # noqa: S607
+    except (OSError, subprocess.CalledProcessError):
+        return datetime.now().astimezone().strftime("%Y%m%d-%H%M%S"), False
+
+    return commit, bool(status.strip())
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "compare":  # noqa: PLR2004
+        old, new = read_file(sys.argv[2]), read_file(sys.argv[3])
+        if is_err(old):
+            Trace.error(f"Error: {old.err_value}")
+            sys.exit(2)
+        elif is_err(new):
+            Trace.error(f"Error: {new.err_value}")
+            sys.exit(2)
+        elif is_ok(old) and is_ok(new):
+            changes = compare_reports(old.ok_value, new.ok_value)
+            if any(change["regression"] for change in changes):
+                sys.exit(1)
+    else:
+        run_benchmarks(
+            sys.argv[2:] or None,
+            int(sys.argv[1]) if len(sys.argv) > 1 else ROUNDS,
+        )
@@ -0,0 +1,188 @@
+"""
+    © Jürgen Schoenemeyer, 19.10.2026 16:30
+
+    benchmarks/pool_modes.py
+
+    uv run benchmarks/pool_modes.py [set_name] [workers]
+
+    PyHyphen (hyphen.c, without patch) on a whole sample set - serial, thread pool, process pool
+     - serial:    one Hyphenator
+     - threads:   bounded ThreadPoolExecutor, one Hyphenator per thread (threading.local),
+                  the word list is shared (no pickling)
+     - processes: ProcessPoolExecutor, one Hyphenator per process (initializer),
+                  chunks and results are pickled
+     - same work in each mode, the results are compared with the serial run
+     - init (loading the Hyphenators) is reported separately, not in words/sec
+
+    result (wortliste, 239,650 words, 4 workers, 1 cpu):
+     - serial     1.21 sec  197,750 words/sec
+     - threads    1.49 sec  160,551 words/sec (init 13.0 sec: 4 Hyphenators, one after the other)
+     - processes  1.60 sec  149,817 words/sec (init 14.0 sec)
+
+     - hyphen.hnj does not release the GIL (no Py_BEGIN_ALLOW_THREADS, the extension does not
+       import PyEval_SaveThread) -> only one thread hyphenates at a time, on any number of cpus
+     - Hyphenator.apply (C, with encoding and splitting) is about 70 % of the time per word,
+       a ctypes wrapper around hnj_hyphen_hyphenate2 would release the GIL only for the pattern
+       matching itself and is not a drop-in (mode flags, non-standard hyphenation)
+     -> no thread pool mode in helper/workers.py, processes stay the way to use several cpus
+
+    PUBLIC:
+     - run_benchmark( set_name: str = "wortliste", workers: int = os.cpu_count(), language: str = "de_DE" ) -> Dict[str, Dict[str, float]]
+
+    PRIVATE:
+     - run_serial( words: List[str], language: str ) -> Tuple[List[str], float, float]
+     - run_threads( words: List[str], language: str, workers: int ) -> Tuple[List[str], float, float]
+     - run_processes( words: List[str], language: str, workers: int ) -> Tuple[List[str], float, float]
+     - hyphenate_chunk( hyphenator: Hyphenator, words: List[str] ) -> List[str]
+     - thread_hyphenator( language: str ) -> Hyphenator
+     - init_process( language: str, barrier: Barrier ) -> None
+     - process_chunk( words: List[str] ) -> List[str]
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from hyphen import Hyphenator  # type: ignore[import-untyped]  # noqa: E402
+
+from helper.pyhyphen import DICT_DIR  # noqa: E402
+from helper.samples import import_samples  # noqa: E402
+from utils.trace import Trace  # noqa: E402
+
+if TYPE_CHECKING:
+    from multiprocessing.synchronize import Barrier
+
+CHUNKS_PER_WORKER = 4
+
+thread_data = threading.local()
+process_hyphenator: Hyphenator | None = None
+
+def run_benchmark( set_name: str = "wortliste", workers: int = os.cpu_count() or 1, language: str = "de_DE" ) -> Dict[str, Dict[str, float]]:
+    """
+    ### serial, thread pool, process pool - words/sec
+
+    #### Arguments
+     - set_name: e.g. "wortliste"
+     - workers: number of threads/processes
+     - language: e.g. "de_DE"
+
+    #### Return
+     - {mode: {"init": sec, "hyphenate": sec, "words_per_sec": float, "speedup": float}}
+    """
+
+    words = list(import_samples(set_name, [], language)[1])
+    Trace.info(f"{set_name}: {len(words)} words, {workers} workers, {os.cpu_count()} cpus")
+
+    expected, init, hyphenate = run_serial(words, language)
+    runs = {"serial": (init, hyphenate)}
+
+    for mode, run in (("threads", run_threads), ("processes", run_processes)):
+        results, init, hyphenate = run(words, language, workers)
+        if results != expected:
+            Trace.error(f"{mode}: results differ from the serial run")
+        runs[mode] = (init, hyphenate)
+
+    report: Dict[str, Dict[str, float]] = {}
+    for mode, (init, hyphenate) in runs.items():
+        report[mode] = {
+            "init":          round(init, 3),
+            "hyphenate":     round(hyphenate, 3),
+            "words_per_sec": round(len(words) / hyphenate),
+            "speedup":       round(runs["serial"][1] / hyphenate, 2),
+        }
+        Trace.result(f"{mode:10} init {init:6.2f} sec, hyphenate {hyphenate:6.2f} sec, {report[mode]["words_per_sec"]:>9} words/sec, speedup {report[mode]["speedup"]}")
+
+    return report
+
+# PRIVATE
+
+def run_serial( words: List[str], language: str ) -> Tuple[List[str], float, float]:
+    start = time.perf_counter()
+    hyphenator = Hyphenator(language, directory=DICT_DIR)
+    init = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = hyphenate_chunk(hyphenator, words)
+    return results, init, time.perf_counter() - start
+
+def run_threads( words: List[str], language: str, workers: int ) -> Tuple[List[str], float, float]:
+    size = max(1, -(-len(words) // (workers * CHUNKS_PER_WORKER)))
+
+    barrier = threading.Barrier(workers) # each init task in its own thread
+
+    def init_thread( _: int ) -> None:
+        thread_hyphenator(language)
+        barrier.wait()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        start = time.perf_counter()
+        list(executor.map(init_thread, range(workers)))
+        init = time.perf_counter() - start
+
+        start = time.perf_counter()
+        chunks = executor.map(lambda first: hyphenate_chunk(thread_hyphenator(language), words[first : first + size]), range(0, len(words), size))
+        results = [result for chunk in chunks for result in chunk]
+        return results, init, time.perf_counter() - start
+
+def run_processes( words: List[str], language: str, workers: int ) -> Tuple[List[str], float, float]:
+    size = max(1, -(-len(words) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [words[i : i + size] for i in range(0, len(words), size)]
+
+    barrier = multiprocessing.Barrier(workers + 1) # all processes initialized
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_process, initargs=(language, barrier)) as executor:
+        for _ in range(workers): # each submit starts a process
+            executor.submit(process_chunk, [])
+        barrier.wait()
+        init = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [result for chunk in executor.map(process_chunk, chunks) for result in chunk]
+        return results, init, time.perf_counter() - start
+
+# same work as helper/pyhyphen.py hyphenate_words( words, patch=False )
+
+def hyphenate_chunk( hyphenator: Hyphenator, words: List[str] ) -> List[str]:
+    syllables = hyphenator.syllables
+
+    def hyphenate_part( part: str ) -> str:
+        return "·".join(syllables(part)) or part
+
+    return [
+        hyphenate_part(word) if "-" not in word else "-".join([hyphenate_part(part) for part in word.split("-")])
+        for word in words
+    ]
+
+def thread_hyphenator( language: str ) -> Hyphenator:
+    hyphenator: Hyphenator | None = getattr(thread_data, "hyphenator", None)
+    if hyphenator is None:
+        hyphenator = thread_data.hyphenator = Hyphenator(language, directory=DICT_DIR)
+    return hyphenator
+
+def init_process( language: str, barrier: Barrier ) -> None:
+    global process_hyphenator
+
+    process_hyphenator = Hyphenator(language, directory=DICT_DIR)
+    barrier.wait()
+
+def process_chunk( words: List[str] ) -> List[str]:
+    if process_hyphenator is None:
+        return []
+
+    return hyphenate_chunk(process_hyphenator, words)
+
+if __name__ == "__main__":
+    run_benchmark(
+        sys.argv[1] if len(sys.argv) > 1 else "wortliste",
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1,  # noqa: PLR2004
+    )
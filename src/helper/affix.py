@@ -0,0 +1,298 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 20:30
+
+    src/helper/affix.py
+
+    Hunspell affix expansion: .dic + .aff -> all word forms (e.g. de_DE_frami -> inflected forms)
+
+    https://manpages.ubuntu.com/manpages/noble/man5/hunspell.5.html
+
+    supported:
+     - PFX/SFX: strip, affix, condition, cross product (prefix + suffix, both "Y")
+     - continuation flags of a suffix: twofold suffixes, CIRCUMFIX (only with prefix + suffix)
+     - NEEDAFFIX, FORBIDDENWORD, ONLYINCOMPOUND (no stand-alone forms)
+     - FLAG: char (default), long, num, UTF-8
+    not supported: compounding (the compound flags are ignored), AF/AM aliases, continuation flags of a prefix
+
+    conditions (precompiled once per rule):
+     - the positions are frozensets (negate: [^...]), "." positions are dropped
+     - the first position (word end for SFX, word start for PFX) is a lookup table per affix class:
+       character -> candidate rules, filled on first use (negations resolved once)
+     - only the remaining positions are checked per word
+
+    PUBLIC:
+     - load_affixes( filepath: Path, encoding: str ) -> AffixTable
+     - expand_dictionary( dic_path: Path, aff_path: Path, encoding: str ) -> Iterator[str]  # may repeat forms
+
+    class AffixTable:
+     - AffixTable.expand( word: str, flags: FrozenSet[str] ) -> Iterator[str]
+     - AffixTable.parse_flags( flags: str ) -> FrozenSet[str]
+
+    PRIVATE:
+     - AffixRule( strip, affix, flags, edge, condition, length ) - NamedTuple
+     - AffixClass( flag: str, suffix: bool, cross: bool )
+     - compile_condition( condition: str ) -> List[Tuple[FrozenSet[str], bool]]
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, NamedTuple, Tuple
+
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+ANY: Tuple[FrozenSet[str], bool] = (frozenset(), True) # condition "."
+
+class AffixRule(NamedTuple):
+    strip:     str
+    affix:     str
+    flags:     FrozenSet[str]                           # continuation flags
+    edge:      Tuple[FrozenSet[str], bool]              # first position (-> AffixClass.candidates)
+    condition: Tuple[Tuple[int, FrozenSet[str], bool], ...] # other positions: offset from the edge, characters, negate
+    length:    int                                      # minimal word length
+
+class AffixClass:
+    """
+    ### all rules of one PFX/SFX flag
+    """
+
+    def __init__(self, flag: str, suffix: bool, cross: bool) -> None:
+        self.flag   = flag
+        self.suffix = suffix
+        self.cross  = cross
+        self.rules: List[AffixRule] = []
+        self.table: Dict[str, Tuple[AffixRule, ...]] = {} # edge character -> candidate rules
+
+    def candidates(self, char: str) -> Tuple[AffixRule, ...]:
+        rules = self.table.get(char)
+        if rules is None:
+            rules = self.table[char] = tuple(rule for rule in self.rules if (char in rule.edge[0]) != rule.edge[1])
+        return rules
+
+    def apply(self, word: str) -> Iterator[Tuple[str, AffixRule]]:
+        if not word:
+            return
+
+        size = len(word)
+        if self.suffix:
+            for rule in self.candidates(word[-1]):
+                if size < rule.length or not word.endswith(rule.strip):
+                    continue
+                for offset, chars, negate in rule.condition:
+                    if (word[-1 - offset] in chars) == negate:
+                        break
+                else:
+                    yield word[:size - len(rule.strip)] + rule.affix, rule
+        else:
+            for rule in self.candidates(word[0]):
+                if size < rule.length or not word.startswith(rule.strip):
+                    continue
+                for offset, chars, negate in rule.condition:
+                    if (word[offset] in chars) == negate:
+                        break
+                else:
+                    yield rule.affix + word[len(rule.strip):], rule
+
+class AffixTable:
+    """
+    ### parsed .aff file
+    """
+
+    def __init__(self) -> None:
+        self.flag_type = "char"
+        self.prefixes: Dict[str, AffixClass] = {}
+        self.suffixes: Dict[str, AffixClass] = {}
+        self.excluded:   FrozenSet[str] = frozenset() # FORBIDDENWORD, ONLYINCOMPOUND: no forms
+        self.need_affix: FrozenSet[str] = frozenset() # NEEDAFFIX: only with an affix
+        self.circumfix = "\0"                         # CIRCUMFIX: affix only with prefix + suffix
+        self.partial:    FrozenSet[str] = frozenset() # need_affix + circumfix (continuation flags)
+
+    def parse_flags( self, flags: str ) -> FrozenSet[str]:
+        if self.flag_type == "long":
+            return frozenset(flags[i : i + 2] for i in range(0, len(flags), 2))
+        if self.flag_type == "num":
+            return frozenset(flag for flag in flags.split(",") if flag)
+        return frozenset(flags)
+
+    def expand( self, word: str, flags: FrozenSet[str] ) -> Iterator[str]:
+        """
+        ### word + all its affixed forms (a form may occur more than once)
+        """
+
+        excluded = self.excluded
+        if flags & excluded:
+            return
+
+        if not flags & self.need_affix:
+            yield word
+
+        partial = self.partial
+
+        prefixes = [self.prefixes[flag] for flag in flags if flag in self.prefixes]
+
+        for flag in flags:
+            affix_class = self.suffixes.get(flag)
+            if affix_class is None:
+                continue
+
+            for form, rule in affix_class.apply(word):
+                if rule.flags & excluded:
+                    continue
+
+                if not rule.flags & partial:
+                    yield form
+
+                for next_flag in rule.flags: # twofold suffix
+                    next_class = self.suffixes.get(next_flag)
+                    if next_class is not None:
+                        for next_form, next_rule in next_class.apply(form):
+                            if not next_rule.flags & (excluded | partial):
+                                yield next_form
+
+                if affix_class.cross:
+                    circumfix = self.circumfix in rule.flags
+                    for prefix_class in prefixes:
+                        if prefix_class.cross:
+                            for prefix_form, prefix_rule in prefix_class.apply(form):
+                                if not prefix_rule.flags & excluded and (self.circumfix in prefix_rule.flags) == circumfix:
+                                    yield prefix_form
+
+        for prefix_class in prefixes:
+            for form, rule in prefix_class.apply(word):
+                if not rule.flags & (excluded | partial):
+                    yield form
+
+def load_affixes( filepath: Path, encoding: str ) -> AffixTable:
+    """
+    ### parse a Hunspell .aff file (PFX/SFX rules, FLAG, NEEDAFFIX, FORBIDDENWORD, ONLYINCOMPOUND, CIRCUMFIX)
+
+    #### Arguments
+     - filepath: Path of the .aff file
+     - encoding: e.g. "cp1252" (SET is ignored)
+
+    #### Return
+     - AffixTable (empty if the file can't be read)
+    """
+
+    table = AffixTable()
+    excluded: List[str] = []
+    need_affix: List[str] = []
+
+    try:
+        with filepath.open(mode="r", encoding=encoding) as file:
+            lines = [line.split() for line in file if line.strip() and not line.startswith("#")]
+    except OSError as err:
+        Trace.error(f"{err}")
+        return table
+
+    pending = 0 # rules left of the current class
+    current: AffixClass | None = None
+
+    for fields in lines:
+        keyword = fields[0]
+
+        if keyword in ("PFX", "SFX") and len(fields) >= 4:
+            if pending == 0 or current is None:
+                current = AffixClass(fields[1], keyword == "SFX", fields[2] == "Y")
+                (table.suffixes if current.suffix else table.prefixes)[current.flag] = current
+                pending = int(fields[3])
+                continue
+
+            strip  = "" if fields[2] == "0" else fields[2]
+            affix, _, continuation = fields[3].partition("/")
+            affix  = "" if affix == "0" else affix
+
+            positions = compile_condition(fields[4] if len(fields) > 4 else ".")
+            if current.suffix:
+                positions.reverse()
+            positions = positions or [ANY]
+
+            current.rules.append(AffixRule(
+                strip,
+                affix,
+                table.parse_flags(continuation),
+                positions[0],
+                tuple((offset, chars, negate) for offset, (chars, negate) in enumerate(positions) if offset > 0 and (chars, negate) != ANY),
+                max(len(positions), len(strip) + 1),
+            ))
+            pending -= 1
+
+        elif keyword == "FLAG" and len(fields) > 1:
+            table.flag_type = fields[1].lower()
+
+        elif keyword in ("FORBIDDENWORD", "ONLYINCOMPOUND") and len(fields) > 1:
+            excluded.extend(table.parse_flags(fields[1]))
+
+        elif keyword in ("NEEDAFFIX", "PSEUDOROOT") and len(fields) > 1:
+            need_affix.extend(table.parse_flags(fields[1]))
+
+        elif keyword == "CIRCUMFIX" and len(fields) > 1:
+            table.circumfix = fields[1]
+
+    table.excluded   = frozenset(excluded)
+    table.need_affix = frozenset(need_affix)
+    table.partial    = table.need_affix | {table.circumfix}
+    return table
+
+def expand_dictionary( dic_path: Path, aff_path: Path, encoding: str ) -> Iterator[str]:
+    """
+    ### all word forms of a Hunspell dictionary (stream)
+
+    #### Arguments
+     - dic_path: .dic file (first line: number of entries, then word/flags)
+     - aff_path: .aff file
+     - encoding: e.g. "cp1252"
+
+    #### Return
+     - generator of word forms (dictionary order, a form may occur more than once)
+    """
+
+    table = load_affixes(aff_path, encoding)
+
+    flag_cache: Dict[str, FrozenSet[str]] = {}
+    try:
+        with dic_path.open(mode="r", encoding=encoding) as file:
+            for i, line in enumerate(file):
+                line = line.strip()  # noqa: PLW2901
+                if i == 0 or len(line) == 0 or line.startswith("#"):
+                    continue
+
+                word, _, flags = line.split()[0].partition("/")
+
+                parsed = flag_cache.get(flags)
+                if parsed is None:
+                    parsed = flag_cache[flags] = table.parse_flags(flags)
+
+                yield from table.expand(word, parsed)
+
+    except OSError as err:
+        Trace.error(f"{err}")
+
+# PRIVATE
+
+def compile_condition( condition: str ) -> List[Tuple[FrozenSet[str], bool]]:
+    positions: List[Tuple[FrozenSet[str], bool]] = []
+
+    i = 0
+    while i < len(condition):
+        char = condition[i]
+        if char == "[":
+            end = condition.find("]", i)
+            if end < 0:
+                end = len(condition)
+            chars = condition[i + 1 : end]
+            if chars.startswith("^"):
+                positions.append((frozenset(chars[1:]), True))
+            else:
+                positions.append((frozenset(chars), False))
+            i = end + 1
+        elif char == ".":
+            positions.append(ANY)
+            i += 1
+        else:
+            positions.append((frozenset(char), False))
+            i += 1
+
+    return positions
@@ -0,0 +1,154 @@
+"""
+    © Jürgen Schoenemeyer, 19.10.2026 09:30
+
+    src/helper/analysis.py
+
+    engine comparison of a whole sample set - vectorized (NumPy) over the masks of Columns (helper/columns.py)
+     - identical: share of identical results for each pair of engines
+     - precision, recall, F1 of the break positions of each engine against a reference engine
+     - per position (break after letter 1 .. 64): words with a break in both, only in the engine, only in the reference
+       and the agreement (words long enough for this position)
+     - histogram: number of breaks per word
+
+    words with an exception (see columns.py: changed letters, > 64 letters) in the engine or the reference
+    are not in the break statistics ("exceptions"), but in "identical"
+
+    PUBLIC:
+     - analyze( columns: Columns, reference: str, engines: List[str] | None = None ) -> Result[Dict[str, Any], str]
+     - break_counts( masks: NDArray[np.uint64] ) -> NDArray[np.int64]
+     - position_counts( masks: NDArray[np.uint64] ) -> NDArray[np.int64]
+
+    PRIVATE:
+     - engine_statistics( masks: NDArray[np.uint64], reference: NDArray[np.uint64], lengths: NDArray[np.int64] ) -> Dict[str, Any]
+     - ratio( numerator: int, denominator: int ) -> float
+"""
+from __future__ import annotations
+
+import sys
+
+from itertools import combinations
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from result import Err, Ok, Result
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    pass
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from helper.columns import Columns
+
+MASK_BITS = 64
+DIGITS = 6 # rounding of the shares in the report
+
+def analyze( columns: Columns, reference: str, engines: List[str] | None = None ) -> Result[Dict[str, Any], str]:
+    """
+    ### compare engines against a reference engine
+
+    #### Arguments
+     - columns: e.g. Columns.from_breaks( words, hyphenate_parallel_masks( ... ) ) or read_columns( .hyc )
+     - reference: e.g. "PyHyphen"
+     - engines: default: all engines of columns (without the reference)
+
+    #### Return [rustedpy]
+     - Ok: report (dict, json ready)
+     - Err: errortext as str
+    """
+
+    if "numpy" not in sys.modules:
+        return Err("module 'numpy' not installed")
+
+    if engines is None:
+        engines = [engine for engine in columns.masks if engine != reference]
+
+    for engine in [reference, *engines]:
+        if engine not in columns.masks:
+            return Err(f"unknown engine '{engine}'")
+
+    count = len(columns.words)
+    lengths = np.fromiter(map(len, columns.words), dtype=np.int64, count=count)
+    masks = {engine: np.frombuffer(columns.masks[engine], dtype=np.uint64) for engine in [reference, *engines]}
+
+    all_engines = [reference, *engines]
+    identical: Dict[str, Dict[str, float]] = {engine: {engine: 1.0} for engine in all_engines}
+    for engine_a, engine_b in combinations(all_engines, 2):
+        share = ratio(count - len(columns.differences(engine_a, engine_b)), count)
+        identical[engine_a][engine_b] = identical[engine_b][engine_a] = share
+
+    statistics: Dict[str, Any] = {}
+    for engine in all_engines:
+        valid = np.ones(count, dtype=bool)
+        valid[list(columns.exceptions[engine].keys() | columns.exceptions[reference].keys())] = False
+
+        statistics[engine] = {
+            "exceptions": int(count - np.count_nonzero(valid)),
+            **engine_statistics(masks[engine][valid], masks[reference][valid], lengths[valid]),
+        }
+
+    return Ok({
+        "words":      count,
+        "reference":  reference,
+        "identical":  identical,
+        "engines":    statistics,
+    })
+
+def break_counts( masks: NDArray[np.uint64] ) -> NDArray[np.int64]:
+    """
+    ### number of breaks of each word (popcount)
+    """
+
+    if hasattr(np, "bitwise_count"): # NumPy >= 2.0
+        return np.bitwise_count(masks).astype(np.int64)
+
+    return np.unpackbits(masks.astype("<u8").view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1, dtype=np.int64)
+
+def position_counts( masks: NDArray[np.uint64] ) -> NDArray[np.int64]:
+    """
+    ### number of words with a break after letter i + 1 (index i: 0 .. 63)
+    """
+
+    bits = np.unpackbits(masks.astype("<u8").view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    return bits.sum(axis=0, dtype=np.int64)
+
+# PRIVATE
+
+def engine_statistics( masks: NDArray[np.uint64], reference: NDArray[np.uint64], lengths: NDArray[np.int64] ) -> Dict[str, Any]:
+    both      = masks & reference
+    only      = masks & ~reference
+    missing   = ~masks & reference
+
+    true_positives  = int(break_counts(both).sum())
+    false_positives = int(break_counts(only).sum())
+    false_negatives = int(break_counts(missing).sum())
+
+    precision = ratio(true_positives, true_positives + false_positives)
+    recall    = ratio(true_positives, true_positives + false_negatives)
+
+    # a break after letter i + 1 is possible in words with more than i + 1 letters
+
+    slots = np.bincount(np.clip(lengths - 1, 0, MASK_BITS), minlength=MASK_BITS + 1)[::-1].cumsum()[::-1][1:]
+    positions = int(np.max(np.flatnonzero(slots), initial=-1)) + 1
+
+    position_both    = position_counts(both)[:positions]
+    position_only    = position_counts(only)[:positions]
+    position_missing = position_counts(missing)[:positions]
+
+    return {
+        "breaks":    int(break_counts(masks).sum()),
+        "precision": precision,
+        "recall":    recall,
+        "f1":        round(2 * precision * recall / (precision + recall), DIGITS) if precision + recall else 0.0,
+        "histogram": np.bincount(break_counts(masks)).tolist(),
+        "positions": {
+            "both":       position_both.tolist(),
+            "only":       position_only.tolist(),
+            "missing":    position_missing.tolist(),
+            "agreement":  [ratio(int(slot - differ), int(slot)) for slot, differ in zip(slots[:positions], position_only + position_missing, strict=True)],
+        },
+    }
+
+def ratio( numerator: int, denominator: int ) -> float:
+    return round(numerator / denominator, DIGITS) if denominator else 0.0
@@ -0,0 +1,93 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 23:00
+
+    src/helper/breaks.py
+
+    break positions of a word as int bitmask - bit i: "·" after letter i ("Ab·tei" -> 0b10)
+     - the engines (hyphenate_masks) return masks instead of formatted strings
+     - comparing two engines: int comparison, formatted only for the output (format_result)
+     - a python int has no length limit -> words of any length
+     - str: the result is not the word + breaks (non-standard hyphenation, changed letters e.g. PyHyphen patch + "ß")
+
+    example:
+     - format_result( "Abteilung", 0b1010 ) -> "Ab·tei·lung"
+     - format_result( "Baden-Württemberg", mask_from_result( "Baden-Württemberg", "Ba·den-Würt·tem·berg" ) ) -> same
+
+    PUBLIC:
+     - Breaks = int | str
+     - mask_from_positions( positions: Iterable[int], offset: int = 0 ) -> int
+     - mask_from_parts( parts: List[str], offset: int = 0 ) -> int
+     - mask_from_result( word: str, result: str ) -> Breaks
+     - format_result( word: str, breaks: Breaks ) -> str
+     - format_results( words: Iterable[str], breaks: Iterable[Breaks] ) -> Iterator[Tuple[str, str]]
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+Breaks = int | str
+
+DOT = "·"
+
+def mask_from_positions( positions: Iterable[int], offset: int = 0 ) -> int:
+    """
+    ### positions (break before letter p, e.g. Pyphen/Liang positions) -> mask
+
+     - offset: index of the first letter of the part in the word (e.g. "Baden-Württemberg")
+    """
+
+    mask = 0
+    for position in positions:
+        mask |= 1 << (offset + position - 1)
+    return mask
+
+def mask_from_parts( parts: List[str], offset: int = 0 ) -> int:
+    """
+    ### syllables (e.g. PyHyphen) -> mask, a break after each part except the last
+    """
+
+    mask = 0
+    position = offset - 1
+    for part in parts[:-1]:
+        position += len(part)
+        mask |= 1 << position
+    return mask
+
+def mask_from_result( word: str, result: str ) -> Breaks:
+    if DOT not in result:
+        return 0 if result == word else result
+
+    parts = result.split(DOT)
+    if "" in parts or "".join(parts) != word:
+        return result
+
+    return mask_from_parts(parts)
+
+def format_result( word: str, breaks: Breaks ) -> str:
+    if isinstance(breaks, str):
+        return breaks
+
+    if not breaks:
+        return word
+
+    parts: List[str] = []
+    start = 0
+    while breaks:
+        end = (breaks & -breaks).bit_length() # lowest bit + 1
+        parts.append(word[start:end])
+        start = end
+        breaks &= breaks - 1
+
+    parts.append(word[start:])
+    return DOT.join(parts)
+
+def format_results( words: Iterable[str], breaks: Iterable[Breaks] ) -> Iterator[Tuple[str, str]]:
+    """
+    ### (word, formatted result) - lazy, e.g. for write_json_stream
+    """
+
+    for word, word_breaks in zip(words, breaks, strict=True):
+        yield word, format_result(word, word_breaks)
@@ -0,0 +1,256 @@
+"""
+    © Jürgen Schoenemeyer, 19.10.2026 14:10
+
+    src/helper/bulk.py
+
+    Liang hyphenation of a whole word list at once - vectorized (NumPy), one level (Liang, Pyphen)
+
+     - the word list is encoded once (UTF-32) into automaton codes, the parts of "Baden-Württemberg"
+       are sorted by length -> the words of a column ('.word.') are always a prefix of the sorted parts
+     - the aho-corasick automaton (helper/hyb.py) runs column by column over all parts:
+       all states of a column in one step, the failure links only for the parts without a transition
+     - the outputs are expanded once into a dense table (one row per output) -> element-wise max
+       into the priority matrix, one slice per column
+     - odd priorities within left/right -> break masks (helper/breaks.py) as uint64
+
+    words, which are not in the bulk (-> Patterns.positions per word):
+     - more than MAX_LETTERS letters
+     - a different length in lowercase (e.g. "İ" -> "i̇")
+
+    PUBLIC:
+     - bulk_masks( automaton: Automaton, words: List[str], left: int = 2, right: int = 2 ) -> List[int | None]
+     - scan_bulk( automaton: Automaton, texts: List[str] ) -> NDArray[np.uint8]
+
+    PRIVATE:
+     - automaton_arrays( automaton: Automaton ) -> Arrays
+     - chunk_masks( automaton: Automaton, words: List[str], left: int, right: int ) -> List[int | None]
+     - scan_codes( arrays: Arrays, codes: NDArray[np.int32], starts: NDArray[np.int64], lengths: NDArray[np.int64] ) -> NDArray[np.uint8]
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, NamedTuple, Tuple
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    pass
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from helper.hyb import Automaton
+
+MAX_LETTERS = 64
+CHUNK_SIZE = 65536 # words per priority matrix (uint8: CHUNK_SIZE * longest part)
+
+NEWLINE = ord("\n")
+HYPHEN  = ord("-")
+
+class Arrays(NamedTuple):
+    table:   NDArray[np.int32] # code point -> code
+    base:    NDArray[np.int32]
+    check:   NDArray[np.int32]
+    fail:    NDArray[np.int32]
+    rows:    NDArray[np.int32] # state -> row in outputs (0: no output)
+    outputs: NDArray[np.uint8] # priorities at end - shift .. end - shift + width - 1
+    shift:   int
+
+compiled: Tuple[Automaton, Arrays] | None = None # automaton (memoryviews of the .hyb) -> numpy arrays
+
+def bulk_masks( automaton: Automaton, words: List[str], left: int = 2, right: int = 2 ) -> List[int | None]:
+    """
+    ### break masks of all words (one level, like Patterns.positions with compound = False)
+
+    #### Arguments
+     - automaton: Patterns.automata[0] (all patterns)
+     - words: e.g. get_samples( "wortliste", language="de_DE" )
+     - left, right: Patterns.left, Patterns.right
+
+    #### Return
+     - mask of each word, None: not in the bulk (see above)
+    """
+
+    result: List[int | None] = []
+    for first in range(0, len(words), CHUNK_SIZE):
+        result.extend(chunk_masks(automaton, words[first : first + CHUNK_SIZE], left, right))
+
+    return result
+
+def scan_bulk( automaton: Automaton, texts: List[str] ) -> NDArray[np.uint8]:
+    """
+    ### scan( automaton, text ) for many texts at once (e.g. for tests against scan)
+
+    #### Arguments
+     - automaton: e.g. Patterns.automata[0]
+     - texts: e.g. ["abteilung", ...] (without the dots)
+
+    #### Return
+     - priority matrix: [i, n] -> scan( automaton, f".{texts[n]}." )[i] (0 after the end of the text)
+    """
+
+    arrays = automaton_arrays(automaton)
+
+    points = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+    codes = arrays.table[np.where(points < len(arrays.table), points, 0)]
+
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    starts = np.cumsum(lengths) - lengths
+    order = np.argsort(-lengths, kind="stable")
+
+    priorities = np.empty((int(lengths.max(initial=0)) + 3, len(texts)), dtype=np.uint8)
+    priorities[:, order] = scan_codes(arrays, codes, starts[order], lengths[order])
+    return priorities
+
+# PRIVATE
+
+def automaton_arrays( automaton: Automaton ) -> Arrays:
+    global compiled
+
+    if compiled is not None and compiled[0] is automaton:
+        return compiled[1]
+
+    values = np.asarray(automaton.values, dtype=np.int64)
+    out = np.asarray(automaton.out, dtype=np.int64)
+
+    # entry at index: rel, count, priorities[count] -> one row per entry in outputs
+
+    used = np.zeros(len(values) + 1, dtype=bool)
+    used[out] = True
+    used[0] = False
+    indices = np.flatnonzero(used)
+    rels, counts = values[indices], values[indices + 1]
+
+    shift = -int(rels.min(initial=0))
+    width = int((shift + rels + counts).max(initial=1))
+
+    entry = np.repeat(np.arange(len(indices)), counts)                      # entry of each priority
+    position = np.arange(len(entry)) - np.repeat(np.cumsum(counts) - counts, counts) # position within its entry
+
+    outputs = np.zeros((len(indices) + 1, width), dtype=np.uint8)
+    outputs[entry + 1, shift + rels[entry] + position] = values[indices[entry] + 2 + position]
+
+    row_of = np.zeros(len(values) + 1, dtype=np.int32) # index in values -> row (0: no output)
+    row_of[indices] = np.arange(1, len(indices) + 1, dtype=np.int32)
+
+    table = np.zeros(max(map(ord, automaton.codes), default=0) + 1, dtype=np.int32)
+    for char, code in automaton.codes.items():
+        table[ord(char)] = code
+
+    # base[state] + code may be behind the last slot -> check -1
+
+    padding = np.full(len(automaton.codes) + 1, -1, dtype=np.int32)
+
+    compiled = (automaton, Arrays(
+        table   = table,
+        base    = np.asarray(automaton.base, dtype=np.int32),
+        check   = np.concatenate([np.asarray(automaton.check, dtype=np.int32), padding]),
+        fail    = np.asarray(automaton.fail, dtype=np.int32),
+        rows    = row_of[out],
+        outputs = outputs,
+        shift   = shift,
+    ))
+    return compiled[1]
+
+def chunk_masks( automaton: Automaton, words: List[str], left: int, right: int ) -> List[int | None]:
+    if not words:
+        return []
+
+    arrays = automaton_arrays(automaton)
+
+    joined = "\n".join(words)
+    lowered = joined.lower()
+    changed = len(lowered) != len(joined)
+    if changed:
+        lowered = "\n".join([lower if len(lower) == len(word) else word for word, lower in ((word, word.lower()) for word in words)])
+
+    points = np.frombuffer(lowered.encode("utf-32-le"), dtype=np.uint32)
+    codes = arrays.table[np.where(points < len(arrays.table), points, 0)]
+
+    # parts: separated by "\n" (word) or "-" (part)
+
+    boundaries = np.flatnonzero((points == NEWLINE) | (points == HYPHEN))
+    starts = np.concatenate([[0], boundaries + 1])
+    lengths = np.concatenate([boundaries, [len(points)]]) - starts
+
+    first_parts = np.flatnonzero(np.concatenate([[True], points[boundaries] == NEWLINE]))
+    word_lengths = np.diff(np.append(starts[first_parts], len(points) + 1)) - 1
+    offsets = starts - np.repeat(starts[first_parts], np.diff(np.append(first_parts, len(starts))))
+
+    valid = word_lengths <= MAX_LETTERS
+    if changed:
+        valid &= np.fromiter((len(word.lower()) == len(word) for word in words), dtype=bool, count=len(words))
+
+    order = np.argsort(-lengths, kind="stable")
+    priorities = scan_codes(arrays, codes, starts[order], lengths[order])
+
+    # priorities[i]: break before letter i - 1 -> bit i - 2, left <= i - 1 <= length - right
+
+    sorted_lengths = lengths[order]
+    sorted_masks = np.zeros(len(order), dtype=np.uint64)
+    for i in range(left + 1, min(len(priorities), MAX_LETTERS + 2)):
+        odd = (priorities[i] & 1).astype(bool) & (i - 1 <= sorted_lengths - right)
+        sorted_masks[odd] |= np.uint64(1 << (i - 2))
+
+    part_masks = np.empty_like(sorted_masks)
+    part_masks[order] = sorted_masks
+
+    shifts = np.where(offsets < MAX_LETTERS, offsets, 0).astype(np.uint64)
+    masks: List[int | None] = np.bitwise_or.reduceat(part_masks << shifts, first_parts).tolist()
+
+    for index in np.flatnonzero(~valid).tolist():
+        masks[index] = None
+
+    return masks
+
+# parts sorted by length (longest first), text of part n: '.' + codes[starts[n] : starts[n] + lengths[n]] + '.'
+
+def scan_codes( arrays: Arrays, codes: NDArray[np.int32], starts: NDArray[np.int64], lengths: NDArray[np.int64] ) -> NDArray[np.uint8]:
+    dot = arrays.table[ord(".")] if ord(".") < len(arrays.table) else 0
+    base, check, fail, rows, outputs, shift = arrays.base, arrays.check, arrays.fail, arrays.rows, arrays.outputs, arrays.shift
+
+    if len(codes) == 0: # only empty parts
+        codes = np.zeros(1, dtype=np.int32)
+
+    count = len(lengths)
+    columns = int(lengths.max(initial=0)) + 2
+    width = outputs.shape[1]
+
+    active_rows = np.searchsorted(-lengths, -np.arange(columns) + 2, side="left") # parts with length + 2 > column
+    last = np.maximum(starts + lengths - 1, 0)
+
+    priorities = np.zeros((columns + width, count), dtype=np.uint8)
+    states = np.zeros(count, dtype=np.int32)
+
+    for end in range(columns):
+        active = int(active_rows[end])
+        state = states[:active]
+
+        if end == 0:
+            code = np.full(active, dot, dtype=np.int32)
+        else:
+            code = codes[np.minimum(starts[:active] + end - 1, last[:active])]
+            code[lengths[:active] == end - 1] = dot
+
+        next_state = base[state] + code
+        found = check[next_state] == state
+        new_state = np.where(found, next_state, 0).astype(np.int32)
+
+        pending = np.flatnonzero(~found & (state != 0))
+        while pending.size:
+            fail_state = fail[state[pending]]
+            state[pending] = fail_state
+
+            next_state = base[fail_state] + code[pending]
+            found = check[next_state] == fail_state
+            new_state[pending[found]] = next_state[found]
+            pending = pending[~found & (fail_state != 0)]
+
+        states[:active] = new_state
+
+        output = rows[new_state]
+        if output.any():
+            start = end - shift
+            window = priorities[max(start, 0) : start + width, :active]
+            np.maximum(window, outputs[output][:, max(-start, 0) :].T, out=window)
+
+    return priorities[:columns + 1]
@@ -0,0 +1,275 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 16:10
+
+    src/helper/cache.py
+
+    persistent hyphenation cache (SQLite) - results/hyphenation.sqlite
+
+    key: engine, engine version, content hash of the .dic (blake2b), patch -> word -> result
+     - a changed .dic or engine version gives a new key, the outdated keys of the same engine/.dic are deleted
+     - nothing is loaded in advance: the results are queried for the words of a call, chunk by chunk
+       (CHUNK_SIZE words, QUERY_SIZE words per query) -> the memory does not grow with the size of the cache
+     - new results are stored in one transaction per chunk
+     - single words (get_pyphen, get_pyhyphen, get_liang): store_later collects them, written every
+       STORE_BATCH words in one transaction, the rest with flush_store() (atexit)
+     - WAL mode: several worker processes can read and write at the same time
+
+    usage:
+     - use_cache(True) before init_pyphen/init_pyhyphen/init_liang (hyphenate_parallel: the workers get the same setting)
+
+    PUBLIC:
+     - use_cache( enable: bool ) -> None
+     - cache_enabled() -> bool
+     - open_cache( engine: str, version: str, dictionary: Path, patch: bool = False ) -> int | None
+     - lookup( key: int, word: str ) -> str | None
+     - store( key: int, results: Dict[str, str] ) -> None
+     - store_later( key: int, word: str, result: str ) -> None
+     - flush_store() -> None
+     - hyphenate_cached( keys: Sequence[int], words: Iterable[str], hyphenate: Callable ) -> List[List[str]]
+
+    PRIVATE:
+     - fetch( key: int, words: List[str] ) -> Dict[str, str]
+     - clear_pending() -> None
+     - connect() -> sqlite3.Connection
+     - create_key( engine: str, version: str, dictionary: Path, patch: bool ) -> int
+     - file_digest( filepath: Path ) -> str
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import sqlite3
+
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+from utils.globals import BASE_PATH
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+CACHE_FILE = BASE_PATH / "results" / "hyphenation.sqlite"
+
+CHUNK_SIZE = 65536 # words per hyphenate call (helper/bulk.py: one priority matrix)
+QUERY_SIZE = 500   # words per SELECT ... IN (SQLITE_MAX_VARIABLE_NUMBER: 999 before 3.32)
+STORE_BATCH = 1000 # store_later: words per transaction
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS keys (
+        id         INTEGER PRIMARY KEY,
+        engine     TEXT    NOT NULL,
+        version    TEXT    NOT NULL,
+        source     TEXT    NOT NULL,
+        digest     TEXT    NOT NULL,
+        patch      INTEGER NOT NULL,
+        UNIQUE (engine, version, digest, patch)
+    );
+    CREATE TABLE IF NOT EXISTS results (
+        key        INTEGER NOT NULL,
+        word       TEXT    NOT NULL,
+        result     TEXT    NOT NULL,
+        PRIMARY KEY (key, word)
+    ) WITHOUT ROWID;
+"""
+
+enabled: bool = False
+connection: sqlite3.Connection | None = None
+connection_pid: int = 0 # a connection must not be used in a forked worker
+
+digests: Dict[Tuple[str, int, int], str] = {}
+
+pending: Dict[int, Dict[str, str]] = {} # store_later -> key -> word -> result
+pending_count: int = 0
+
+def use_cache( enable: bool ) -> None:
+    global enabled
+    enabled = enable
+
+def cache_enabled() -> bool:
+    return enabled
+
+def open_cache( engine: str, version: str, dictionary: Path, patch: bool = False ) -> int | None:
+    """
+    ### open the cache for one engine/dictionary
+
+    #### Arguments
+     - engine: e.g. "PyHyphen"
+     - version: engine version, e.g. "4.0.4"
+     - dictionary: Path of the .dic file
+     - patch: PyHyphen patch mode
+
+    #### Return
+     - key for lookup/store, None: cache disabled or not available
+    """
+
+    if not enabled:
+        return None
+
+    try:
+        key = create_key(engine, version, dictionary, patch)
+        count = connect().execute("SELECT COUNT(*) FROM results WHERE key = ?", (key,)).fetchone()[0]
+    except (sqlite3.Error, OSError) as e:
+        Trace.error(f"cache '{CACHE_FILE}': {e}")
+        return None
+
+    Trace.update(f"cache {engine}{" (patch)" if patch else ""}: {count} results")
+    return key
+
+def lookup( key: int, word: str ) -> str | None:
+    if key in pending and word in pending[key]:
+        return pending[key][word]
+
+    try:
+        row = connect().execute("SELECT result FROM results WHERE key = ? AND word = ?", (key, word)).fetchone()
+    except sqlite3.Error as e:
+        Trace.error(f"cache '{CACHE_FILE}': {e}")
+        return None
+
+    return None if row is None else str(row[0])
+
+def store( key: int, results: Dict[str, str] ) -> None:
+    if not results:
+        return
+
+    try:
+        with connect() as db:
+            db.executemany("INSERT OR REPLACE INTO results (key, word, result) VALUES (?, ?, ?)", [(key, word, result) for word, result in results.items()])
+    except sqlite3.Error as e:
+        Trace.error(f"cache '{CACHE_FILE}': {e}")
+
+def store_later( key: int, word: str, result: str ) -> None:
+    global pending_count
+
+    pending.setdefault(key, {})[word] = result
+    pending_count += 1
+    if pending_count >= STORE_BATCH:
+        flush_store()
+
+def flush_store() -> None:
+    global pending_count
+
+    if not pending:
+        return
+
+    rows = [(key, word, result) for key, results in pending.items() for word, result in results.items()]
+    pending.clear()
+    pending_count = 0
+
+    try:
+        with connect() as db:
+            db.executemany("INSERT OR REPLACE INTO results (key, word, result) VALUES (?, ?, ?)", rows)
+    except sqlite3.Error as e:
+        Trace.error(f"cache '{CACHE_FILE}': {e}")
+
+def hyphenate_cached( keys: Sequence[int], words: Iterable[str], hyphenate: Callable[[List[str]], Sequence[List[str]]] ) -> List[List[str]]:
+    """
+    ### results from the cache, only the missing words are hyphenated (and stored)
+
+    #### Arguments
+     - keys: one key per result list of hyphenate
+     - words: word list
+     - hyphenate: words -> result lists (e.g. without and with patch)
+
+    #### Return
+     - one result list per key (same order as words)
+    """
+
+    flush_store()
+
+    result: List[List[str]] = [[] for _ in keys]
+
+    iterator = iter(words)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        unique = list(dict.fromkeys(chunk))
+        tables = [fetch(key, unique) for key in keys]
+
+        missing = [word for word in unique if any(word not in table for table in tables)]
+        if missing:
+            for key, table, results in zip(keys, tables, hyphenate(missing), strict=True):
+                new = dict(zip(missing, results, strict=True))
+                store(key, new)
+                table.update(new)
+
+        for table, results in zip(tables, result, strict=True):
+            results.extend([table[word] for word in chunk])
+
+    return result
+
+# PRIVATE
+
+def fetch( key: int, words: List[str] ) -> Dict[str, str]:
+    found: Dict[str, str] = {}
+
+    try:
+        db = connect()
+        for first in range(0, len(words), QUERY_SIZE):
+            part = words[first : first + QUERY_SIZE]
+            rows = db.execute(f"SELECT word, result FROM results WHERE key = ? AND word IN ({",".join("?" * len(part))})", (key, *part))  # noqa: S608
+            found.update(rows.fetchall())
+    except sqlite3.Error as e:
+        Trace.error(f"cache '{CACHE_FILE}': {e}")
+
+    return found
+
+def connect() -> sqlite3.Connection:
+    global connection, connection_pid
+
+    if connection is None or connection_pid != os.getpid():
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(CACHE_FILE, timeout=60)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(SCHEMA)
+        connection_pid = os.getpid()
+
+    return connection
+
+def create_key( engine: str, version: str, dictionary: Path, patch: bool ) -> int:
+    digest = file_digest(dictionary)
+
+    with connect() as db:
+        outdated = [
+            row[0] for row in db.execute(
+                "SELECT id FROM keys WHERE engine = ? AND source = ? AND patch = ? AND (version != ? OR digest != ?)",
+                (engine, dictionary.name, patch, version, digest),
+            )
+        ]
+        for key in outdated:
+            db.execute("DELETE FROM results WHERE key = ?", (key,))
+            db.execute("DELETE FROM keys WHERE id = ?", (key,))
+            Trace.update(f"cache {engine}: outdated results of '{dictionary.name}' deleted")
+
+        db.execute(
+            "INSERT OR IGNORE INTO keys (engine, version, source, digest, patch) VALUES (?, ?, ?, ?, ?)",
+            (engine, version, dictionary.name, digest, patch),
+        )
+        row = db.execute(
+            "SELECT id FROM keys WHERE engine = ? AND version = ? AND digest = ? AND patch = ?",
+            (engine, version, digest, patch),
+        ).fetchone()
+
+    return int(row[0])
+
+def file_digest( filepath: Path ) -> str:
+    stat = filepath.stat()
+    index = (str(filepath), stat.st_mtime_ns, stat.st_size)
+
+    if index not in digests:
+        with filepath.open(mode="rb") as file:
+            digests[index] = hashlib.file_digest(file, "blake2b").hexdigest()
+
+    return digests[index]
+
+def clear_pending() -> None: # forked worker: the pending results are written by the parent
+    global pending_count
+
+    pending.clear()
+    pending_count = 0
+
+atexit.register(flush_store)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=clear_pending)
@@ -0,0 +1,351 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 22:10
+
+    src/helper/columns.py
+
+    columnar results (.hyc) - the words of a sample set once + one column per engine
+     - column: uint64 hyphenation mask per word, bit i: "·" after letter i ("Ab·tei" -> 0b10)
+     - exceptions: index -> result, if the result is not the word + "·" (changed letters, > 64 letters, "··")
+     - compare two engines: one vectorized mask comparison (NumPy) + the exceptions
+
+    NumPy (optional): masks are built and compared vectorized, else in pure Python (same results)
+
+    layout (little-endian), body zlib compressed:
+     - header: magic "HYC1", version, words, engines, compressed size, body size
+     - body:   offsets uint32 (words + 1), UTF-8 words (each + "\\n"),
+               per engine: name (uint16 length + UTF-8), masks uint64 (words), exceptions (uint32 length + JSON)
+
+    PUBLIC:
+     - encode_masks( words: Sequence[str], results: Sequence[str] ) -> Tuple[array, Dict[int, str]]
+     - encode_breaks( words: Sequence[str], breaks: Sequence[Breaks] ) -> Tuple[array, Dict[int, str]]
+     - write_columns( filepath: Path, columns: Columns ) -> Result[str, str]
+     - read_columns( filepath: Path ) -> Result[Columns, str]
+
+    class Columns:
+     - Columns( words: List[str], masks: Dict[str, array], exceptions: Dict[str, Dict[int, str]] )
+     - Columns.from_results( words: List[str], results: Dict[str, List[str]] ) -> Columns
+     - Columns.from_breaks( words: List[str], breaks: Dict[str, List[Breaks]] ) -> Columns  # hyphenate_masks
+     - Columns.result( engine: str, index: int ) -> str
+     - Columns.results( engine: str ) -> List[str]
+     - Columns.differences( engine_a: str, engine_b: str ) -> List[int]
+     - Columns.diff( engine_a: str, engine_b: str ) -> Dict[str, List[str]]  # same as the DIFF report
+
+    PRIVATE:
+     - encode_masks_numpy( words: Sequence[str], results: Sequence[str] ) -> Tuple[array, Dict[int, str]]
+     - encode_masks_python( words: Sequence[str], results: Sequence[str] ) -> Tuple[array, Dict[int, str]]
+"""
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import zlib
+
+from array import array
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+import orjson
+
+from result import Err, Ok, Result
+
+from helper.breaks import DOT, format_result, mask_from_result
+from utils.files import DIGEST_NAME, digest_unchanged, new_hasher, store_digest
+from utils.trace import Trace
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    pass
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from helper.breaks import Breaks
+
+MAGIC   = b"HYC1"
+VERSION = 1
+
+ZLIB_LEVEL = 6
+
+# magic, version, words, engines, compressed size, body size
+HEADER = struct.Struct("<4sIIIQQ")
+
+class Columns:
+    """
+    ### words + hyphenation masks per engine
+    """
+
+    def __init__(self, words: List[str], masks: Dict[str, array[int]], exceptions: Dict[str, Dict[int, str]]) -> None:
+        self.words      = words
+        self.masks      = masks
+        self.exceptions = exceptions
+
+    @classmethod
+    def from_results(cls, words: List[str], results: Dict[str, List[str]]) -> Columns:
+        masks: Dict[str, array[int]] = {}
+        exceptions: Dict[str, Dict[int, str]] = {}
+        for engine, engine_results in results.items():
+            masks[engine], exceptions[engine] = encode_masks(words, engine_results)
+        return cls(words, masks, exceptions)
+
+    @classmethod
+    def from_breaks(cls, words: List[str], breaks: Dict[str, List[Breaks]]) -> Columns:
+        masks: Dict[str, array[int]] = {}
+        exceptions: Dict[str, Dict[int, str]] = {}
+        for engine, engine_breaks in breaks.items():
+            masks[engine], exceptions[engine] = encode_breaks(words, engine_breaks)
+        return cls(words, masks, exceptions)
+
+    def result(self, engine: str, index: int) -> str:
+        exception = self.exceptions[engine].get(index)
+        if exception is not None:
+            return exception
+        return format_result(self.words[index], self.masks[engine][index])
+
+    def results(self, engine: str) -> List[str]:
+        return [self.result(engine, i) for i in range(len(self.words))]
+
+    def differences(self, engine_a: str, engine_b: str) -> List[int]:
+        masks_a, masks_b = self.masks[engine_a], self.masks[engine_b]
+        exceptions = self.exceptions[engine_a].keys() | self.exceptions[engine_b].keys()
+
+        if "numpy" in sys.modules:
+            different = np.flatnonzero(np.frombuffer(masks_a, dtype="<u8") != np.frombuffer(masks_b, dtype="<u8")).tolist()
+        else:
+            different = [i for i, (mask_a, mask_b) in enumerate(zip(masks_a, masks_b, strict=True)) if mask_a != mask_b]
+
+        indices = {i for i in different if i not in exceptions}
+        indices.update(i for i in exceptions if self.result(engine_a, i) != self.result(engine_b, i))
+        return sorted(indices)
+
+    def diff(self, engine_a: str, engine_b: str) -> Dict[str, List[str]]:
+        return {self.words[i]: [self.result(engine_a, i), self.result(engine_b, i)] for i in self.differences(engine_a, engine_b)}
+
+def encode_masks( words: Sequence[str], results: Sequence[str] ) -> Tuple[array[int], Dict[int, str]]:
+    """
+    ### hyphenation masks of one engine
+
+    #### Arguments
+     - words: word list
+     - results: e.g. hyphenate_many( words ) - same order
+
+    #### Return
+     - masks: array "Q" (one per word), exceptions: {index: result} (mask 0)
+    """
+
+    if "numpy" in sys.modules and words:
+        return encode_masks_numpy(words, results)
+    return encode_masks_python(words, results)
+
+def encode_breaks( words: Sequence[str], breaks: Sequence[Breaks] ) -> Tuple[array[int], Dict[int, str]]:
+    """
+    ### masks of one engine from hyphenate_masks (no parsing)
+
+    #### Return
+     - masks: array "Q" (one per word), exceptions: {index: result} (str or > 64 letters, mask 0)
+    """
+
+    try:
+        return array("Q", breaks), {} # type: ignore[arg-type]
+    except (TypeError, OverflowError):
+        pass
+
+    masks = array("Q", bytes(8 * len(breaks)))
+    exceptions: Dict[int, str] = {}
+    for i, (word, word_breaks) in enumerate(zip(words, breaks, strict=True)):
+        if isinstance(word_breaks, int) and word_breaks < 1 << 64:
+            masks[i] = word_breaks
+        else:
+            exceptions[i] = format_result(word, word_breaks)
+
+    return masks, exceptions
+
+def write_columns( filepath: Path, columns: Columns ) -> Result[str, str]:
+    """
+    ### write all engines of a sample set (atomic: temp file + rename, unchanged content: "not modified")
+
+    #### Arguments
+     - filepath: Path of the .hyc file
+     - columns: e.g. Columns.from_breaks( words, hyphenate_parallel( engines, language, words, masks=True ) )
+
+    #### Return [rustedpy]
+     - Ok: -
+     - Err: errortext as str
+    """
+
+    if sys.byteorder != "little":
+        return Err("'.hyc' needs a little-endian system")
+
+    words = columns.words
+    encoded = [word.encode("utf-8") + b"\n" for word in words]
+    offsets = array("I", [0])
+    position = 0
+    for word in encoded:
+        position += len(word)
+        offsets.append(position)
+
+    body = [offsets.tobytes(), b"".join(encoded)]
+    for engine in columns.masks:
+        name = engine.encode("utf-8")
+        exceptions = orjson.dumps({str(i): result for i, result in columns.exceptions[engine].items()})
+        body += [struct.pack("<H", len(name)), name, columns.masks[engine].tobytes(), struct.pack("<I", len(exceptions)), exceptions]
+
+    raw = b"".join(body)
+
+    # change detection as write_file (utils/files.py): digest of the uncompressed content in .digests.json
+
+    hasher = new_hasher()
+    hasher.update(f"{VERSION}\0{len(words)}\0{len(columns.masks)}\0".encode())
+    hasher.update(raw)
+    digest = f"{DIGEST_NAME}:{hasher.hexdigest()}"
+
+    existed = filepath.exists()
+    if existed and digest_unchanged(filepath, digest):
+        Trace.info(f"'{filepath}' not modified")
+        return Ok("")
+
+    compressed = zlib.compress(raw, ZLIB_LEVEL)
+    data = HEADER.pack(MAGIC, VERSION, len(words), len(columns.masks), len(compressed), len(raw)) + compressed
+
+    try:
+        if existed and filepath.stat().st_size == len(data) and filepath.read_bytes() == data: # no digest yet
+            store_digest(filepath, digest)
+            Trace.info(f"'{filepath}' not modified")
+            return Ok("")
+    except OSError as e:
+        Trace.debug(f"{e}")
+
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    try:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        tmp_path.replace(filepath)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        Trace.debug(f"{e}")
+        return Err(f"{e}")
+
+    store_digest(filepath, digest)
+
+    Trace.update(f"'{filepath}' {len(words)} words, {len(columns.masks)} engines, {len(data)} bytes")
+    return Ok("")
+
+def read_columns( filepath: Path ) -> Result[Columns, str]:
+    """
+    ### read a .hyc file
+
+    #### Arguments
+     - filepath: Path of the .hyc file
+
+    #### Return [rustedpy]
+     - Ok: Columns
+     - Err: errortext as str
+    """
+
+    if sys.byteorder != "little":
+        return Err("'.hyc' needs a little-endian system")
+
+    try:
+        data = filepath.read_bytes()
+    except OSError as e:
+        return Err(f"{e}")
+
+    if len(data) < HEADER.size:
+        return Err(f"'{filepath}' is truncated")
+
+    magic, version, count, engines, compressed_size, raw_size = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        return Err(f"'{filepath}' is not a .hyc file")
+    if version != VERSION:
+        return Err(f"'{filepath}' version {version} (expected {VERSION})")
+    if HEADER.size + compressed_size != len(data):
+        return Err(f"'{filepath}' has a wrong size")
+
+    try:
+        raw = zlib.decompress(data[HEADER.size:])
+    except zlib.error as e:
+        return Err(f"'{filepath}': {e}")
+
+    if len(raw) != raw_size:
+        return Err(f"'{filepath}' has a wrong body size")
+
+    offsets = array("I")
+    offsets.frombytes(raw[: 4 * (count + 1)])
+    position = 4 * (count + 1)
+    blob_size = offsets[count]
+    words = raw[position : position + blob_size].decode("utf-8").split("\n")[:-1] if count else []
+    position += blob_size
+
+    masks: Dict[str, array[int]] = {}
+    exceptions: Dict[str, Dict[int, str]] = {}
+    for _ in range(engines):
+        (size,) = struct.unpack_from("<H", raw, position)
+        engine = raw[position + 2 : position + 2 + size].decode("utf-8")
+        position += 2 + size
+
+        masks[engine] = array("Q")
+        masks[engine].frombytes(raw[position : position + 8 * count])
+        position += 8 * count
+
+        (size,) = struct.unpack_from("<I", raw, position)
+        exceptions[engine] = {int(i): result for i, result in orjson.loads(raw[position + 4 : position + 4 + size]).items()}
+        position += 4 + size
+
+    return Ok(Columns(words, masks, exceptions))
+
+# PRIVATE
+
+def encode_masks_numpy( words: Sequence[str], results: Sequence[str] ) -> Tuple[array[int], Dict[int, str]]:
+    count = len(words)
+    joined = "\n".join(results)
+
+    # letters: one C-level compare per word (results without "·")
+
+    stripped = joined.replace(DOT, "").split("\n")
+    if len(stripped) != count: # "\n" in a result
+        return encode_masks_python(words, results)
+
+    bad = np.zeros(count, dtype=bool)
+    if stripped != list(words):
+        bad[[i for i, (letters, word) in enumerate(zip(stripped, words, strict=True)) if letters != word]] = True
+
+    # "·" -> bit (letters before the dot - 1), only the dots are processed
+
+    chars = np.frombuffer(joined.encode("utf-32-le"), dtype="<u4")
+    dots = np.flatnonzero(chars == ord(DOT))
+    line_starts = np.concatenate(([0], np.flatnonzero(chars == ord("\n")) + 1))
+
+    dot_index = np.searchsorted(line_starts, dots, side="right") - 1 # word of each dot (ascending)
+    starts = line_starts[dot_index]
+    rank = np.arange(len(dots)) - np.searchsorted(dots, starts)       # dots before in the same word
+    bits = dots - starts - rank - 1
+
+    word_lengths = np.fromiter(map(len, words), dtype=np.int64, count=count)
+    bad_bits = (bits < 0) | (bits >= np.minimum(word_lengths[dot_index] - 1, 64)) # leading, trailing, > 64 letters
+    bad_bits[1:] |= (dot_index[1:] == dot_index[:-1]) & (bits[1:] == bits[:-1])   # "··"
+    bad[dot_index[bad_bits]] = True
+
+    good = ~bad[dot_index]
+    dot_index, bits = dot_index[good], bits[good]
+
+    masks = np.zeros(count, dtype="<u8")
+    if len(dot_index):
+        groups = np.concatenate(([0], np.flatnonzero(np.diff(dot_index)) + 1))
+        values = np.left_shift(np.uint64(1), bits.astype(np.uint64))
+        masks[dot_index[groups]] = np.bitwise_or.reduceat(values, groups)
+
+    exceptions = {i: results[i] for i in np.flatnonzero(bad).tolist()}
+    return array("Q", masks.tobytes()), exceptions
+
+def encode_masks_python( words: Sequence[str], results: Sequence[str] ) -> Tuple[array[int], Dict[int, str]]:
+    masks = array("Q", bytes(8 * len(words)))
+    exceptions: Dict[int, str] = {}
+
+    for i, (word, result) in enumerate(zip(words, results, strict=True)):
+        mask = mask_from_result(word, result)
+        if isinstance(mask, int) and mask < 1 << 64:
+            masks[i] = mask
+        else:
+            exceptions[i] = result
+
+    return masks, exceptions
@@ -0,0 +1,231 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 14:40
+
+    src/helper/hyb.py
+
+    compiled hyphenation patterns (.hyb) - built once from dict/hyph_*.dic, loaded with mmap
+
+    layout (little-endian, int32 arrays, 4-byte aligned):
+     - header:    magic "HYB1", version, crc32 of the body, size + mtime_ns of the source .dic,
+                  LEFTHYPHENMIN, RIGHTHYPHENMIN, COMPOUNDLEFTHYPHENMIN, COMPOUNDRIGHTHYPHENMIN,
+                  byte length of NOHYPHEN, number of automata
+     - nohyphen:  UTF-8 strings separated by NUL
+     - automaton: byte length of the alphabet, number of slots, number of values
+                  alphabet: UTF-8 string, char i has code i + 1
+                  arrays:   base, check, fail, out (slots each), values
+
+    the arrays are used directly as memoryviews of the mapped file (no parsing),
+    all processes using the same .hyb share the same physical pages
+
+    the source is checked with size/mtime (as the digests of utils/files.py),
+    the crc32 of the body is verified on each load (about 5-8 ms for 14 MB) and after writing
+
+    PUBLIC:
+     - Automaton( codes, base, check, fail, out, values ) - NamedTuple
+     - PatternSet( automata, hyphenmin, nohyphen ) - NamedTuple
+     - read_hyb( filepath: Path, source: Path, verify: bool = True ) -> Result[PatternSet, str]
+     - write_hyb( filepath: Path, pattern_set: PatternSet, source: Path ) -> Result[str, str]
+
+    PRIVATE:
+     - parse_hyb( filepath: Path, data: mmap.mmap, source: Path, verify: bool ) -> Result[PatternSet, str]
+     - source_stat( source: Path ) -> Tuple[int, int]
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+from array import array
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Sequence, Tuple
+
+from result import Err, Ok, Result, is_err
+
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MAGIC   = b"HYB1"
+VERSION = 3
+
+# magic, version, crc32(body), source size, source mtime_ns, hyphenmin (4), nohyphen bytes, automata
+HEADER = struct.Struct("<4sIIQq4III")
+
+# alphabet bytes, slots, values
+SECTION = struct.Struct("<III")
+
+class Automaton(NamedTuple):
+    codes:  Dict[str, int]
+    base:   Sequence[int]
+    check:  Sequence[int]
+    fail:   Sequence[int]
+    out:    Sequence[int]
+    values: Sequence[int]
+
+class PatternSet(NamedTuple):
+    automata:  Tuple[Automaton, ...]    # all patterns (Pyphen), compound level, word level (hyphen.c)
+    hyphenmin: Tuple[int, int, int, int] # LEFT-, RIGHT-, COMPOUNDLEFT-, COMPOUNDRIGHTHYPHENMIN (0: not set)
+    nohyphen:  Tuple[str, ...]
+
+def read_hyb( filepath: Path, source: Path, verify: bool = True ) -> Result[PatternSet, str]:
+    """
+    ### map a compiled .hyb file
+
+    #### Arguments
+     - filepath: Path of the .hyb file
+     - source: Path of the .dic file -> size and mtime must be unchanged since compiling
+     - verify: check the crc32 of the body (reads the whole file, False: header only)
+
+    #### Return [rustedpy]
+     - Ok: PatternSet (arrays are memoryviews of the mapped file)
+     - Err: errortext as str
+    """
+
+    if not filepath.exists():
+        return Err(f"'{filepath}' does not exist")
+
+    if sys.byteorder != "little":
+        return Err("'.hyb' needs a little-endian system")
+
+    try:
+        with filepath.open(mode="rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        return Err(f"{e}")
+
+    ret = parse_hyb(filepath, data, source, verify)
+    if is_err(ret):
+        data.close()
+    return ret
+
+def write_hyb( filepath: Path, pattern_set: PatternSet, source: Path ) -> Result[str, str]:
+    """
+    ### write a compiled .hyb file (atomic: temp file + rename), then read back with verify=True
+
+    #### Arguments
+     - filepath: Path of the .hyb file
+     - pattern_set: compiled patterns
+     - source: Path of the .dic file
+
+    #### Return [rustedpy]
+     - Ok: -
+     - Err: errortext as str
+    """
+
+    if sys.byteorder != "little":
+        return Err("'.hyb' needs a little-endian system")
+
+    nohyphen = "\0".join(pattern_set.nohyphen).encode("utf-8")
+
+    body = bytearray(nohyphen)
+    body.extend(bytes(-len(nohyphen) & 3))
+
+    for automaton in pattern_set.automata:
+        codes = automaton.codes
+        alphabet = "".join(sorted(codes, key=lambda char: codes[char])).encode("utf-8")
+
+        body.extend(SECTION.pack(len(alphabet), len(automaton.base), len(automaton.values)))
+        body.extend(alphabet)
+        body.extend(bytes(-len(alphabet) & 3))
+        for values in (automaton.base, automaton.check, automaton.fail, automaton.out, automaton.values):
+            body.extend(array("i", values).tobytes())
+
+    try:
+        size, mtime_ns = source_stat(source)
+    except OSError as e:
+        return Err(f"{e}")
+
+    header = HEADER.pack(MAGIC, VERSION, zlib.crc32(body), size, mtime_ns, *pattern_set.hyphenmin, len(nohyphen), len(pattern_set.automata))
+
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open(mode="wb") as file:
+            file.write(header)
+            file.write(body)
+        tmp_path.replace(filepath)
+    except OSError as e:
+        Trace.debug(f"{e}")
+        return Err(f"{e}")
+
+    ret = read_hyb(filepath, source, verify=True)
+    if is_err(ret):
+        return Err(ret.err_value)
+
+    Trace.update(f"'{filepath}' created")
+    return Ok("")
+
+# PRIVATE
+
+# header and sections of a mapped .hyb - Err: no memoryview of data is left (the caller closes the map)
+
+def parse_hyb( filepath: Path, data: mmap.mmap, source: Path, verify: bool ) -> Result[PatternSet, str]:
+    if len(data) < HEADER.size:
+        return Err(f"'{filepath}' is truncated")
+
+    magic, version, checksum, size, mtime_ns, lhmin, rhmin, clhmin, crhmin, nohyphen_size, count = HEADER.unpack_from(data, 0)
+
+    if magic != MAGIC:
+        return Err(f"'{filepath}' is not a .hyb file")
+
+    if version != VERSION:
+        return Err(f"'{filepath}' version {version} (expected {VERSION})")
+
+    try:
+        if (size, mtime_ns) != source_stat(source):
+            return Err(f"'{filepath}' is outdated")
+    except OSError as e:
+        return Err(f"{e}")
+
+    view = memoryview(data)
+    if verify and zlib.crc32(view[HEADER.size:]) != checksum:
+        return Err(f"'{filepath}' checksum error")
+
+    offset = HEADER.size
+    if offset + nohyphen_size > len(data):
+        return Err(f"'{filepath}' is truncated")
+
+    try:
+        nohyphen = bytes(view[offset:offset + nohyphen_size]).decode("utf-8")
+    except UnicodeDecodeError as e:
+        return Err(f"'{filepath}' NOHYPHEN: {e}")
+    offset += (nohyphen_size + 3) & ~3
+
+    automata: List[Automaton] = []
+    for _ in range(count):
+        if offset + SECTION.size > len(data):
+            return Err(f"'{filepath}' is truncated")
+
+        alphabet_size, slots, values = SECTION.unpack_from(data, offset)
+        offset += SECTION.size
+
+        if offset + alphabet_size > len(data):
+            return Err(f"'{filepath}' is truncated")
+
+        try:
+            alphabet = bytes(view[offset:offset + alphabet_size]).decode("utf-8")
+        except UnicodeDecodeError as e:
+            return Err(f"'{filepath}' alphabet: {e}")
+        offset += (alphabet_size + 3) & ~3
+
+        if offset + 4 * (4 * slots + values) > len(data):
+            return Err(f"'{filepath}' is truncated")
+
+        arrays = []
+        for length in (slots, slots, slots, slots, values):
+            arrays.append(view[offset:offset + 4 * length].cast("i"))
+            offset += 4 * length
+
+        codes = {char: i + 1 for i, char in enumerate(alphabet)}
+        automata.append(Automaton(codes, *arrays))
+
+    if offset != len(data):
+        return Err(f"'{filepath}' has a wrong size")
+
+    return Ok(PatternSet(tuple(automata), (lhmin, rhmin, clhmin, crhmin), tuple(nohyphen.split("\0")) if nohyphen else ()))
+
+def source_stat( source: Path ) -> Tuple[int, int]:
+    stat = source.stat()
+    return stat.st_size, stat.st_mtime_ns
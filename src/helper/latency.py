@@ -0,0 +1,115 @@
+"""
+    © Jürgen Schoenemeyer, 19.10.2026 20:15
+
+    src/helper/latency.py
+
+    per-word latency of an engine (e.g. get_pyphen) - which words are expensive
+     - each word is timed (time.perf_counter_ns) -> Histogram (utils/timing.py, log-bucketed)
+     - the TOP_K slowest words with their length (bounded min-heap)
+     - per word length: count and mean -> long compounds vs. pathological single words
+
+    the timings include the memo and the cache of the engine (helper/cache.py)
+    -> use_cache( False ) for the engine itself
+    the cyclic garbage collector is disabled while measuring (its pauses would be the slowest "words")
+
+    PUBLIC:
+     - TOP_K: int
+
+    class LatencyRecorder:
+     - LatencyRecorder( name: str, top: int = TOP_K )
+     - LatencyRecorder.measure( words: Iterable[str], hyphenate: Callable[[str], str] ) -> Dict[str, str]
+     - LatencyRecorder.record( word: str, value: int ) -> None
+     - LatencyRecorder.report() -> Dict[str, Any]
+"""
+from __future__ import annotations
+
+import gc
+import heapq
+import time
+
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from utils.timing import Histogram
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+TOP_K = 100
+
+MICRO = 1e-3 # ns -> µs
+
+class LatencyRecorder:
+    """
+    ### per-word timings of one engine
+
+    e.g. test_pyphen( words, language, latency=LatencyRecorder( "Pyphen" ) ) (main.py)
+    """
+
+    def __init__(self, name: str, top: int = TOP_K) -> None:
+        self.name = name
+        self.top = top
+
+        self.histogram = Histogram()
+        self.slowest: List[Tuple[int, str]] = [] # min-heap: (ns, word)
+        self.lengths: Dict[int, List[int]] = {}  # length -> [count, total ns]
+
+    def measure(self, words: Iterable[str], hyphenate: Callable[[str], str]) -> Dict[str, str]:
+        """
+        ### hyphenate each word and record its time
+
+        #### Return
+         - {word: result}
+        """
+
+        clock = time.perf_counter_ns
+        record = self.record
+
+        result: Dict[str, str] = {}
+
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for word in words:
+                start = clock()
+                result[word] = hyphenate(word)
+                record(word, clock() - start)
+        finally:
+            if enabled:
+                gc.enable()
+
+        return result
+
+    def record(self, word: str, value: int) -> None:
+        self.histogram.record(value)
+
+        if len(self.slowest) < self.top:
+            heapq.heappush(self.slowest, (value, word))
+        elif value > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (value, word))
+
+        length = self.lengths.get(len(word))
+        if length is None:
+            self.lengths[len(word)] = [1, value]
+        else:
+            length[0] += 1
+            length[1] += value
+
+    def report(self) -> Dict[str, Any]:
+        """
+        ### json ready report - times in µs
+        """
+
+        return {
+            "engine":  self.name,
+            "unit":    "µs",
+            "summary": {key: value if key == "count" else round(value, 3) for key, value in self.histogram.stats(scale=MICRO).items()},
+            "slowest": [
+                {"word": word, "length": len(word), "time": round(value * MICRO, 3)}
+                for value, word in sorted(self.slowest, reverse=True)
+            ],
+            "lengths": {
+                str(length): {"count": count, "mean": round(total / count * MICRO, 3)}
+                for length, (count, total) in sorted(self.lengths.items())
+            },
+            "histogram": [[round(lowest * MICRO, 3), count] for lowest, count in self.histogram.buckets()],
+        }
@@ -0,0 +1,733 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 10:20
+
+    src/helper/liang.py
+
+    Liang hyphenation (TeX patterns) - pure python, no external module
+
+    patterns: dict/hyph_*.dic (libhyphen/hunspell format)
+     - the patterns are compiled into packed tries (double-array: base/check)
+     - compiled once into dict/hyph_*.hyb (see helper/hyb.py), later processes map the .hyb file
+     - matcher "aho-corasick" (default): failure links, each word is scanned in a single left-to-right pass
+     - matcher "trie": the word is walked once per start position
+     - no substrings are sliced
+     - non-standard hyphenation ("ff=f") is not supported, the alternative is ignored
+
+    compound = False (default): one level, all patterns - same results as Pyphen (left=2, right=2)
+     - exception: double digits e.g. "dampf11ähnlich" are read like libhyphen (last digit), not split like Pyphen
+
+    compound = True: two levels - same algorithm as libhyphen (hyphen.c, see _info/hyphen-2.8.8/README.compound)
+     - level 1 (before NEXTLEVEL): compound word boundaries, each part is hyphenated again recursively
+     - level 2 (after NEXTLEVEL): parts without boundary
+     - COMPOUNDLEFTHYPHENMIN, COMPOUNDRIGHTHYPHENMIN: distance to the compound boundaries
+     - NOHYPHEN: no hyphenation next to "-" and "'" (PyHyphen returns the word before NOHYPHEN is applied)
+     - the word is always lowercased (PyHyphen: only title case words with patch)
+
+    bulk = True (default, needs NumPy, compound = False): word lists of BULK_MIN words or more are hyphenated
+    at once by the vectorized kernel (helper/bulk.py) - same results, words > 64 letters per word
+
+    cache (helper/cache.py): version = hash of this file, helper/bulk.py and helper/hyb.py -> a changed algorithm invalidates the cached results
+    memo: bounded word cache of get_liang (MEMO_BYTES, memo.stats(), memo.resize())
+
+    PUBLIC:
+     - init_liang( language: str = "de_DE", matcher: str = "aho-corasick", compound: bool = False, bulk: bool = True ) -> None
+     - load_patterns( language: str = "de_DE" ) -> PatternSet
+     - get_liang( word: str, trace: bool = False ) -> str
+     - hyphenate_many( words: Iterable[str] ) -> List[str]
+     - hyphenate_masks( words: Iterable[str] ) -> List[Breaks]  # helper/breaks.py
+     - memo: LRUCache
+     - compile_patterns( filepath: Path ) -> PatternSet
+     - scan( automaton: Automaton, text: str ) -> List[int]  # aho-corasick
+     - walk( automaton: Automaton, text: str ) -> List[int]  # trie
+
+    class Patterns:
+     - Patterns( pattern_set: PatternSet, left: int = 2, right: int = 2, matcher: str = "aho-corasick", compound: bool = False )
+     - Patterns.priorities( word: str ) -> List[int]
+     - Patterns.hyphens( word: str ) -> List[int]
+     - Patterns.hyph( word: str, level: int, lend: bool, rend: bool ) -> List[int]
+     - Patterns.positions( word: str ) -> List[int]
+     - Patterns.inserted( word: str, hyphen: str = "-" ) -> str
+
+    PRIVATE:
+     - hyphenate_word( word: str, trace: bool ) -> str
+     - hyphenate_words( words: Iterable[str] ) -> List[str]
+     - hyphenate_words_masks( words: Iterable[str] ) -> List[Breaks]
+     - hyphenate_bulk( words: List[str] ) -> List[Breaks] | None
+     - positions_mask( word: str ) -> int
+     - read_patterns( filepath: Path ) -> Tuple[Dict[str, Tuple[int, Tuple[int, ...]]], List[Dict[str, Tuple[int, Tuple[int, ...]]]], Tuple[int, int, int, int], Tuple[str, ...]]
+     - compile_automaton( patterns: Dict[str, Tuple[int, Tuple[int, ...]]], merge: bool = True ) -> Automaton
+     - limit_left( hyphens: List[int], word: str, hyphenmin: int ) -> None
+     - limit_right( hyphens: List[int], word: str, hyphenmin: int ) -> None
+     - build_trie( patterns: Dict[str, Tuple[int, Tuple[int, ...]]] ) -> Tuple[List[Dict[str, int]], List[Tuple[int, Tuple[int, ...]] | None]]
+     - link_trie( goto: List[Dict[str, int]], output: List[Tuple[int, Tuple[int, ...]] | None], merge: bool = True ) -> List[int]
+     - merge_output( a: Tuple[int, Tuple[int, ...]] | None, b: Tuple[int, Tuple[int, ...]] | None ) -> Tuple[int, Tuple[int, ...]] | None
+     - pack_trie( goto: List[Dict[str, int]] ) -> Tuple[Dict[str, int], List[int], List[int], List[int]]
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import sys
+
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from result import is_err
+
+from helper.breaks import format_result, mask_from_positions, mask_from_result
+from helper.bulk import bulk_masks
+from helper.cache import hyphenate_cached, lookup, open_cache, store_later
+from helper.hyb import Automaton, PatternSet, read_hyb, write_hyb
+from utils.decorator import duration
+from utils.globals import BASE_PATH
+from utils.lru import LRUCache
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from helper.breaks import Breaks
+
+DICT_DIR = BASE_PATH / "dict"
+
+CHUNK_SIZE = 4096
+BULK_MIN   = 1000 # words - smaller lists: per word (helper/bulk.py has a fixed cost per call)
+
+MEMO_BYTES = 4 * 1024 * 1024
+
+COMMENTS  = ("%", "#")
+HYPHENMIN = ("LEFTHYPHENMIN", "RIGHTHYPHENMIN", "COMPOUNDLEFTHYPHENMIN", "COMPOUNDRIGHTHYPHENMIN")
+
+DIGITS = str.maketrans("0123456789", "..........") # hyphen.c: digits in a word are word boundaries
+
+MATCHERS = ("aho-corasick", "trie")
+
+parse_hex = re.compile(r"\^{2}([0-9a-f]{2})").sub
+
+# cache version: the results come from this file, the bulk kernel (helper/bulk.py) and the compiled patterns (helper/hyb.py)
+
+VERSION = hashlib.blake2b(b"".join(Path(__file__).with_name(name).read_bytes() for name in ("liang.py", "bulk.py", "hyb.py")), digest_size=8).hexdigest()
+
+liang_dic: Patterns
+cache_key: int | None = None
+bulk_mode: bool = False
+
+memo = LRUCache(max_bytes=MEMO_BYTES)
+
+class Patterns:
+    """
+    ### compiled hyphenation patterns
+
+    automata (see helper/hyb.py):
+     - [0] all patterns (one level, like Pyphen)
+     - [1] compound level, [2] word level (libhyphen)
+       outputs are not merged (like hyphen.c), the levels are always scanned (aho-corasick)
+
+    double-array trie (state = slot):
+     - next = base[state] + codes[char], valid if check[next] == state
+     - fail[state]: state of the longest proper suffix, which is also in the trie
+     - output of a state: index = out[state] (0: no output)
+       values[index] = rel, values[index + 1] = count, values[index + 2 : ...] = priorities
+       written at position (end + rel), end = index of the last matched char in '.word.'
+       the output already includes the outputs of all suffix states (merged over the fail links)
+    """
+
+    def __init__(self, pattern_set: PatternSet, left: int = 2, right: int = 2, matcher: str = "aho-corasick", compound: bool = False) -> None:
+        if matcher not in MATCHERS:
+            Trace.fatal(f"unknown matcher '{matcher}'")
+
+        self.left = left
+        self.right = right
+        self.matcher = matcher
+        self.compound = compound
+
+        self.match = walk if matcher == "trie" else scan
+
+        self.automata = pattern_set.automata
+
+        # hnj_hyphen_hyphenate3: the larger value of the caller (PyHyphen: lmin, rmin, compound_lmin, compound_rmin) and the dictionary
+        lhmin, rhmin, clhmin, crhmin = pattern_set.hyphenmin
+        self.lhmin  = max(left, lhmin) or 2
+        self.rhmin  = max(right, rhmin) or 2
+        self.clhmin = max(left, clhmin)
+        self.crhmin = max(right, crhmin)
+
+        self.nohyphen = pattern_set.nohyphen
+
+    def priorities(self, word: str) -> List[int]:
+        """
+        ### inter-letter priorities of '.word.' (same vector as Pyphen's HyphDict.positions)
+
+        odd value at index i -> hyphenation point before letter i - 1 of the word
+        """
+
+        return self.match(self.automata[0], f".{word.lower()}.")
+
+    def hyphens(self, word: str) -> List[int]:
+        """
+        ### two levels (hnj_hyphen_hyphenate3): priority after each letter of the word
+
+        odd value at index i -> hyphenation point after letter i of the word
+        """
+
+        hyphens = self.hyph(word, 1, lend=True, rend=True)
+        limit_left(hyphens, word, self.lhmin)
+        limit_right(hyphens, word, self.rhmin)
+
+        for nohyphen in self.nohyphen:
+            pos = word.find(nohyphen)
+            while pos >= 0:
+                hyphens[pos + len(nohyphen) - 1] = 0
+                if pos > 0:
+                    hyphens[pos - 1] = 0
+                pos = word.find(nohyphen, pos + 1)
+
+        return hyphens
+
+    def hyph(self, word: str, level: int, lend: bool, rend: bool) -> List[int]:
+        """
+        ### hnj_hyphen_hyph_: one level, the compound level recursively
+
+         - lend, rend: word part at the left/right end of the word (-> no COMPOUND*HYPHENMIN)
+         - parts shorter than 3 bytes (UTF-8) are not hyphenated again (hyphen.c counts bytes)
+        """
+
+        text = word.translate(DIGITS)
+        size = len(text)
+
+        hyphens = scan(self.automata[level], f".{text}.")[2 : size + 1]
+        hyphens.append(0)
+
+        if level == 2:
+            return hyphens
+
+        begin = 0
+        for i in range(size):
+            if hyphens[i] & 1 or (begin and i == size - 1):
+                part = text[begin : i + 1]
+                if len(part.encode("utf-8")) > 2:
+                    part_hyphens = self.hyph(part, 1, lend and not begin, rend and not hyphens[i] & 1)
+
+                    hyphens[begin:i] = part_hyphens[:-1] # the boundary itself is kept
+                begin = i + 1
+
+        if begin == 0: # no compound word boundary
+            hyphens = self.hyph(word, 2, lend, rend)
+            if not lend:
+                limit_left(hyphens, word, self.clhmin)
+            if not rend:
+                limit_right(hyphens, word, self.crhmin)
+
+        return hyphens
+
+    def positions(self, word: str) -> List[int]:
+        if self.compound:
+            lower = word.lower()
+            hyphens = self.hyphens(lower)
+            if len(lower) != len(word): # e.g. "İ" -> "i̇"
+                hyphens = [hyphens[len(word[:i + 1].lower()) - 1] for i in range(len(word))]
+
+            return [i + 1 for i, value in enumerate(hyphens) if value & 1]
+
+        left = self.left
+        right = len(word) - self.right
+
+        result: List[int] = []
+        for i, value in enumerate(self.priorities(word)):
+            if value & 1 and left <= i - 1 <= right:
+                result.append(i - 1)
+
+        return result
+
+    def inserted(self, word: str, hyphen: str = "-") -> str:
+        parts: List[str] = []
+
+        last = 0
+        for pos in self.positions(word):
+            parts.append(word[last:pos])
+            last = pos
+        parts.append(word[last:])
+
+        return hyphen.join(parts)
+
+@duration("Liang init")
+def init_liang( language: str = "de_DE", matcher: str = "aho-corasick", compound: bool = False, bulk: bool = True ) -> None:
+    global liang_dic, cache_key, bulk_mode
+
+    pattern_set = load_patterns(language)
+
+    liang_dic = Patterns(pattern_set, matcher=matcher, compound=compound)
+    bulk_mode = bulk and not compound and "numpy" in sys.modules
+    memo.clear()
+    cache_key = open_cache("Liang-Compound" if compound else "Liang", VERSION, DICT_DIR / f"hyph_{language}.dic")
+
+def load_patterns( language: str = "de_DE" ) -> PatternSet:
+    """
+    ### compiled patterns of dict/hyph_<language>.dic
+
+    mapped from the .hyb file, compiled and written first if it is missing, outdated or damaged
+
+    #### Arguments
+     - language: e.g. "de_DE"
+
+    #### Return
+     - PatternSet (helper/hyb.py)
+    """
+
+    dirpath = DICT_DIR
+    if not dirpath.exists():
+        Trace.fatal(f"Liang directory '{dirpath}' not found")
+
+    filepath = dirpath / f"hyph_{language}.dic"
+    if not filepath.exists():
+        Trace.fatal(f"Liang dictionary '{filepath}' not found")
+
+    hyb_path = filepath.with_suffix(".hyb")
+
+    ret = read_hyb(hyb_path, filepath, verify=True) # crc32 of the whole body on each load
+    if is_err(ret):
+        Trace.info(f"{ret.err_value} -> compile '{filepath.name}'")
+        pattern_set = compile_patterns(filepath)
+
+        ret_write = write_hyb(hyb_path, pattern_set, filepath)
+        if is_err(ret_write):
+            Trace.error(f"Error: {ret_write.err_value}")
+    else:
+        pattern_set = ret.unwrap()
+
+    return pattern_set
+
+def get_liang( word: str, trace: bool = False ) -> str:
+    if not trace:
+        cached: str | None = memo.get(word)
+        if cached is not None:
+            return cached
+
+    result = hyphenate_word(word, trace)
+    memo[word] = result
+    return result
+
+def hyphenate_word( word: str, trace: bool ) -> str:
+    if cache_key is not None and (cached := lookup(cache_key, word)) is not None:
+        if trace:
+            Trace.result(f"Liang:    {cached} (cache)")
+        return cached
+
+    parts = word.split("-") # e.g. "Baden-Württemberg"
+
+    result = []
+    for part in parts:
+        result.append(liang_dic.inserted(part, "·"))
+
+    if trace:
+        Trace.result(f"Liang:    {"-".join(result)}")
+
+    if cache_key is not None:
+        store_later(cache_key, word, "-".join(result))
+
+    return f"{"-".join(result)}"
+
+def hyphenate_many( words: Iterable[str] ) -> List[str]:
+    """
+    ### same result as get_liang for each word (without trace)
+
+    the lookups are done once per call, the words are processed in chunks
+    """
+
+    if cache_key is not None:
+        return hyphenate_cached([cache_key], words, lambda missing: [hyphenate_words(missing)])[0]
+
+    return hyphenate_words(words)
+
+def hyphenate_masks( words: Iterable[str] ) -> List[Breaks]:
+    """
+    ### same result as hyphenate_many as mask (format_result( word, mask ) == hyphenate_many result)
+
+    with cache: the cached results are converted, the missing words are stored formatted
+    """
+
+    if cache_key is not None:
+        words = list(words)
+        return [mask_from_result(word, result) for word, result in zip(words, hyphenate_many(words), strict=True)]
+
+    return hyphenate_words_masks(words)
+
+def hyphenate_words( words: Iterable[str] ) -> List[str]:
+    if bulk_mode:
+        words = list(words)
+        if (masks := hyphenate_bulk(words)) is not None:
+            return [format_result(word, mask) for word, mask in zip(words, masks, strict=True)]
+
+    inserted = liang_dic.inserted
+
+    result: List[str] = []
+    iterator = iter(words)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        result.extend([
+            inserted(word, "·") if "-" not in word else "-".join([inserted(part, "·") for part in word.split("-")])
+            for word in chunk
+        ])
+
+    return result
+
+def hyphenate_words_masks( words: Iterable[str] ) -> List[Breaks]:
+    if bulk_mode:
+        words = list(words)
+        if (masks := hyphenate_bulk(words)) is not None:
+            return masks
+
+    positions = liang_dic.positions
+
+    result: List[Breaks] = []
+    iterator = iter(words)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        result.extend([
+            mask_from_positions(positions(word)) if "-" not in word else positions_mask(word)
+            for word in chunk
+        ])
+
+    return result
+
+def hyphenate_bulk( words: List[str] ) -> List[Breaks] | None:
+    if len(words) < BULK_MIN:
+        return None
+
+    masks = bulk_masks(liang_dic.automata[0], words, liang_dic.left, liang_dic.right)
+    return [mask if mask is not None else positions_mask(word) for word, mask in zip(words, masks, strict=True)]
+
+def positions_mask( word: str ) -> int:
+    positions = liang_dic.positions
+
+    mask = 0
+    offset = 0
+    for part in word.split("-"): # e.g. "Baden-Württemberg"
+        mask |= mask_from_positions(positions(part), offset)
+        offset += len(part) + 1
+    return mask
+
+# Aho-Corasick: one left-to-right pass over the text ('.word.')
+#  -> priority vector (len(text) + 1), index i: before text[i]
+
+def scan( automaton: Automaton, text: str ) -> List[int]:
+    codes, base, check, fail, out, values = automaton
+
+    references = [0] * (len(text) + 1)
+
+    state = 0
+    for end, char in enumerate(text):
+        code = codes.get(char, 0)
+        while True:
+            next_state = base[state] + code
+            if check[next_state] == state:
+                state = next_state
+                break
+            if state == 0:
+                break
+            state = fail[state]
+
+        index = out[state]
+        if index:
+            pos = end + values[index]
+            for value in values[index + 2 : index + 2 + values[index + 1]]:
+                if value > references[pos]:  # noqa: PLR1730
+                    references[pos] = value
+                pos += 1
+
+    return references
+
+# trie: one walk per start position (same result as scan)
+
+def walk( automaton: Automaton, text: str ) -> List[int]:
+    codes, base, check, _fail, out, values = automaton
+
+    chars = [codes.get(char, 0) for char in text]
+    length = len(chars)
+    references = [0] * (length + 1)
+
+    for start in range(length - 1):
+        state = 0
+        for end in range(start, length):
+            next_state = base[state] + chars[end]
+            if check[next_state] != state:
+                break
+            state = next_state
+
+            index = out[state]
+            if index:
+                pos = end + values[index]
+                for value in values[index + 2 : index + 2 + values[index + 1]]:
+                    if value > references[pos]:  # noqa: PLR1730
+                        references[pos] = value
+                    pos += 1
+
+    return references
+
+# hyph_de_DE.dic -> PatternSet (lists)
+
+def compile_patterns( filepath: Path ) -> PatternSet:
+    patterns, levels, hyphenmin, nohyphen = read_patterns(filepath)
+
+    if len(levels) == 1: # hyphen.c: default compound level "1-1", "1'1", ...
+        levels.insert(0, dict.fromkeys(nohyphen, (0, (1, 1))))
+
+    automata = [compile_automaton(patterns)]
+    automata.extend(compile_automaton(level, merge=False) for level in levels)
+
+    return PatternSet(tuple(automata), hyphenmin, nohyphen)
+
+# PRIVATE
+
+# hyph_de_DE.dic -> {"tags": (start, values)} - e.g. ".ab3a4s" -> {".abas": (3, (3, 0, 4))}
+#  - patterns: all levels, patterns without values are skipped (Pyphen)
+#  - levels: [level 1, level 2], patterns without values are kept, e.g. "charmette" -> {"charmette": (0, ())}
+#  - hyphenmin (0: not set), nohyphen: header of the first level
+#  - without NEXTLEVEL: one level, default compound settings (hyphen.c: hnj_hyphen_load_file)
+
+def read_patterns( filepath: Path ) -> Tuple[Dict[str, Tuple[int, Tuple[int, ...]]], List[Dict[str, Tuple[int, Tuple[int, ...]]]], Tuple[int, int, int, int], Tuple[str, ...]]:
+    patterns: Dict[str, Tuple[int, Tuple[int, ...]]] = {}
+    levels: List[Dict[str, Tuple[int, Tuple[int, ...]]]] = [{}]
+    hyphenmin = [0, 0, 0, 0]
+    nohyphen: Tuple[str, ...] = ()
+
+    # see "man 4 hunspell" - first line: encoding
+    with filepath.open(mode="rb") as file:
+        encoding = file.readline().decode().strip()
+
+    if encoding.lower() == "microsoft-cp1251":
+        encoding = "cp1251"
+
+    for line in filepath.read_text(encoding=encoding).split("\n")[1:]:
+        pattern = line.strip()
+        if len(pattern) == 0 or pattern.startswith(COMMENTS):
+            continue
+
+        if pattern.startswith(HYPHENMIN):
+            keyword, _, value = pattern.partition(" ")
+            if len(levels) == 1 and keyword in HYPHENMIN:
+                hyphenmin[HYPHENMIN.index(keyword)] = int(value) if value.strip().isdigit() else 0
+            continue
+
+        if pattern.startswith("NOHYPHEN"):
+            if len(levels) == 1:
+                nohyphen = tuple(pattern[8:].strip().split(","))
+            continue
+
+        if pattern.startswith("NEXTLEVEL"):
+            levels.append({})
+            continue
+
+        if "^^" in pattern:
+            pattern = parse_hex(lambda match: chr(int(match.group(1), 16)), pattern)
+
+        if "/" in pattern and "=" in pattern: # non-standard hyphenation -> ignored
+            pattern = pattern.split("/", 1)[0]
+
+        tags: List[str] = []
+        values: List[int] = [0]
+        for char in pattern:
+            if "0" <= char <= "9":
+                values[-1] = int(char)
+            else:
+                tags.append(char)
+                values.append(0)
+
+        key = "".join(tags)
+
+        if max(values) == 0: # hyphen.c: no output, but the states exist (-> fallback)
+            levels[-1][key] = (0, ())
+            continue
+
+        start, end = 0, len(values)
+        while not values[start]:
+            start += 1
+        while not values[end - 1]:
+            end -= 1
+
+        patterns[key] = levels[-1][key] = (start, tuple(values[start:end]))
+
+    lhmin, rhmin, clhmin, crhmin = hyphenmin
+    if len(levels) == 1:
+        clhmin = clhmin or lhmin or 3
+        crhmin = crhmin or rhmin or 3
+        nohyphen = ("'", "\u2013", "\u2019", "-") if encoding.upper() == "UTF-8" else ("'", "-") # endash, apostrophe
+
+    return patterns, levels[:2], (lhmin, rhmin, clhmin, crhmin), nohyphen
+
+# patterns -> Automaton (lists)
+
+def compile_automaton( patterns: Dict[str, Tuple[int, Tuple[int, ...]]], merge: bool = True ) -> Automaton:
+    goto, output = build_trie(patterns)
+    fail = link_trie(goto, output, merge)
+    codes, base, check, slots = pack_trie(goto)
+
+    fail_slots: List[int] = [0] * len(base)
+    for state, fail_state in enumerate(fail):
+        fail_slots[slots[state]] = slots[fail_state]
+
+    out: List[int] = [0] * len(base)
+    values: List[int] = [0] # index 0: no output
+
+    for state, entry in enumerate(output):
+        if entry is not None:
+            rel, priorities = entry
+            out[slots[state]] = len(values)
+            values.extend((rel, len(priorities), *priorities))
+
+    return Automaton(codes, base, check, fail_slots, out, values)
+
+# hnj_hyphen_lhmin, hnj_hyphen_rhmin: no hyphenation in the first/last letters (digits are not counted)
+
+def limit_left( hyphens: List[int], word: str, hyphenmin: int ) -> None:
+    count = 1
+    for char in word:
+        if not "0" <= char <= "9":
+            break
+        count -= 1
+
+    i = 0
+    while count < hyphenmin and i < len(word):
+        hyphens[i] = 0
+        i += 1
+        count += 1
+
+def limit_right( hyphens: List[int], word: str, hyphenmin: int ) -> None:
+    count = 0
+    for char in reversed(word[1:]):
+        if not "0" <= char <= "9":
+            break
+        count -= 1
+
+    # byte based: the first letter counts only if it is longer than one byte (UTF-8)
+    first = 0 if word[:1] > "\x7f" else 1
+
+    i = len(word) - 1
+    while count < hyphenmin and i >= first:
+        hyphens[i] = 0
+        i -= 1
+        count += 1
+
+# trie as list of states: goto[state] = {char: next_state}, output[state] = (rel, values)
+#  - rel: position of the first value relative to the last matched char
+
+def build_trie( patterns: Dict[str, Tuple[int, Tuple[int, ...]]] ) -> Tuple[List[Dict[str, int]], List[Tuple[int, Tuple[int, ...]] | None]]:
+    goto: List[Dict[str, int]] = [{}]
+    output: List[Tuple[int, Tuple[int, ...]] | None] = [None]
+
+    for tags, (start, values) in patterns.items():
+        state = 0
+        for char in tags:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                output.append(None)
+            state = next_state
+
+        if values:
+            output[state] = (1 - len(tags) + start, values)
+
+    return goto, output
+
+# Aho-Corasick: failure links (breadth first) + merged outputs
+#  -> fail[state], output[state] is extended by the output of its fail state
+#  -> merge = False: hyphen.c (fallback states, only the pattern of the state itself)
+
+def link_trie( goto: List[Dict[str, int]], output: List[Tuple[int, Tuple[int, ...]] | None], merge: bool = True ) -> List[int]:
+    fail = [0] * len(goto)
+
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        if merge:
+            output[state] = merge_output(output[state], output[fail[state]])
+
+        for char, next_state in goto[state].items():
+            fail_state = fail[state]
+            while fail_state and char not in goto[fail_state]:
+                fail_state = fail[fail_state]
+
+            fail[next_state] = goto[fail_state].get(char, 0)
+            queue.append(next_state)
+
+    return fail
+
+# both outputs are aligned to the same last char -> element-wise max
+
+def merge_output( a: Tuple[int, Tuple[int, ...]] | None, b: Tuple[int, Tuple[int, ...]] | None ) -> Tuple[int, Tuple[int, ...]] | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+
+    rel_a, values_a = a
+    rel_b, values_b = b
+
+    rel = min(rel_a, rel_b)
+    merged = [0] * (max(rel_a + len(values_a), rel_b + len(values_b)) - rel)
+    for i, value in enumerate(values_a):
+        merged[rel_a - rel + i] = value
+    for i, value in enumerate(values_b):
+        merged[rel_b - rel + i] = max(merged[rel_b - rel + i], value)
+
+    return (rel, tuple(merged))
+
+# double-array packing (breadth first, first fit over a linked list of free slots)
+#  -> codes: {char: 1..n}, base, check, slots: state -> slot
+
+def pack_trie( goto: List[Dict[str, int]] ) -> Tuple[Dict[str, int], List[int], List[int], List[int]]:
+    alphabet = sorted({char for transitions in goto for char in transitions})
+    codes = {char: i + 1 for i, char in enumerate(alphabet)}
+
+    size = 2 * (len(goto) + len(codes) + 1)
+
+    base  = [0] * size
+    check = [-1] * size
+    check[0] = -2 # root
+
+    next_free = [*range(1, size), 0]
+    prev_free = list(range(-1, size - 1))
+    head = 1
+
+    slots = [0] * len(goto)
+    used = 1
+
+    queue = deque([0])
+    while queue:
+        state = queue.popleft()
+        if len(goto[state]) == 0:
+            continue
+
+        children = sorted((codes[char], next_state) for char, next_state in goto[state].items())
+        first = children[0][0]
+
+        free = head
+        while True:
+            offset = free - first
+            if offset >= 1 and all(check[offset + code] == -1 for code, _ in children):
+                break
+            free = next_free[free]
+
+        slot = slots[state]
+        base[slot] = offset
+        for code, next_state in children:
+            pos = offset + code
+            check[pos] = slot
+            slots[next_state] = pos
+            used = max(used, pos + 1)
+            queue.append(next_state)
+
+            # unlink pos from the free list
+            before, after = prev_free[pos], next_free[pos]
+            if before >= 1:
+                next_free[before] = after
+            else:
+                head = after
+            if after:
+                prev_free[after] = before
+
+    # every transition base[state] + code must stay inside the arrays
+    size = max(used, max(base) + len(codes) + 1)
+    return codes, base[:size], check[:size], slots
@@ -11,39 +11,171 @@
 
     https://github.com/LibreOffice/dictionaries/blob/master/de/hyph_de_DE.dic
 
+    hyphenate_masks, hyphenate_patch_modes_masks: break positions as int bitmask (helper/breaks.py)
+     - the mask is built from the syllable lengths (checked: the syllables must be the letters of the part)
+     - str, if the syllables are not the letters of the word (e.g. patch: "ß".title() -> "Ss")
+
+    memory:
+     - memo: bounded word cache of get_pyhyphen (MEMO_BYTES, memo.stats(), memo.resize())
+
     PUBLIC:
      - init_pyhypen( language: str = "de_DE" ) -> None
      - get_pyhypen( word:str, patch: bool = True, trace: bool = False ) -> str
+     - hyphenate_many( words: Iterable[str], patch: bool = True ) -> List[str]
+     - hyphenate_patch_modes( words: Iterable[str] ) -> Tuple[List[str], List[str]]
+     - hyphenate_masks( words: Iterable[str], patch: bool = True ) -> List[Breaks]
+     - hyphenate_patch_modes_masks( words: Iterable[str] ) -> Tuple[List[Breaks], List[Breaks]]
+     - memo: LRUCache
 
     PRIVATE:
+     - get_hyphenator() -> Hyphenator
+     - load_hyphenator( language: str ) -> Hyphenator
+     - hyphenate_word( word: str, patch: bool, trace: bool ) -> str
+     - hyphenate_words( words: Iterable[str], patch: bool ) -> List[str]
+     - hyphenate_words_patch_modes( words: Iterable[str] ) -> Tuple[List[str], List[str]]
+     - hyphenate_words_masks( words: Iterable[str], patch: bool ) -> List[Breaks]
+     - hyphenate_words_patch_modes_masks( words: Iterable[str] ) -> Tuple[List[Breaks], List[Breaks]]
+     - syllables_mask( syllables: List[str], part: str, offset: int ) -> int | None
      - format_word( parts: List[Any] ) -> str
      - download_pyhypen_all() -> None
 """
 from __future__ import annotations
 
-from typing import Any, List
+from importlib.metadata import version
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from hyphen import Hyphenator  # type: ignore[import-untyped]
 
+from helper.breaks import mask_from_parts, mask_from_result
+from helper.cache import hyphenate_cached, lookup, open_cache, store_later
 from utils.decorator import duration
 from utils.globals import BASE_PATH
+from utils.lru import LRUCache
 from utils.trace import Trace
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from helper.breaks import Breaks
+
 DICT_DIR = BASE_PATH / "dict"
 
-hyphen: Hyphenator
+CHUNK_SIZE = 4096
+
+MEMO_BYTES = 4 * 1024 * 1024
+
+hyphen: Hyphenator | None = None
+hyphen_language: str = "de_DE"
+cache_keys: Dict[bool, int] = {} # patch -> key (empty: no cache)
+
+memo = LRUCache(max_bytes=MEMO_BYTES) # (word, patch) -> result
 
 @duration("PyHyphen init")
 def init_pyhyphen( language: str = "de_DE" ) -> None:
-    global hyphen
+    global hyphen, hyphen_language
 
     dirpath = DICT_DIR
     if not dirpath.exists():
         Trace.fatal(f"PyHyphen directory '{dirpath}' not found")
 
-    hyphen = Hyphenator(language, directory=dirpath)
+    hyphen = None
+    hyphen_language = language
+    memo.clear()
+
+    cache_keys.clear()
+    for patch in (False, True):
+        key = open_cache("PyHyphen", version("PyHyphen"), dirpath / f"hyph_{language}.dic", patch)
+        if key is not None:
+            cache_keys[patch] = key
+
+    if not cache_keys: # with cache: loaded with the first word not in the cache
+        get_hyphenator()
 
 def get_pyhyphen( word: str, patch: bool = True, trace: bool = False ) -> str :
+    if not trace:
+        cached: str | None = memo.get((word, patch))
+        if cached is not None:
+            return cached
+
+    result = hyphenate_word(word, patch, trace)
+    memo[(word, patch)] = result
+    return result
+
+def hyphenate_many( words: Iterable[str], patch: bool = True ) -> List[str]:
+    """
+    ### same result as get_pyhyphen for each word (without trace)
+
+    the lookups are done once per call, the words are processed in chunks
+    """
+
+    if patch in cache_keys:
+        return hyphenate_cached([cache_keys[patch]], words, lambda missing: [hyphenate_words(missing, patch)])[0]
+
+    return hyphenate_words(words, patch)
+
+def hyphenate_patch_modes( words: Iterable[str] ) -> Tuple[List[str], List[str]]:
+    """
+    ### hyphenate_many without and with patch in one pass
+
+    the patch only changes title case parts -> all other parts are hyphenated once
+    """
+
+    if cache_keys:
+        no_patch, patch = hyphenate_cached([cache_keys[False], cache_keys[True]], words, hyphenate_words_patch_modes)
+        return no_patch, patch
+
+    return hyphenate_words_patch_modes(words)
+
+def hyphenate_masks( words: Iterable[str], patch: bool = True ) -> List[Breaks]:
+    """
+    ### same result as hyphenate_many as mask (format_result( word, mask ) == hyphenate_many result)
+
+    with cache: the cached results are converted, the missing words are stored formatted
+    """
+
+    if patch in cache_keys:
+        words = list(words)
+        return [mask_from_result(word, result) for word, result in zip(words, hyphenate_many(words, patch), strict=True)]
+
+    return hyphenate_words_masks(words, patch)
+
+def hyphenate_patch_modes_masks( words: Iterable[str] ) -> Tuple[List[Breaks], List[Breaks]]:
+    """
+    ### hyphenate_patch_modes as masks
+    """
+
+    if cache_keys:
+        words = list(words)
+        no_patch, patch = hyphenate_patch_modes(words)
+        return (
+            [mask_from_result(word, result) for word, result in zip(words, no_patch, strict=True)],
+            [mask_from_result(word, result) for word, result in zip(words, patch, strict=True)],
+        )
+
+    return hyphenate_words_patch_modes_masks(words)
+
+# PRIVATE
+
+def get_hyphenator() -> Hyphenator:
+    global hyphen
+
+    if hyphen is None:
+        hyphen = load_hyphenator(hyphen_language)
+
+    return hyphen
+
+@duration("PyHyphen load")
+def load_hyphenator( language: str ) -> Hyphenator:
+    return Hyphenator(language, directory=DICT_DIR)
+
+def hyphenate_word( word: str, patch: bool, trace: bool ) -> str:
+    if patch in cache_keys and (cached := lookup(cache_keys[patch], word)) is not None:
+        if trace:
+            Trace.result(f"PyHyphen: {cached} (cache)")
+        return cached
+
+    syllables = get_hyphenator().syllables
 
     parts = word.split("-") # e.g. "Baden-Württemberg"
 
@@ -57,7 +189,7 @@ def get_pyhyphen( word: str, patch: bool = True, trace: bool = False ) -> str :
                 part = part.lower()  # noqa: PLW2901
                 mode = 4
 
-            res = hyphen.syllables(part)
+            res = syllables(part)
             if len(res) == 0:
                 res = [part_original]
 
@@ -65,7 +197,7 @@ def get_pyhyphen( word: str, patch: bool = True, trace: bool = False ) -> str :
                 res[0] = res[0].title()
 
         else:
-            res = hyphen.syllables(part)
+            res = syllables(part)
             if len(res) == 0:
                 res = [part_original]
 
@@ -74,8 +206,153 @@ def get_pyhyphen( word: str, patch: bool = True, trace: bool = False ) -> str :
     if trace:
         Trace.result(f"PyHyphen: {format_word(result)}")
 
+    if patch in cache_keys:
+        store_later(cache_keys[patch], word, format_word(result))
+
     return format_word(result)
 
+def hyphenate_words( words: Iterable[str], patch: bool ) -> List[str]:
+    syllables = get_hyphenator().syllables
+
+    def hyphenate_part( part: str ) -> str:
+        if patch and part.istitle():
+            res = syllables(part.lower())
+            if len(res) == 0:
+                return part
+
+            res[0] = res[0].title()
+            return "·".join(res)
+
+        return "·".join(syllables(part)) or part
+
+    result: List[str] = []
+    iterator = iter(words)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        result.extend([
+            hyphenate_part(word) if "-" not in word else "-".join([hyphenate_part(part) for part in word.split("-")])
+            for word in chunk
+        ])
+
+    return result
+
+def hyphenate_words_patch_modes( words: Iterable[str] ) -> Tuple[List[str], List[str]]:
+    syllables = get_hyphenator().syllables
+
+    def hyphenate_part( part: str ) -> Tuple[str, str]:
+        no_patch = "·".join(syllables(part)) or part
+        if not part.istitle():
+            return no_patch, no_patch
+
+        res = syllables(part.lower())
+        if len(res) == 0:
+            return no_patch, part
+
+        res[0] = res[0].title()
+        return no_patch, "·".join(res)
+
+    result_no_patch: List[str] = []
+    result_patch: List[str] = []
+    for word in words:
+        if "-" not in word:
+            no_patch, patch = hyphenate_part(word)
+        else:
+            parts = [hyphenate_part(part) for part in word.split("-")]
+            no_patch = "-".join([part[0] for part in parts])
+            patch = "-".join([part[1] for part in parts])
+
+        result_no_patch.append(no_patch)
+        result_patch.append(patch)
+
+    return result_no_patch, result_patch
+
+def hyphenate_words_masks( words: Iterable[str], patch: bool ) -> List[Breaks]:
+    syllables = get_hyphenator().syllables
+
+    def part_mask( part: str, offset: int ) -> int | None:
+        if patch and part.istitle():
+            res = syllables(part.lower())
+            if len(res) > 0:
+                res[0] = res[0].title()
+        else:
+            res = syllables(part)
+
+        return syllables_mask(res, part, offset)
+
+    def word_mask( word: str ) -> Breaks:
+        mask = 0
+        offset = 0
+        for part in word.split("-"):
+            part_breaks = part_mask(part, offset)
+            if part_breaks is None:
+                return mask_from_result(word, hyphenate_words([word], patch)[0])
+            mask |= part_breaks
+            offset += len(part) + 1
+        return mask
+
+    result: List[Breaks] = []
+    iterator = iter(words)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        result.extend([
+            mask if "-" not in word and (mask := part_mask(word, 0)) is not None else word_mask(word)
+            for word in chunk
+        ])
+
+    return result
+
+def hyphenate_words_patch_modes_masks( words: Iterable[str] ) -> Tuple[List[Breaks], List[Breaks]]:
+    syllables = get_hyphenator().syllables
+
+    def part_masks( part: str, offset: int ) -> Tuple[int | None, int | None]:
+        no_patch = syllables_mask(syllables(part), part, offset)
+        if not part.istitle():
+            return no_patch, no_patch
+
+        res = syllables(part.lower())
+        if len(res) > 0:
+            res[0] = res[0].title()
+        return no_patch, syllables_mask(res, part, offset)
+
+    result_no_patch: List[Breaks] = []
+    result_patch: List[Breaks] = []
+    for word in words:
+        if "-" not in word:
+            part_no_patch, part_patch = part_masks(word, 0)
+            if part_no_patch is not None and part_patch is not None:
+                result_no_patch.append(part_no_patch)
+                result_patch.append(part_patch)
+                continue
+
+        no_patch = patch = 0
+        offset = 0
+        for part in word.split("-"):
+            part_no_patch, part_patch = part_masks(part, offset)
+            if part_no_patch is None or part_patch is None:
+                strings = hyphenate_words_patch_modes([word])
+                result_no_patch.append(mask_from_result(word, strings[0][0]))
+                result_patch.append(mask_from_result(word, strings[1][0]))
+                break
+            no_patch |= part_no_patch
+            patch |= part_patch
+            offset += len(part) + 1
+        else:
+            result_no_patch.append(no_patch)
+            result_patch.append(patch)
+
+    return result_no_patch, result_patch
+
+def syllables_mask( syllables: List[str], part: str, offset: int ) -> int | None:
+    """
+    ### syllables of a part -> mask (offset: first letter of the part in the word), None: not the letters of the part
+    """
+
+    if len(syllables) == 0: # not hyphenated -> part
+        return 0
+
+    if "" in syllables or "".join(syllables) != part:
+        return None
+
+    return mask_from_parts(syllables, offset)
+
 def format_word( parts: List[Any] ) -> str:
     result = ""
     for part in parts:
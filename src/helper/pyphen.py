@@ -10,25 +10,64 @@
     https://pypi.org/project/pyphen/
     https://github.com/Kozea/Pyphen
 
+    hyphenate_masks: break positions as int bitmask (helper/breaks.py), no strings are built
+
+    memory:
+     - memo: bounded word cache of get_pyphen (MEMO_BYTES, memo.stats(), memo.resize())
+     - pyphen.HyphDict.cache (unbounded dict of all words) is replaced by an LRUCache (POSITIONS_ENTRIES)
+
     PUBLIC:
      - init_pyphen( language: str="de_DE" ) -> None
      - get_pyphen( word:str, trace: bool = False ) -> str
+     - hyphenate_many( words: Iterable[str] ) -> List[str]
+     - hyphenate_masks( words: Iterable[str] ) -> List[Breaks]
+     - memo: LRUCache
+
+    PRIVATE:
+     - get_pyphen_dic() -> pyphen.Pyphen
+     - load_pyphen_dic( filepath: Path ) -> pyphen.Pyphen
+     - hyphenate_word( word: str, trace: bool ) -> str
+     - hyphenate_words( words: Iterable[str] ) -> List[str]
+     - hyphenate_words_masks( words: Iterable[str] ) -> List[Breaks]
 """
 from __future__ import annotations
 
+from importlib.metadata import version
+from itertools import islice
+from typing import TYPE_CHECKING, List
+
 import pyphen  # type: ignore[import-untyped]
 
+from helper.breaks import mask_from_positions, mask_from_result
+from helper.cache import hyphenate_cached, lookup, open_cache, store_later
 from utils.decorator import duration
 from utils.globals import BASE_PATH
+from utils.lru import LRUCache
 from utils.trace import Trace
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from helper.breaks import Breaks
+
 DICT_DIR = BASE_PATH / "dict"
 
-pyphen_dic: pyphen.Pyphen
+CHUNK_SIZE = 4096
+
+MEMO_BYTES        = 4 * 1024 * 1024
+POSITIONS_ENTRIES = 100_000
+
+pyphen_dic: pyphen.Pyphen | None = None
+pyphen_path: Path
+cache_key: int | None = None
+nonstandard: bool = False # patterns with alternatives (pyphen.DataInt.data)
+
+memo = LRUCache(max_bytes=MEMO_BYTES)
 
 @duration("Pyphen init")
 def init_pyphen( language: str="de_DE" ) -> None:
-    global pyphen_dic
+    global pyphen_dic, pyphen_path, cache_key
 
     dirpath = DICT_DIR
     if not dirpath.exists():
@@ -38,18 +77,121 @@ def init_pyphen( language: str="de_DE" ) -> None:
     if not filepath.exists():
         Trace.fatal(f"Pyphen dictionary '{filepath}' not found")
 
-    pyphen_dic = pyphen.Pyphen(filename=filepath)
+    pyphen_dic = None
+    pyphen_path = filepath
+    memo.clear()
+
+    cache_key = open_cache("Pyphen", version("pyphen"), filepath)
+    if cache_key is None: # with cache: loaded with the first word not in the cache
+        get_pyphen_dic()
 
 def get_pyphen( word:str, trace: bool = False ) -> str:
-    # global pyphen_dic
+    if not trace:
+        cached: str | None = memo.get(word)
+        if cached is not None:
+            return cached
+
+    result = hyphenate_word(word, trace)
+    memo[word] = result
+    return result
+
+def hyphenate_many( words: Iterable[str] ) -> List[str]:
+    """
+    ### same result as get_pyphen for each word (without trace)
+
+    the lookups are done once per call, the words are processed in chunks
+    """
+
+    if cache_key is not None:
+        return hyphenate_cached([cache_key], words, lambda missing: [hyphenate_words(missing)])[0]
+
+    return hyphenate_words(words)
+
+def hyphenate_masks( words: Iterable[str] ) -> List[Breaks]:
+    """
+    ### same result as hyphenate_many as mask (format_result( word, mask ) == hyphenate_many result)
+
+    with cache: the cached results are converted, the missing words are stored formatted
+    """
+
+    if cache_key is not None:
+        words = list(words)
+        return [mask_from_result(word, result) for word, result in zip(words, hyphenate_many(words), strict=True)]
+
+    return hyphenate_words_masks(words)
+
+# PRIVATE
+
+def hyphenate_word( word: str, trace: bool ) -> str:
+    if cache_key is not None and (cached := lookup(cache_key, word)) is not None:
+        if trace:
+            Trace.result(f"Pyphen:   {cached} (cache)")
+        return cached
 
     parts = word.split("-") # e.g. "Baden-Württemberg"
 
     result = []
     for part in parts:
-        result.append(pyphen_dic.inserted(part, "·"))
+        result.append(get_pyphen_dic().inserted(part, "·"))
 
     if trace:
         Trace.result(f"Pyphen:   {"-".join(result)}")
 
+    if cache_key is not None:
+        store_later(cache_key, word, "-".join(result))
+
     return f"{"-".join(result)}"
+
+def get_pyphen_dic() -> pyphen.Pyphen:
+    global pyphen_dic, nonstandard
+
+    if pyphen_dic is None:
+        pyphen_dic = load_pyphen_dic(pyphen_path)
+        nonstandard = any(type(value) is not int for _, values in pyphen_dic.hd.patterns.values() for value in values)
+
+    return pyphen_dic
+
+@duration("Pyphen load")
+def load_pyphen_dic( filepath: Path ) -> pyphen.Pyphen:
+    dic = pyphen.Pyphen(filename=filepath)
+    if not isinstance(dic.hd.cache, LRUCache): # HyphDict is shared by all Pyphen objects of the same file
+        dic.hd.cache = LRUCache(max_entries=POSITIONS_ENTRIES)
+    return dic
+
+def hyphenate_words( words: Iterable[str] ) -> List[str]:
+    inserted = get_pyphen_dic().inserted
+
+    result: List[str] = []
+    iterator = iter(words)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        result.extend([
+            inserted(word, "·") if "-" not in word else "-".join([inserted(part, "·") for part in word.split("-")])
+            for word in chunk
+        ])
+
+    return result
+
+def hyphenate_words_masks( words: Iterable[str] ) -> List[Breaks]:
+    positions = get_pyphen_dic().positions
+
+    if nonstandard: # e.g. "ff=f" -> the letters change
+        words = list(words)
+        return [mask_from_result(word, result) for word, result in zip(words, hyphenate_words(words), strict=True)]
+
+    def word_mask( word: str ) -> int:
+        mask = 0
+        offset = 0
+        for part in word.split("-"):
+            mask |= mask_from_positions(positions(part), offset)
+            offset += len(part) + 1
+        return mask
+
+    result: List[Breaks] = []
+    iterator = iter(words)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        result.extend([
+            mask_from_positions(positions(word)) if "-" not in word else word_mask(word)
+            for word in chunk
+        ])
+
+    return result
@@ -3,38 +3,72 @@
 
     src/helper/samples.py
 
-    samples -> settings/settings.yaml
+    samples -> settings/settings.yaml (helper/settings.py: loaded once)
      - AlleDeutschenWoerter: https://github.com/cpos/AlleDeutschenWoerter
      - wortliste:            https://github.com/davidak/wortliste
      - german_words:         https://github.com/0LL13/german_words
      - wordlist-german:      https://gist.github.com/MarvinJWendt/2f4f4154b8ae218600eb091a5706b5f4
      - de_DE_frami:          https://github.com/LibreOffice/dictionaries/tree/master/de
+     - de_DE_frami_forms:    de_DE_frami.dic expanded with de_DE_frami.aff (helper/affix.py)
+
+    import_samples: all words, sorted (sets)
+     - dic/text/hunspell: compiled once to results/.cache/<language>/<sample>.wlc (helper/wordlist.py),
+       the next imports read the .wlc (no parsing) until a source file, the settings entry or the parser changes
+    stream_samples: generator - each word once, in file order, as soon as it is read
+     - dedup: SeenWords (64-bit hashes in an open addressing table, ~16 bytes per word, the words are not kept)
 
     PUBLIC:
+     - SUB_SETS: Dict[str, List[str]]
      - import_samples( sample_name: str, sub_samples: List[str] | None = None, language: str = "#" ) -> Tuple[str, List[str] | Set[str]]
+     - stream_samples( sample_name: str, sub_samples: List[str] | None = None, language: str = "#", dedup: bool = True ) -> Iterator[str]
+
+    class SeenWords:
+     - SeenWords( capacity: int = 1024 )
+     - SeenWords.add( word: str ) -> bool  # False: already seen
 
     PRIVATE:
+     - read_samples( sample: SampleSet, dirpath: Path ) -> Iterator[str]
      - import_samples_yaml( dirpath: Path, filename: str, sub_samples: List[str] ) -> List[str]
-     - import_samples_dictionary( dirpath: Path, filename: str, encoding: str ) -> Set[str]
-     - import_samples_text( dirpath: Path, filename: str, encoding: str ) -> Set[str]
+     - import_samples_dictionary( dirpath: Path, filename: str, encoding: str ) -> Iterator[str]
+     - import_samples_text( dirpath: Path, filename: str, encoding: str ) -> Iterator[str]
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Set, Tuple
+import hashlib
+
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
 
 import yaml
 
+from result import is_ok
 from yaml.parser import ParserError
 
+from helper.affix import expand_dictionary
+from helper.settings import YAMLLoader, get_sample
+from helper.wordlist import read_wordlist, source_signature, write_wordlist
 from utils.decorator import duration
 from utils.globals import BASE_PATH
 from utils.trace import Trace
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterator
+
+    from helper.settings import SampleSet
 
-SETTING_DIR = BASE_PATH / "settings"
 SAMPLES_DIR = BASE_PATH / "samples"
+CACHE_DIR   = BASE_PATH / "results" / ".cache"
+
+# type "yaml": the sub sets of a complete run (main.py check_all, benchmarks/engines.py)
+
+SUB_SETS: Dict[str, List[str]] = {
+    "samples": ["test_patch", "dashes", "upper", "special", "corrected", "wrong"],
+}
+
+# part of the .wlc signature: a changed parser (this file, helper/affix.py) invalidates the compiled word lists
+
+PARSER_VERSION = hashlib.blake2b(b"".join(Path(__file__).with_name(name).read_bytes() for name in ("samples.py", "affix.py")), digest_size=8).hexdigest()
 
 # PUBLIC
 
@@ -44,17 +78,8 @@ def import_samples( sample_name: str, sub_samples: List[str] | None = None, lang
     if sub_samples is None:
         sub_samples = []
 
-    settings: Any = {}
-    try:
-        with (SETTING_DIR / "settings.yaml").open(mode="r", encoding="utf-8") as file:
-            settings = yaml.safe_load(file)
-    except ParserError as err:
-        Trace.fatal(f"settings.yaml: {err}")
-
-    sample   = settings[sample_name]
-    type     = sample["type"]
-    encoding = sample["encoding"]
-    files    = sample["files"]
+    sample = get_sample(sample_name)
+    type, files = sample.type, sample.files
 
     if type == "yaml":
         words_yaml: List[str] = []
@@ -64,28 +89,125 @@ def import_samples( sample_name: str, sub_samples: List[str] | None = None, lang
         Trace.info(f"{sample_name}-{type}: {len(words_yaml)} samples"  )
         return (sample_name, words_yaml)
 
-    elif type == "dic":
-        words_dict: Set[str] = set()
-        for file in files:
-            words_dict = words_dict | import_samples_dictionary(SAMPLES_DIR / language / sample_name, str(file), encoding)
+    elif type in ("dic", "text", "hunspell"):
+        dirpath = SAMPLES_DIR / language / sample.directory
+        cache_path = CACHE_DIR / language / f"{sample_name}.wlc"
 
-        Trace.info(f"{sample_name}-{type}: {len(words_dict)} samples"  )
-        return (sample_name, sorted(words_dict))
+        signature = source_signature([dirpath / str(file) for file in files], f"{PARSER_VERSION}\0{type}\0{sample.encoding}\0{files}")
+        if is_ok(signature):
+            compiled = read_wordlist(cache_path, signature.ok_value)
+            if is_ok(compiled):
+                words_cached = list(compiled.ok_value)
+                compiled.ok_value.close()
 
-    elif type == "text":
-        words_text: Set[str] = set()
-        for file in files:
-            words_text = words_text | import_samples_text(SAMPLES_DIR / language / sample_name, str(file), encoding)
+                Trace.info(f"{sample_name}-{type}: {len(words_cached)} samples (compiled)"  )
+                return (sample_name, words_cached)
+
+        words = sorted(set(read_samples(sample, dirpath)))
+        if is_ok(signature) and words:
+            write_wordlist(cache_path, words, signature.ok_value)
 
-        Trace.info(f"{sample_name}-{type}: {len(words_text)} samples"  )
-        return (sample_name, sorted(words_text))
+        Trace.info(f"{sample_name}-{type}: {len(words)} samples"  )
+        return (sample_name, words)
 
     else:
         Trace.fatal(f"unknown type '{type}'")
         return (sample_name, [])
 
+def stream_samples( sample_name: str, sub_samples: List[str] | None = None, language: str = "#", dedup: bool = True ) -> Iterator[str]:
+    """
+    ### words of a sample set - lazy, in file order (not sorted)
+
+    #### Arguments
+     - sample_name: e.g. "wortliste"
+     - sub_samples: type "yaml" (e.g. ["test_patch", "upper"])
+     - language: e.g. "de_DE"
+     - dedup: each word only once (all types, e.g. a word in several yaml sub sets)
+
+    #### Return
+     - generator of words
+    """
+
+    if sub_samples is None:
+        sub_samples = []
+
+    sample = get_sample(sample_name)
+    seen = SeenWords()
+
+    if sample.type == "yaml":
+        for file in sample.files:
+            for word in import_samples_yaml(SAMPLES_DIR / language, str(file), sub_samples):
+                if not dedup or seen.add(word):
+                    yield word
+        return
+
+    count = 0
+    for word in read_samples(sample, SAMPLES_DIR / language / sample.directory):
+        if not dedup or seen.add(word):
+            count += 1
+            yield word
+
+    Trace.info(f"{sample_name}-{sample.type}: {count} samples (stream)")
+
+class SeenWords:
+    """
+    ### set of words without the words - open addressing table of 64-bit hashes (array 'Q', linear probing)
+
+    a hash collision would drop a word, probability ~ n² / 2^65 (wortliste: ~1e-9)
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.table = array("Q", bytes(8 * capacity)) # capacity: power of 2, 0 = empty
+        self.mask  = capacity - 1
+        self.count = 0
+
+    def add(self, word: str) -> bool:
+        key = (hash(word) & 0xFFFFFFFFFFFFFFFF) or 1
+        table = self.table
+        mask = self.mask
+
+        i = key & mask
+        while table[i]:
+            if table[i] == key:
+                return False
+            i = (i + 1) & mask
+
+        table[i] = key
+        self.count += 1
+        if 2 * self.count > mask:
+            self.grow()
+        return True
+
+    def grow(self) -> None:
+        old = self.table
+        self.table = table = array("Q", bytes(16 * len(old)))
+        self.mask = mask = len(table) - 1
+
+        for key in old:
+            if key:
+                i = key & mask
+                while table[i]:
+                    i = (i + 1) & mask
+                table[i] = key
+
 # PRIVATE
 
+def read_samples( sample: SampleSet, dirpath: Path ) -> Iterator[str]:
+    if sample.type == "dic":
+        for file in sample.files:
+            yield from import_samples_dictionary(dirpath, str(file), sample.encoding)
+
+    elif sample.type == "text":
+        for file in sample.files:
+            yield from import_samples_text(dirpath, str(file), sample.encoding)
+
+    elif sample.type == "hunspell":
+        dic_file, aff_file = sample.files
+        yield from expand_dictionary(dirpath / dic_file, dirpath / aff_file, sample.encoding)
+
+    else:
+        Trace.fatal(f"unknown type '{sample.type}'")
+
 # YAML (samples.yaml)
 
 def import_samples_yaml( dirpath: Path, filename: str, sub_samples: List[str] ) -> List[str]:
@@ -94,7 +216,7 @@ def import_samples_yaml( dirpath: Path, filename: str, sub_samples: List[str] )
     samples: Any = {}
     try:
         with (dirpath / filename).open(mode="r", encoding="utf-8") as file:
-            samples = yaml.safe_load(file)
+            samples = yaml.load(file, Loader=YAMLLoader)  # noqa: S506
 
     except OSError as err:
         Trace.error(f"{err}")
@@ -116,9 +238,7 @@ def import_samples_yaml( dirpath: Path, filename: str, sub_samples: List[str] )
 
 # DICTIONARY (de_DE_frami)
 
-def import_samples_dictionary( dirpath: Path, filename: str, encoding: str ) -> Set[str]:
-    words = set()
-
+def import_samples_dictionary( dirpath: Path, filename: str, encoding: str ) -> Iterator[str]:
     try:
         with (dirpath / filename).open(mode="r", encoding=encoding) as file:
             for i, line in enumerate(file):
@@ -126,19 +246,14 @@ def import_samples_dictionary( dirpath: Path, filename: str, encoding: str ) ->
                 if i==0 or len(line) == 0 or line.startswith("#") :
                     continue
 
-                word = line.split("/")[0]
-                words.add(word)
+                yield line.split("/")[0]
 
     except OSError as err:
         Trace.error(f"{err}")
 
-    return words
-
 # TEXT (AlleDeutschenWoerter, german_words, wordlist-german, wortliste)
 
-def import_samples_text( dirpath: Path, filename: str, encoding: str ) -> Set[str]:
-    words = set()
-
+def import_samples_text( dirpath: Path, filename: str, encoding: str ) -> Iterator[str]:
     try:
         with (dirpath / filename).open(mode="r", encoding=encoding) as file:
             for line in file:
@@ -156,9 +271,7 @@ def import_samples_text( dirpath: Path, filename: str, encoding: str ) -> Set[st
                     if len(part) == 0:
                         continue
 
-                    words.add(part)
+                    yield part
 
     except OSError as err:
         Trace.error(f"{err}")
-
-    return words
@@ -0,0 +1,112 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 19:00
+
+    src/helper/settings.py
+
+    sample registry - settings/settings.yaml is loaded and validated once per process
+     - LibYAML (yaml.CSafeLoader) if available, else yaml.SafeLoader
+     - each entry: type ("yaml", "dic", "text", "hunspell"), encoding (Python codec), files (non-empty list)
+     - optional: directory (default: sample name), e.g. the .dic/.aff of an other sample
+     - hunspell: files = [<name>.dic, <name>.aff] -> all word forms (helper/affix.py)
+
+    PUBLIC:
+     - SampleSet( name, type, encoding, files, directory ) - NamedTuple
+     - get_sample( sample_name: str ) -> SampleSet
+     - sample_names() -> List[str]
+     - reload_settings() -> None
+     - YAMLLoader: yaml.CSafeLoader | yaml.SafeLoader
+
+    PRIVATE:
+     - load_settings() -> Dict[str, SampleSet]
+     - validate_sample( sample_name: str, entry: Any ) -> SampleSet
+"""
+from __future__ import annotations
+
+import codecs
+
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+import yaml
+
+from utils.globals import BASE_PATH
+from utils.trace import Trace
+
+SETTINGS_FILE = BASE_PATH / "settings" / "settings.yaml"
+
+SAMPLE_TYPES = ("yaml", "dic", "text", "hunspell")
+
+YAMLLoader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+class SampleSet(NamedTuple):
+    name:      str
+    type:      str
+    encoding:  str
+    files:     Tuple[str, ...]
+    directory: str
+
+registry: Dict[str, SampleSet] | None = None
+
+def get_sample( sample_name: str ) -> SampleSet:
+    global registry
+
+    if registry is None:
+        registry = load_settings()
+
+    if sample_name not in registry:
+        Trace.fatal(f"settings.yaml: unknown sample '{sample_name}'")
+
+    return registry[sample_name]
+
+def sample_names() -> List[str]:
+    global registry
+
+    if registry is None:
+        registry = load_settings()
+
+    return list(registry)
+
+def reload_settings() -> None:
+    global registry
+    registry = None
+
+# PRIVATE
+
+def load_settings() -> Dict[str, SampleSet]:
+    settings: Any = {}
+    try:
+        with SETTINGS_FILE.open(mode="r", encoding="utf-8") as file:
+            settings = yaml.load(file, Loader=YAMLLoader)  # noqa: S506
+    except OSError as err:
+        Trace.fatal(f"settings.yaml: {err}")
+    except yaml.YAMLError as err:
+        Trace.fatal(f"settings.yaml: {err}")
+
+    if not isinstance(settings, dict):
+        Trace.fatal("settings.yaml: mapping 'sample name -> settings' expected")
+
+    return {str(name): validate_sample(str(name), entry) for name, entry in settings.items()}
+
+def validate_sample( sample_name: str, entry: Any ) -> SampleSet:
+    if not isinstance(entry, dict):
+        Trace.fatal(f"settings.yaml '{sample_name}': mapping expected")
+
+    type = entry.get("type")
+    if type not in SAMPLE_TYPES:
+        Trace.fatal(f"settings.yaml '{sample_name}': unknown type '{type}' (expected {", ".join(SAMPLE_TYPES)})")
+
+    encoding = entry.get("encoding")
+    try:
+        codecs.lookup(str(encoding))
+    except LookupError:
+        Trace.fatal(f"settings.yaml '{sample_name}': unknown encoding '{encoding}'")
+
+    files = entry.get("files")
+    if not isinstance(files, list) or len(files) == 0:
+        Trace.fatal(f"settings.yaml '{sample_name}': 'files' must be a non-empty list")
+
+    if type == "hunspell" and [str(file).rsplit(".", 1)[-1] for file in files] != ["dic", "aff"]:
+        Trace.fatal(f"settings.yaml '{sample_name}': hunspell 'files' must be [<name>.dic, <name>.aff]")
+
+    directory = entry.get("directory", sample_name)
+
+    return SampleSet(sample_name, str(type), str(encoding), tuple(str(file) for file in files), str(directory))
@@ -0,0 +1,189 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 18:05
+
+    src/helper/wordlist.py
+
+    compiled word lists (.wlc) - deduplicated, sorted sample sets, results/.cache/<language>/<sample>.wlc
+
+    layout (little-endian, 4-byte aligned):
+     - header:  magic "WLC1", version, crc32 of the body, signature of the sources, number of words, blob size
+     - offsets: uint32 (words + 1), word i = blob[offsets[i] : offsets[i + 1] - 1]
+     - blob:    UTF-8 words, each terminated by "\\n"
+
+    signature: blake2b of the settings entry (type, encoding, files), the parser version (helper/samples.py)
+    and name, size, mtime of each source file -> a changed source, settings.yaml entry or parser invalidates the .wlc
+
+    PUBLIC:
+     - source_signature( sources: List[Path], settings: str ) -> Result[bytes, str]
+     - read_wordlist( filepath: Path, signature: bytes ) -> Result[WordList, str]
+     - write_wordlist( filepath: Path, words: List[str], signature: bytes ) -> Result[str, str]
+
+    class WordList:
+     - WordList( data: mmap.mmap, count: int, blob_offset: int )
+     - len(WordList), WordList[i] (mmap, no parsing), iter(WordList) (one decode)
+     - WordList.close() -> None
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+from array import array
+from typing import TYPE_CHECKING, List
+
+from result import Err, Ok, Result
+
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+MAGIC   = b"WLC1"
+VERSION = 1
+
+# magic, version, crc32(body), signature, words, blob size
+HEADER = struct.Struct("<4sII16sII")
+
+class WordList:
+    """
+    ### word list of a mapped .wlc file
+    """
+
+    def __init__(self, data: mmap.mmap, count: int, blob_offset: int) -> None:
+        self.data        = data
+        self.count       = count
+        self.offsets     = memoryview(data)[HEADER.size : HEADER.size + 4 * (count + 1)].cast("I")
+        self.blob_offset = blob_offset
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> str:
+        if not -self.count <= index < self.count:
+            error = "WordList index out of range"
+            raise IndexError(error)
+
+        index %= self.count
+        start = self.blob_offset + self.offsets[index]
+        end   = self.blob_offset + self.offsets[index + 1] - 1
+        return self.data[start:end].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        if self.count == 0:
+            return iter([])
+
+        return iter(self.data[self.blob_offset : self.blob_offset + self.offsets[self.count] - 1].decode("utf-8").split("\n"))
+
+    def close(self) -> None:
+        self.offsets.release()
+        self.data.close()
+
+def source_signature( sources: List[Path], settings: str ) -> Result[bytes, str]:
+    signature = hashlib.blake2b(f"{VERSION}\0{settings}".encode(), digest_size=16)
+
+    for source in sources:
+        try:
+            stat = source.stat()
+        except OSError as e:
+            return Err(f"{e}")
+
+        signature.update(f"\0{source.name}\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+
+    return Ok(signature.digest())
+
+def read_wordlist( filepath: Path, signature: bytes ) -> Result[WordList, str]:
+    """
+    ### map a compiled word list
+
+    #### Arguments
+     - filepath: Path of the .wlc file
+     - signature: source_signature of the current sources
+
+    #### Return [rustedpy]
+     - Ok: WordList (close() after use)
+     - Err: errortext as str
+    """
+
+    if not filepath.exists():
+        return Err(f"'{filepath}' does not exist")
+
+    if sys.byteorder != "little":
+        return Err("'.wlc' needs a little-endian system")
+
+    try:
+        with filepath.open(mode="rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        return Err(f"{e}")
+
+    if len(data) < HEADER.size:
+        data.close()
+        return Err(f"'{filepath}' is truncated")
+
+    magic, version, checksum, file_signature, count, blob_size = HEADER.unpack_from(data, 0)
+
+    error = ""
+    blob_offset = HEADER.size + 4 * (count + 1)
+    if magic != MAGIC:
+        error = f"'{filepath}' is not a .wlc file"
+    elif version != VERSION:
+        error = f"'{filepath}' version {version} (expected {VERSION})"
+    elif file_signature != signature:
+        error = f"'{filepath}' is outdated"
+    elif blob_offset + blob_size != len(data):
+        error = f"'{filepath}' has a wrong size"
+    elif zlib.crc32(memoryview(data)[HEADER.size:]) != checksum:
+        error = f"'{filepath}' checksum error"
+
+    if error:
+        data.close()
+        return Err(error)
+
+    return Ok(WordList(data, count, blob_offset))
+
+def write_wordlist( filepath: Path, words: List[str], signature: bytes ) -> Result[str, str]:
+    """
+    ### write a compiled word list (atomic: temp file + rename)
+
+    #### Arguments
+     - filepath: Path of the .wlc file
+     - words: deduplicated, sorted words (without "\\n")
+     - signature: source_signature of the sources
+
+    #### Return [rustedpy]
+     - Ok: -
+     - Err: errortext as str
+    """
+
+    if sys.byteorder != "little":
+        return Err("'.wlc' needs a little-endian system")
+
+    encoded = [word.encode("utf-8") + b"\n" for word in words]
+
+    offsets = array("I", [0])
+    position = 0
+    for word in encoded:
+        position += len(word)
+        offsets.append(position)
+
+    body = offsets.tobytes() + b"".join(encoded)
+    header = HEADER.pack(MAGIC, VERSION, zlib.crc32(body), signature, len(words), position)
+
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    try:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open(mode="wb") as file:
+            file.write(header)
+            file.write(body)
+        tmp_path.replace(filepath)
+    except OSError as e:
+        Trace.debug(f"{e}")
+        return Err(f"{e}")
+
+    Trace.update(f"'{filepath}' created")
+    return Ok("")
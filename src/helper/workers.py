@@ -0,0 +1,216 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 15:00
+
+    src/helper/workers.py
+
+    hyphenate a word list with several engines - each (engine, word) once
+     - workers > 1: the word list is split into contiguous chunks (CHUNKS_PER_WORKER per worker),
+       each worker (ProcessPoolExecutor) initializes its dictionaries once (initializer),
+       the chunks are returned in the original order -> same results as the serial run
+     - engines sharing a dictionary with a different init (Liang, Liang-Compound) run in separate rounds
+     - "PyHyphen-NoPatch" + "PyHyphen" are one task (only title case parts are hyphenated twice)
+     - the workers use the cache setting of the main process (helper/cache.py)
+     - hyphenate_stream: chunks of CHUNK_SIZE words, at most workers * CHUNKS_PER_WORKER chunks in flight,
+       the results are yielded in order as soon as their chunk is done (-> utils/files.py write_json_stream)
+     - hyphenate_parallel_masks: same as hyphenate_parallel with break masks (helper/breaks.py)
+       -> ints instead of strings between the processes, formatted only for the output
+     - processes, not threads: hyphen.c (PyHyphen) does not release the GIL (benchmarks/pool_modes.py)
+
+    engines:
+     - "Pyphen", "PyHyphen" (with patch), "PyHyphen-NoPatch", "Liang", "Liang-Compound"
+
+    PUBLIC:
+     - hyphenate_parallel( engines: List[str], language: str, words: List[str], workers: int = 1 ) -> Dict[str, List[str]]
+     - hyphenate_parallel_masks( engines: List[str], language: str, words: List[str], workers: int = 1 ) -> Dict[str, List[Breaks]]
+     - hyphenate_stream( engine: str, language: str, words: Iterable[str], workers: int = 1 ) -> Iterator[Tuple[str, str]]
+
+    PRIVATE:
+     - run_rounds( engines: List[str], language: str, words: List[str], workers: int, masks: bool ) -> Dict[str, List[Any]]
+     - plan_rounds( engines: List[str] ) -> List[List[Tuple[str, ...]]]
+     - init_worker( tasks: List[Tuple[str, ...]], language: str, cache: bool, masks: bool = False ) -> None
+     - hyphenate_chunk( words: List[str] ) -> List[List[Any]]
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Sequence, Tuple
+
+from helper.cache import cache_enabled, use_cache
+from helper.liang import hyphenate_many as hyphenate_liang
+from helper.liang import hyphenate_masks as hyphenate_liang_masks
+from helper.liang import init_liang
+from helper.pyhyphen import hyphenate_many as hyphenate_pyhyphen
+from helper.pyhyphen import hyphenate_masks as hyphenate_pyhyphen_masks
+from helper.pyhyphen import hyphenate_patch_modes, hyphenate_patch_modes_masks, init_pyhyphen
+from helper.pyphen import hyphenate_many as hyphenate_pyphen
+from helper.pyphen import hyphenate_masks as hyphenate_pyphen_masks
+from helper.pyphen import init_pyphen
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
+    from helper.breaks import Breaks
+
+CHUNKS_PER_WORKER = 4
+CHUNK_SIZE = 4096 # hyphenate_stream
+
+# engine -> dictionary (module global), init( language ), hyphenate_many( words ), hyphenate_masks( words )
+
+ENGINES: Dict[str, Tuple[str, Callable[[str], None], Callable[[List[str]], List[str]], Callable[[List[str]], List[Breaks]]]] = {
+    "Pyphen":           ("Pyphen",   init_pyphen, hyphenate_pyphen, hyphenate_pyphen_masks),
+    "PyHyphen":         ("PyHyphen", init_pyhyphen, hyphenate_pyhyphen, hyphenate_pyhyphen_masks),
+    "PyHyphen-NoPatch": ("PyHyphen", init_pyhyphen, partial(hyphenate_pyhyphen, patch=False), partial(hyphenate_pyhyphen_masks, patch=False)),
+    "Liang":            ("Liang",    init_liang, hyphenate_liang, hyphenate_liang_masks),
+    "Liang-Compound":   ("Liang",    partial(init_liang, compound=True), hyphenate_liang, hyphenate_liang_masks),
+}
+
+# engines -> one call for all of them (strings, masks)
+
+COMBINED: Dict[Tuple[str, ...], Tuple[Callable[[List[str]], Sequence[List[str]]], Callable[[List[str]], Sequence[List[Breaks]]]]] = {
+    ("PyHyphen-NoPatch", "PyHyphen"): (hyphenate_patch_modes, hyphenate_patch_modes_masks),
+}
+
+worker_tasks: List[Callable[[List[str]], Sequence[List[Any]]]] = []
+
+def hyphenate_parallel( engines: List[str], language: str, words: List[str], workers: int = 1 ) -> Dict[str, List[str]]:
+    """
+    ### hyphenate all words with each engine
+
+    #### Arguments
+     - engines: e.g. ["Pyphen", "PyHyphen"]
+     - language: e.g. "de_DE"
+     - words: word list
+     - workers: number of processes (1: in this process)
+
+    #### Return
+     - {engine: results (same order as words)}
+    """
+
+    return run_rounds(engines, language, words, workers, masks=False)
+
+def hyphenate_parallel_masks( engines: List[str], language: str, words: List[str], workers: int = 1 ) -> Dict[str, List[Breaks]]:
+    """
+    ### hyphenate_parallel with break masks (format_result( word, mask ) -> result of hyphenate_parallel)
+    """
+
+    return run_rounds(engines, language, words, workers, masks=True)
+
+def hyphenate_stream( engine: str, language: str, words: Iterable[str], workers: int = 1 ) -> Iterator[Tuple[str, str]]:
+    """
+    ### hyphenate a word stream - starts with the first chunk
+
+    #### Arguments
+     - engine: e.g. "Pyphen"
+     - language: e.g. "de_DE"
+     - words: e.g. stream_samples( "wortliste", language="de_DE" )
+     - workers: number of processes (1: in this process)
+
+    #### Return
+     - generator of (word, result) - same order as words
+    """
+
+    if engine not in ENGINES:
+        Trace.fatal(f"unknown package name '{engine}'")
+
+    iterator = iter(words)
+
+    if workers <= 1:
+        _, init, hyphenate, _ = ENGINES[engine]
+        init(language)
+
+        while chunk := list(islice(iterator, CHUNK_SIZE)):
+            yield from zip(chunk, hyphenate(chunk), strict=True)
+        return
+
+    tasks: List[Tuple[str, ...]] = [(engine,)]
+    pending: Deque[Tuple[List[str], Future[List[List[str]]]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(tasks, language, cache_enabled())) as executor:
+        while chunk := list(islice(iterator, CHUNK_SIZE)):
+            pending.append((chunk, executor.submit(hyphenate_chunk, chunk)))
+            if len(pending) >= workers * CHUNKS_PER_WORKER:
+                done, future = pending.popleft()
+                yield from zip(done, future.result()[0], strict=True)
+
+        while pending:
+            done, future = pending.popleft()
+            yield from zip(done, future.result()[0], strict=True)
+
+# PRIVATE
+
+def run_rounds( engines: List[str], language: str, words: List[str], workers: int, masks: bool ) -> Dict[str, List[Any]]:
+    for engine in engines:
+        if engine not in ENGINES:
+            Trace.fatal(f"unknown package name '{engine}'")
+
+    results: Dict[str, List[Any]] = {}
+    for tasks in plan_rounds(engines):
+        names = [engine for task in tasks for engine in task]
+
+        if workers <= 1:
+            init_worker(tasks, language, cache_enabled(), masks)
+            results.update(zip(names, hyphenate_chunk(words), strict=True))
+            continue
+
+        size = max(1, -(-len(words) // (workers * CHUNKS_PER_WORKER)))
+        chunks = [words[i : i + size] for i in range(0, len(words), size)]
+
+        for engine in names:
+            results[engine] = []
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(tasks, language, cache_enabled(), masks)) as executor:
+            for chunk_results in executor.map(hyphenate_chunk, chunks):
+                for engine, result in zip(names, chunk_results, strict=True):
+                    results[engine].extend(result)
+
+    return {engine: results[engine] for engine in engines}
+
+def plan_rounds( engines: List[str] ) -> List[List[Tuple[str, ...]]]:
+    rounds: List[List[Tuple[str, ...]]] = []
+
+    pending = list(dict.fromkeys(engines))
+    while pending:
+        loaded: Dict[str, Callable[[str], None]] = {}
+        tasks: List[Tuple[str, ...]] = []
+        later: List[str] = []
+
+        for engine in pending:
+            dictionary, init, _, _ = ENGINES[engine]
+            if loaded.setdefault(dictionary, init) is init:
+                tasks.append((engine,))
+            else:
+                later.append(engine)
+
+        for combined in COMBINED:
+            if all((engine,) in tasks for engine in combined):
+                tasks = [task for task in tasks if task[0] not in combined] + [combined]
+
+        rounds.append(tasks)
+        pending = later
+
+    return rounds
+
+def init_worker( tasks: List[Tuple[str, ...]], language: str, cache: bool, masks: bool = False ) -> None:
+    use_cache(cache)
+    worker_tasks.clear()
+
+    inits: List[Callable[[str], None]] = []
+    for task in tasks:
+        for engine in task:
+            _, init, _, _ = ENGINES[engine]
+            if init not in inits:
+                init(language)
+                inits.append(init)
+
+        if len(task) > 1:
+            worker_tasks.append(COMBINED[task][1 if masks else 0])
+        else:
+            hyphenate = ENGINES[task[0]][3 if masks else 2]
+            worker_tasks.append(lambda words, hyphenate=hyphenate: (hyphenate(words),)) # type: ignore[misc]
+
+def hyphenate_chunk( words: List[str] ) -> List[List[Any]]:
+    return [result for task in worker_tasks for result in task(words)]
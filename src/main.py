@@ -8,66 +8,142 @@
 """
 from __future__ import annotations
 
+import os
 import sys
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
-from result import is_err  #, is_ok
+from result import is_err, is_ok
 
+from helper.analysis import analyze
+from helper.breaks import Breaks, format_result, format_results
+from helper.cache import use_cache
+from helper.columns import Columns, write_columns
+from helper.latency import LatencyRecorder
+from helper.liang import get_liang, init_liang  # -> pure python (aho-corasick, compound like hyphen.c)
+from helper.liang import hyphenate_many as hyphenate_liang
 from helper.pyhyphen import get_pyhyphen, init_pyhyphen  # -> hyphen.c
+from helper.pyhyphen import hyphenate_many as hyphenate_pyhyphen
 from helper.pyphen import get_pyphen, init_pyphen  # -> pure python
-from helper.samples import import_samples
+from helper.pyphen import hyphenate_many as hyphenate_pyphen
+from helper.samples import SUB_SETS, import_samples, stream_samples
+from helper.workers import hyphenate_parallel_masks, hyphenate_stream  # -> ProcessPoolExecutor
 from utils.decorator import duration
-from utils.files import write_file
+from utils.files import write_file, write_json_stream
 from utils.globals import BASE_PATH
 from utils.trace import Color, Trace
 
 RESULT_DIR = BASE_PATH / "results"
 
+WORKERS = os.cpu_count() or 1  # large sets: one process per cpu
+
+USE_CACHE = False # True: results are kept in results/hyphenation.sqlite (helper/cache.py)
+
+ALL_ENGINES = ["PyHyphen-NoPatch", "PyHyphen", "Pyphen", "Liang", "Liang-Compound"]
+
 """
     check_samples("PyHyphen", "de_DE", "samples", ["test_patch, special, dashes, upper"])
     check_samples("PyHyphen", "de_DE", "AlleDeutschenWoerter")
     check_samples("PyHyphen", "de_DE", "wortliste")
     check_samples("PyHyphen", "de_DE", "german_words")
     check_samples("PyHyphen", "de_DE", "de_DE_frami")
+    check_samples("PyHyphen", "de_DE", "wortliste", workers=8)
+    check_samples("PyHyphen", "de_DE", "wortliste", stream=True)
+    check_samples("PyHyphen", "de_DE", "wortliste", latency=True)
 
     check_samples("Pyphen", "de_DE", "samples", ["test_patch, special, dashes, upper"])
     check_samples("Pyphen", "de_DE", "AlleDeutschenWoerter")
     check_samples("Pyphen", "de_DE", "wortliste")
     check_samples("Pyphen", "de_DE", "german_words")
     check_samples("Pyphen", "de_DE", "de_DE_frami")
+    check_samples("Pyphen", "de_DE", "wortliste", latency=True)
+
+    check_samples("Liang", "de_DE", "samples", ["test_patch, special, dashes, upper"])
+    check_samples("Liang", "de_DE", "AlleDeutschenWoerter")
+    check_samples("Liang", "de_DE", "wortliste")
+    check_samples("Liang", "de_DE", "german_words")
+    check_samples("Liang", "de_DE", "de_DE_frami")
+
+    check_samples("Liang-Compound", "de_DE", "samples", ["test_patch, special, dashes, upper"])
+    check_samples("Liang-Compound", "de_DE", "AlleDeutschenWoerter")
+    check_samples("Liang-Compound", "de_DE", "wortliste")
+    check_samples("Liang-Compound", "de_DE", "german_words")
+    check_samples("Liang-Compound", "de_DE", "de_DE_frami")
 """
-def check_samples(package_name: str, language: str, set_name: str, sub_set: List[Any] | None = None, trace: bool = False ) -> None:
+# latency: each word timed -> {package_name}_LATENCY_{set_name}.json (helper/latency.py)
+# stream: file order -> {package_name}_STREAM_{set_name}.json (the sorted COMPLETE report is not replaced)
+
+def check_samples(package_name: str, language: str, set_name: str, sub_set: List[Any] | None = None, trace: bool = False, *, workers: int = 1, stream: bool = False, latency: bool = False ) -> None:
 
     if sub_set is None:
         sub_set = []
 
+    if not trace and not latency: # stream: file order, each word once (stream_samples) - else sorted
+        words = stream_samples(set_name, sub_set, language) if stream else list(dict.fromkeys(import_samples(set_name, sub_set, language)[1]))
+        test_stream(package_name, language, set_name, words, workers, report="STREAM" if stream else "COMPLETE")
+        return
+
     set_name, samples = import_samples(set_name, sub_set, language)
 
-    results: List[Any] = []
+    recorder = LatencyRecorder(package_name) if latency else None
+
+    results: Dict[str, str] = {}
     if package_name == "Pyphen":
-        results = test_pyphen(samples, language, trace)
+        results = test_pyphen(samples, language, trace, latency=recorder)
 
     elif package_name == "PyHyphen":
-        results = test_pyhyphen(samples, language, trace)
+        results = test_pyhyphen(samples, language, trace, latency=recorder)
+
+    elif package_name == "Liang":
+        results = test_liang(samples, language, trace, latency=recorder)
+
+    elif package_name == "Liang-Compound":
+        results = test_liang(samples, language, trace, compound=True, latency=recorder)
 
     else:
         Trace.fatal(f"unknown package name '{package_name}'")
 
-    filename = f"{package_name}_COMPLETE_{set_name}.json"
+    report_complete(package_name, language, set_name, results)
+
+    if recorder is not None:
+        report_latency(package_name, language, set_name, recorder)
+
+def report_complete(package_name: str, language: str, set_name: str, results: Dict[str, str] | Iterable[Tuple[str, str]], report: str = "COMPLETE") -> None:
+    filename = f"{package_name}_{report}_{set_name}.json"
     timestamp = (set_name == "samples")
 
-    ret = write_file(RESULT_DIR / language / set_name / filename, results, filename_timestamp=timestamp)
+    ret = write_json_stream(RESULT_DIR / language / set_name / filename, results.items() if isinstance(results, dict) else results, filename_timestamp=timestamp)
     if is_err(ret):
         Trace.error(f"Error: {ret.err_value}")
+    elif is_ok(ret):
+        Trace.result(f"results: {ret.ok_value}")
 
-    Trace.result(f"results: {len(results)}")
+def report_latency(package_name: str, language: str, set_name: str, recorder: LatencyRecorder) -> None:
+    report = recorder.report()
+
+    summary = report["summary"]
+    Trace.result(f"{package_name} latency: p50 {summary["p50"]} µs, p95 {summary["p95"]} µs, p99 {summary["p99"]} µs, max {summary["max"]} µs")
+    for slow in report["slowest"][:5]:
+        Trace.result(f"  {slow["time"]:>10} µs  {slow["word"]} ({slow["length"]})")
+
+    filename = f"{package_name}_LATENCY_{set_name}.json"
+    timestamp = (set_name == "samples")
+
+    ret = write_file(RESULT_DIR / language / set_name / filename, report, filename_timestamp=timestamp)
+    if is_err(ret):
+        Trace.error(f"Error: {ret.err_value}")
 
 @duration("Pyphen test all")
-def test_pyphen(words: Dict[str, str], language: str, trace:bool = True) -> Dict[str, str]:  # noqa: N802
+def test_pyphen(words: Dict[str, str], language: str, trace:bool = True, latency: LatencyRecorder | None = None) -> Dict[str, str]:  # noqa: N802
     Trace.action(f"{Color.BLUE}{Color.BOLD}Pyphen ...{Color.RESET}")
     init_pyphen(language)
 
+    if latency is not None:
+        return latency.measure(words, get_pyphen)
+
+    if not trace:
+        return dict(zip(words, hyphenate_pyphen(words), strict=True))
+
     result = {}
     for word in words:
         result[word] = get_pyphen(word, trace = trace)
@@ -75,16 +151,46 @@ def test_pyphen(words: Dict[str, str], language: str, trace:bool = True) -> Dict
     return result
 
 @duration("PyHyphen test all")
-def test_pyhyphen(words: Dict[str, str], language: str, trace:bool = True) -> Dict[str, str]:  # noqa: N802
+def test_pyhyphen(words: Dict[str, str], language: str, trace:bool = True, latency: LatencyRecorder | None = None) -> Dict[str, str]:  # noqa: N802
     Trace.action(f"{Color.BLUE}{Color.BOLD}PyHyphen with patch ...{Color.RESET}")
     init_pyhyphen(language)
 
+    if latency is not None:
+        return latency.measure(words, get_pyhyphen)
+
+    if not trace:
+        return dict(zip(words, hyphenate_pyhyphen(words), strict=True))
+
     result: Dict[str, str] = {}
     for word in words:
         result[word] = get_pyhyphen(word, trace = trace)
 
     return result
 
+@duration("Liang test all")
+def test_liang(words: Dict[str, str], language: str, trace:bool = True, compound: bool = False, latency: LatencyRecorder | None = None) -> Dict[str, str]:  # noqa: N802
+    Trace.action(f"{Color.BLUE}{Color.BOLD}Liang{" (compound)" if compound else ""} ...{Color.RESET}")
+    init_liang(language, compound=compound)
+
+    if latency is not None:
+        return latency.measure(words, get_liang)
+
+    if not trace:
+        return dict(zip(words, hyphenate_liang(words), strict=True))
+
+    result = {}
+    for word in words:
+        result[word] = get_liang(word, trace = trace)
+
+    return result
+
+@duration("stream test all")
+def test_stream(package_name: str, language: str, set_name: str, words: Iterable[str], workers: int, *, report: str = "COMPLETE") -> None:  # noqa: N802
+    Trace.action(f"{Color.BLUE}{Color.BOLD}{package_name}{f" ({workers} workers)" if workers > 1 else ""} ...{Color.RESET}")
+
+    # hyphenate and write chunk by chunk (no dict of all results), the words are unique
+    report_complete(package_name, language, set_name, hyphenate_stream(package_name, language, words, workers), report)
+
 """
     PyHyphen - check for patch 'mode=4'
 
@@ -94,25 +200,36 @@ def test_pyhyphen(words: Dict[str, str], language: str, trace:bool = True) -> Di
     compare_samples( "de_DE", "german_words")
     compare_samples( "de_DE", "de_DE_frami")
 """
-def check_patch_samples( language: str, set_name: str, sub_set: List[str] | None = None, trace: bool = False ) -> None:
+def check_patch_samples( language: str, set_name: str, sub_set: List[str] | None = None, trace: bool = False, *, workers: int = 1 ) -> None:
 
     if sub_set is None:
         sub_set = []
 
     set_name, samples = import_samples(set_name, sub_set, language)
 
-    difference: Dict[str, List[str]] = {}
-    identical: Dict[str, str] = {}
+    pairs: Iterator[Tuple[str, Breaks, Breaks]]
+    if workers > 1 and not trace:
+        Trace.action(f"{Color.BLUE}{Color.BOLD}PyHyphen without/with patch ({workers} workers) ...{Color.RESET}")
+        results = hyphenate_parallel_masks(["PyHyphen-NoPatch", "PyHyphen"], language, list(samples), workers)
+        pairs = zip(samples, results["PyHyphen-NoPatch"], results["PyHyphen"], strict=True)
+    else:
+        init_pyhyphen(language)
+        pairs = ((word, get_pyhyphen(word, trace = trace, patch = False), get_pyhyphen(word, trace = trace, patch=True)) for word in samples)
 
-    init_pyhyphen(language)
+    report_patch(language, set_name, pairs, trace)
+
+def report_patch(language: str, set_name: str, pairs: Iterator[Tuple[str, Breaks, Breaks]], trace: bool = False, *, total: int | None = None) -> None:
+    difference: Dict[str, List[str]] = {}
+    identical = 0
 
-    for word in samples:
-        result_no_patch = get_pyhyphen(word, trace = trace, patch = False)
-        result_patch = get_pyhyphen(word, trace = trace, patch=True)
+    for word, result_no_patch, result_patch in pairs: # masks: int comparison, only the differences are formatted
         if result_no_patch != result_patch:
-            difference[word] = [result_no_patch, result_patch]
+            difference[word] = [format_result(word, result_no_patch), format_result(word, result_patch)]
         else:
-            identical[word] = result_no_patch
+            identical += 1
+
+    if total is not None: # pairs: only the differences (difference_pairs)
+        identical = total - len(difference)
 
     if trace:
         for word in difference:
@@ -125,7 +242,7 @@ def check_patch_samples( language: str, set_name: str, sub_set: List[str] | None
     if is_err(ret):
         Trace.error(f"Error: {ret.err_value}")
 
-    Trace.result(f"all: {len(samples)}, identical: {len(identical)}, different: {len(difference)}")
+    Trace.result(f"all: {identical + len(difference)}, identical: {identical}, different: {len(difference)}")
 
 """
     Pyphen <-> PyHyphen (with patch)
@@ -136,33 +253,45 @@ def check_patch_samples( language: str, set_name: str, sub_set: List[str] | None
     compare_samples( "de_DE", "german_words")
     compare_samples( "de_DE", "de_DE_frami")
 """
-def compare_samples( language: str, set_name: str, sub_set: List[str] | None = None, trace: bool = False ) -> None:
+def compare_samples( language: str, set_name: str, sub_set: List[str] | None = None, trace: bool = False, *, workers: int = 1 ) -> None:
 
     if sub_set is None:
         sub_set = []
 
     set_name, samples = import_samples(set_name, sub_set, language)
 
-    difference: Dict[str, List[str]] = {}
-    identical: Dict[str, str] = {}
+    pairs: Iterator[Tuple[str, Breaks, Breaks]]
+    if workers > 1 and not trace:
+        Trace.action(f"{Color.BLUE}{Color.BOLD}Pyphen, PyHyphen with patch ({workers} workers) ...{Color.RESET}")
+        results = hyphenate_parallel_masks(["Pyphen", "PyHyphen"], language, list(samples), workers)
+        pairs = zip(samples, results["Pyphen"], results["PyHyphen"], strict=True)
+    else:
+        # Pyphen
 
-    # Pyphen
+        Trace.action(f"{Color.BLUE}{Color.BOLD}Pyphen ...{Color.RESET}")
+        init_pyphen(language)
 
-    Trace.action(f"{Color.BLUE}{Color.BOLD}Pyphen ...{Color.RESET}")
-    init_pyphen(language)
+        # PyHyphen
 
-    # PyHyphen
+        Trace.action(f"{Color.BLUE}{Color.BOLD}PyHyphen with patch...{Color.RESET}")
+        init_pyhyphen(language)
 
-    Trace.action(f"{Color.BLUE}{Color.BOLD}PyHyphen with patch...{Color.RESET}")
-    init_pyhyphen(language)
+        pairs = ((word, get_pyphen(word, trace = trace), get_pyhyphen(word, trace = trace, patch=True)) for word in samples)
+
+    report_diff(language, set_name, pairs, trace)
 
-    for word in samples:
-        result_pyphen = get_pyphen(word, trace = trace)
-        result_pyhyphen = get_pyhyphen(word, trace = trace, patch=True)
+def report_diff(language: str, set_name: str, pairs: Iterator[Tuple[str, Breaks, Breaks]], trace: bool = False, *, total: int | None = None) -> None:
+    difference: Dict[str, List[str]] = {}
+    identical = 0
+
+    for word, result_pyphen, result_pyhyphen in pairs: # masks: int comparison, only the differences are formatted
         if result_pyphen != result_pyhyphen:
-            difference[word] = [result_pyphen, result_pyhyphen]
+            difference[word] = [format_result(word, result_pyphen), format_result(word, result_pyhyphen)]
         else:
-            identical[word] = result_pyhyphen
+            identical += 1
+
+    if total is not None: # pairs: only the differences (difference_pairs)
+        identical = total - len(difference)
 
     if trace:
         for word in difference:
@@ -175,48 +304,89 @@ def compare_samples( language: str, set_name: str, sub_set: List[str] | None = N
     if is_err(ret):
         Trace.error(f"Error: {ret.err_value}")
 
-    Trace.result(f"all: {len(samples)}, identical: {len(identical)}, different: {len(difference)}")
+    Trace.result(f"all: {identical + len(difference)}, identical: {identical}, different: {len(difference)}")
 
-def main() -> None:
-    # PyHyphen - Patch (on, off)
+def report_columns(language: str, set_name: str, columns: Columns) -> None:
+    filename = f"COLUMNS_{set_name}.hyc" # all engines: words + hyphenation masks (helper/columns.py)
 
-    # check_patch_samples("de_DE", "samples", ["Fortschritt"], trace=True)
-    check_patch_samples("de_DE", "samples", ["test_patch", "dashes", "upper", "special", "corrected", "wrong"], trace=False)
-    check_patch_samples("de_DE", "AlleDeutschenWoerter")
-    check_patch_samples("de_DE", "wortliste")
-    check_patch_samples("de_DE", "german_words")
-    check_patch_samples("de_DE", "de_DE_frami")
-    check_patch_samples("de_DE", "wordlist-german")
+    ret = write_columns(RESULT_DIR / language / set_name / filename, columns)
+    if is_err(ret):
+        Trace.error(f"Error: {ret.err_value}")
+
+def report_analysis(language: str, set_name: str, columns: Columns, reference: str = "PyHyphen") -> None:
+    ret = analyze(columns, reference)
+    if is_err(ret):
+        Trace.warning(f"no analysis: {ret.err_value}") # e.g. NumPy not installed
+        return
 
-    # PyHyphen (mit Patch)
+    if is_ok(ret):
+        analysis = ret.ok_value
+        for engine, statistics in analysis["engines"].items():
+            if engine != reference:
+                Trace.result(f"{engine} <-> {reference}: identical {analysis["identical"][engine][reference]:.2%}, precision {statistics["precision"]:.4f}, recall {statistics["recall"]:.4f}")
 
-    # check_samples("PyHyphen", "de_DE", "samples", ["Fortschritt"], trace=True)
-    check_samples("PyHyphen", "de_DE", "samples", ["test_patch", "dashes", "upper", "special", "corrected", "wrong"], trace=False)
-    check_samples("PyHyphen", "de_DE", "AlleDeutschenWoerter")
-    check_samples("PyHyphen", "de_DE", "wortliste")
-    check_samples("PyHyphen", "de_DE", "german_words")
-    check_samples("PyHyphen", "de_DE", "de_DE_frami")
-    check_samples("PyHyphen", "de_DE", "wordlist-german")
+        filename = f"ANALYSIS_{set_name}.json"
+        timestamp = (set_name == "samples")
 
-    # Pyphen
+        ret_write = write_file(RESULT_DIR / language / set_name / filename, analysis, filename_timestamp=timestamp)
+        if is_err(ret_write):
+            Trace.error(f"Error: {ret_write.err_value}")
 
-    # check_samples("Pyphen", "de_DE", "samples", ["Fortschritt"], trace=True)
-    check_samples("Pyphen", "de_DE", "samples", ["test_patch", "dashes", "upper", "special", "corrected", "wrong"], trace=False)
-    check_samples("Pyphen", "de_DE", "AlleDeutschenWoerter")
-    check_samples("Pyphen", "de_DE", "wortliste")
-    check_samples("Pyphen", "de_DE", "german_words")
-    check_samples("Pyphen", "de_DE", "de_DE_frami")
-    check_samples("Pyphen", "de_DE", "wordlist-german")
+def difference_pairs(columns: Columns, engine_a: str, engine_b: str) -> Iterator[Tuple[str, Breaks, Breaks]]:
+    for i in columns.differences(engine_a, engine_b): # vectorized (NumPy)
+        yield columns.words[i], columns.result(engine_a, i), columns.result(engine_b, i)
 
-    # PyHyphen (with patch) <-> Pyphen
+"""
+    all reports in one pass - each (engine, patch, word) is hyphenated once:
+     - PyHyphen_PATCH, {PyHyphen, Pyphen, Liang, Liang-Compound}_COMPLETE, Pyphen-PyHyphen_DIFF
+     - COLUMNS (.hyc): all engines in one compact file
+     - ANALYSIS: identical, precision/recall, break positions of all engines against PyHyphen (helper/analysis.py)
 
+    check_all( "de_DE", "samples", ["test_patch", "special", "dashes", "upper"] )
+    check_all( "de_DE", "wortliste", workers=8 )
+"""
+def check_all( language: str, set_name: str, sub_set: List[str] | None = None, *, workers: int = 1 ) -> None:
+
+    if sub_set is None:
+        sub_set = []
+
+    set_name, samples = import_samples(set_name, sub_set, language)
+
+    words = list(samples)
+    results = test_all(ALL_ENGINES, words, language, workers)
+    columns = Columns.from_breaks(words, results)
+
+    report_patch(language, set_name, difference_pairs(columns, "PyHyphen-NoPatch", "PyHyphen"), total=len(words))
+
+    for package_name in ("PyHyphen", "Pyphen", "Liang", "Liang-Compound"): # formatted chunk by chunk while writing
+        report_complete(package_name, language, set_name, format_results(words, results[package_name]))
+
+    report_diff(language, set_name, difference_pairs(columns, "Pyphen", "PyHyphen"), total=len(words))
+
+    report_columns(language, set_name, columns)
+    report_analysis(language, set_name, columns)
+
+@duration("all engines test all")
+def test_all(engines: List[str], words: List[str], language: str, workers: int) -> Dict[str, List[Breaks]]:  # noqa: N802
+    Trace.action(f"{Color.BLUE}{Color.BOLD}{", ".join(engines)} ({workers} worker{"s" if workers > 1 else ""}) ...{Color.RESET}")
+
+    return hyphenate_parallel_masks(engines, language, words, workers)
+
+def main() -> None:
+    use_cache(USE_CACHE)
+
+    # all reports: PyHyphen patch (on, off), PyHyphen, Pyphen, Liang, Liang-Compound, PyHyphen (with patch) <-> Pyphen
+
+    # check_patch_samples("de_DE", "samples", ["Fortschritt"], trace=True)
+    # check_samples("Liang-Compound", "de_DE", "samples", ["Fortschritt"], trace=True)
     # compare_samples("de_DE", "samples", ["Fortschritt"], trace=True)
-    compare_samples("de_DE", "samples", ["test_patch", "dashes", "upper", "special", "corrected", "wrong"], trace=False)
-    compare_samples("de_DE", "AlleDeutschenWoerter")
-    compare_samples("de_DE", "wortliste")
-    compare_samples("de_DE", "german_words")
-    compare_samples("de_DE", "de_DE_frami")
-    compare_samples("de_DE", "wordlist-german")
+
+    check_all("de_DE", "samples", SUB_SETS["samples"])
+    check_all("de_DE", "AlleDeutschenWoerter", workers=WORKERS)
+    check_all("de_DE", "wortliste", workers=WORKERS)
+    check_all("de_DE", "german_words", workers=WORKERS)
+    check_all("de_DE", "de_DE_frami", workers=WORKERS)
+    check_all("de_DE", "wordlist-german", workers=WORKERS)
 
 if __name__ == "__main__":
     Trace.set( debug_mode=False, timezone=False )
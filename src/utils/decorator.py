@@ -4,11 +4,12 @@
     src/utils/decorator.py
 
     PUBLIC:
-     - @duration(text: str=None, rounds: int=1)
+     - @duration(text: str=None, rounds: int=1, aggregate: bool=False)
      - @deprecated(message: str="")
      - @retry_exception(text: str="", exception=Exception, delay: int|float=1, retries: int=5)
 
     PRIVATE:
+     - def get_signature(func: Callable) -> Signature:
      - def get_args_values(func: Callable, *args: Any, **kwargs: Any) -> Tuple[List, Dict]:
      - def replace_arguments(match: Match, func_name: str, *args: Any, **kwargs: Any) -> str:
 """
@@ -23,11 +24,14 @@
 from inspect import BoundArguments, Signature
 from typing import TYPE_CHECKING, Any, Dict, Generator, List, Match, Tuple
 
+from utils.timing import timing
 from utils.trace import Color, Trace
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+PLACEHOLDER = re.compile(r"\{(.*?)\}")
+
 """ Decorator '@my_decorator'
 
 def my_decorator(func: Callable) -> Callable:
@@ -93,14 +97,41 @@ def wrapper(*args: Any, **kwargs: Any) -> Any:
 # @duration("{__name__} 2: {name} {number} {type}")
 # @duration("{__name__} 1: {0|name} {1|number} {2|type}", rounds=1)
 # @duration(text="{__name__} 0: {0} {1} {2}", rounds=1)
+# @duration("get_pyphen", aggregate=True) <- no output per call: count, total, min, max, p50/p95/p99 (utils/timing.py)
+
+# the text is prepared once per function: {__name__} is replaced when decorating,
+# the arguments are only bound (cached signature) if the text has argument placeholders
 
-def duration(special: Callable[[Any], Any] | str | None = None, *, text: str | None = None, rounds: int=1) -> Callable[[Any], Any]:
+def duration(special: Callable[[Any], Any] | str | None = None, *, text: str | None = None, rounds: int=1, aggregate: bool = False) -> Callable[[Any], Any]:
     def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        if isinstance(special, str): # text as arg
+            template = special
+
+        elif text is None:           # text as kwarg
+            template = func.__name__
+        else:
+            template = text
+
+        template = PLACEHOLDER.sub(lambda match: func.__name__ if match.group(1) == "__name__" else match.group(0), template)
+        arguments = PLACEHOLDER.search(template) is not None
+
+        if aggregate:
+            histogram = timing(template)
+
+            @functools.wraps(wrapped=func)
+            def aggregate_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start_time = time.perf_counter_ns()
+                result = func(*args, **kwargs)
+                histogram.record((time.perf_counter_ns() - start_time) // rounds)
+                return result
+            return aggregate_wrapper
+
         @functools.wraps(wrapped=func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
 
-            # get all input args & kwargs of the decorated function
-            args_values, kwargs_values = get_args_values(func, *args, **kwargs)
+            # get all input args & kwargs of the decorated function (only for placeholders)
+            if arguments:
+                args_values, kwargs_values = get_args_values(func, *args, **kwargs)
 
             # before
             start_time = time.perf_counter()
@@ -111,22 +142,15 @@ def wrapper(*args: Any, **kwargs: Any) -> Any:
             # after
             total_time = (time.perf_counter() - start_time) / rounds
 
-            if isinstance(special, str): # text as arg
-                pretext = special
-
-            elif text is None:           # text as kwarg
-                pretext = func.__name__
-            else:
-                pretext = text
-
-            # replace arg, kwarg: {0} or {0|name} or {0|name} or {__name__}
+            # replace arg, kwarg: {0} or {0|name} or {0|name}
             # args_values: ['Max', 99, False], kwargs_values: {'name': 'Max', 'number': 99, 'type': False}
 
-            def replace(match: Match[str]) -> str:
-                return replace_argument_values(match, func.__name__, args_values, kwargs_values)
+            pretext = template
+            if arguments:
+                def replace(match: Match[str]) -> str:
+                    return replace_argument_values(match, func.__name__, args_values, kwargs_values)
 
-            pattern = r"\{(.*?)\}"
-            pretext = re.sub(pattern, replace, pretext)
+                pretext = PLACEHOLDER.sub(replace, template)
 
             duration_text = f"{Color.GREEN}{Color.BOLD}{total_time:.3f} sec{Color.RESET}"
             if pretext == "":
@@ -220,8 +244,7 @@ def wrapper(*args: Any, **kwargs: Any) -> Any:
                 def replace(match: Match[str]) -> str:
                     return replace_argument_values(match, func.__name__, args_values, kwargs_values)
 
-                pattern = r"\{(.*?)\}"
-                pretext = re.sub(pattern, replace, text)
+                pretext = PLACEHOLDER.sub(replace, text)
 
             attempts = 0
             while attempts < retries:
@@ -241,10 +264,16 @@ def replace(match: Match[str]) -> str:
         return wrapper
     return decorator
 
+# inspect.signature once per function
+
+@functools.cache
+def get_signature(func: Callable[[Any], Any]) -> Signature:
+    return inspect.signature(func)
+
 # get args and kwargs values -> default values are considered
 
 def get_args_values(func: Callable[[Any], Any], *args: Any, **kwargs: Any) -> Tuple[List[Any], Dict[Any, Any]]:
-    sig: Signature = inspect.signature(func)
+    sig: Signature = get_signature(func)
     bound_args: BoundArguments = sig.bind_partial(*args, **kwargs)
     bound_args.apply_defaults()
 
@@ -13,6 +13,7 @@
 
      - result = read_file(filepath: Path | str, encoding: str="utf-8") -> Result[Any, str]
      - result = write_file(filepath: Path | str, data: Any, encoding: str="utf-8", create_dir: bool = True, show_message: bool=True) -> Result[str, str]
+     - result = write_json_stream(filepath: Path | str, items: Iterable[Tuple[str, Any]], *, filename_timestamp: bool = False, chunk_size: int = 4096, ...) -> Result[int, str]
 
     ------
     from result import is_err, is_ok
@@ -25,21 +26,35 @@
     supported types
      - .txt
      - .json (json or orjson)
+     - .ndjson (write_json_stream)
      - .xml (minidom or xml.etree.ElementTree)
+     - + .gz (gzip) or .zst (zstandard, if installed), e.g. '.json.gz', '.json.zst'
 
      ------
      - result = listdir_ext(dirpath: Path | str, extensions: List | None = None) -> Result[List, str]
      - result = check_path_exist(path: Path | str, case_sensitive: bool=False, debug: bool=False) -> Result[str, str]
+
+    change detection (write_file, write_json_stream)
+     - DIGEST_FILE in the directory: filename -> size, mtime_ns, digest of the written content (xxh3_128 if installed, else sha256),
+       compressed files: digest of the uncompressed content
+     - size + mtime unchanged and same digest -> "not modified" without reading the old file
+     - no (valid) digest: one full compare, then the digest is stored
+     - new content: temp file + os.replace (atomic)
 """
 from __future__ import annotations
 
+import codecs
+import filecmp
+import gzip
+import hashlib
 import os
 import sys
 import xml.etree.ElementTree as ET
 
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 from xml.dom import minidom
 
 from result import Err, Ok, Result
@@ -49,6 +64,16 @@
 except ModuleNotFoundError:
     import json
 
+try:
+    import xxhash  # type: ignore[import-not-found]
+except ModuleNotFoundError:
+    pass
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ModuleNotFoundError:
+    pass
+
 try:
     import xmltodict
 except ModuleNotFoundError:
@@ -61,8 +86,18 @@
 
 from utils.trace import Color, Trace
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import BinaryIO
+
 TIMESTAMP = "%Y-%m-%d_%H-%M-%S"
 
+DIGEST_FILE = ".digests.json" # per directory: filename -> [size, mtime_ns, digest of the content]
+DIGEST_NAME = "xxh3_128" if "xxhash" in sys.modules else "sha256"
+
+GZIP_LEVEL = 6 # mtime = 0 -> same content, same bytes
+ZSTD_LEVEL = 3
+
 def get_timestamp(filepath: Path | str) -> Result[float, str]:
     """
     ### get timestamp of a file
@@ -148,7 +183,7 @@ def read_file(filepath: Path | str, encoding: str="utf-8") -> Result[Any, str]:
     ### read file (text, json, xml)
 
     #### Arguments
-     - filepath: Path or str  - supported suffixes: '.txt', '.json', '.xml'
+     - filepath: Path or str  - supported suffixes: '.txt', '.json', '.xml' (+ '.gz', '.zst')
      - encoding: str - used only for '.txt'
 
     #### Return [rustedpy]
@@ -167,7 +202,11 @@ def read_file(filepath: Path | str, encoding: str="utf-8") -> Result[Any, str]:
 
     # 1. file_type check
 
-    suffix  = Path(filename).suffix
+    suffix, compression = split_compression(Path(filename))
+    if compression == ".zst" and "zstandard" not in sys.modules:
+        err = "module 'zstandard' not installed"
+        Trace.debug(err)
+        return Err(err)
 
     if suffix == ".txt":
         file_type = "text"
@@ -198,9 +237,12 @@ def read_file(filepath: Path | str, encoding: str="utf-8") -> Result[Any, str]:
         return Err(err)
 
     try:
-        with filepath.open(mode="r", encoding=encoding) as f:
-            text = f.read()
-    except OSError as e:
+        if compression:
+            text = decompress(filepath.read_bytes(), compression).decode(encoding)
+        else:
+            with filepath.open(mode="r", encoding=encoding) as f:
+                text = f.read()
+    except (OSError, EOFError, ValueError) as e: # ValueError: decode, corrupt zstd frame
         Trace.debug(f"{e}")
         return Err(f"{e}")
 
@@ -245,7 +287,7 @@ def write_file(filepath: Path | str, data: Any, filename_timestamp: bool = False
     ### write file (text, json, xml)
 
     #### Arguments
-     - filepath: Path or str - supported suffixes: '.txt', '.json', '.xml'
+     - filepath: Path or str - supported suffixes: '.txt', '.json', '.xml' (+ '.gz', '.zst')
      - filename_timestamp: bool - add timestamp to filename
      - timestamp: float - timestamp in sec
      - encoding: str - used only for '.txt'
@@ -266,14 +308,21 @@ def write_file(filepath: Path | str, data: Any, filename_timestamp: bool = False
     dirpath  = Path(filepath).parent
     filename = Path(filepath).name
 
-    suffix = Path(filename).suffix
+    suffix, compression = split_compression(Path(filename))
     stem = Path(filename).stem
 
+    if compression == ".zst" and "zstandard" not in sys.modules:
+        err = "module 'zstandard' not installed"
+        Trace.debug(err)
+        return Err(err)
+
     if filename_timestamp:
         filename = f"{stem}_{datetime.now().astimezone().strftime(TIMESTAMP)}{suffix}"
 
     # 1. type check + serialization
 
+    raw: bytes | None = None # orjson output (utf-8)
+
     if suffix in [".txt", ".csv"]:
         if not isinstance(data, str):
             err = f'write_file \'{suffix}\': "{str(data)[:50]} …" is not a string'
@@ -310,7 +359,8 @@ def serialize_sets(obj: Any) -> Any:
         if isinstance(data, (dict, list)):
             try:
                 if "orjson" in sys.modules:
-                    text = orjson.dumps(data, default=serialize_sets, option=orjson.OPT_INDENT_2).decode("utf-8") # type: ignore[reportPossiblyUnboundVariable] # PyRight: "orjson" is possibly unbound
+                    raw = orjson.dumps(data, default=serialize_sets, option=orjson.OPT_INDENT_2) # type: ignore[reportPossiblyUnboundVariable] # PyRight: "orjson" is possibly unbound
+                    text = "" if newline == "\n" and codecs.lookup(encoding).name == "utf-8" else raw.decode("utf-8")
                 else:
                     text = json.dumps(data, default=serialize_sets, indent=2, ensure_ascii=False)                 # type: ignore[reportPossiblyUnboundVariable] # PyRight: "json" is possibly unbound
             except TypeError as e:
@@ -387,37 +437,48 @@ def serialize_sets(obj: Any) -> Any:
 
     # 3. file check
 
-    if filepath.exists():
-        try:
-            with filepath.open(mode="r", encoding=encoding) as f:
-                text_old = f.read()
-        except OSError as e:
-            Trace.debug(f"{e}")
-            return Err(f"{e}")
+    if raw is None or text:
+        data_bytes = (text if newline == "\n" else text.replace("\n", newline)).encode(encoding)
+    else:
+        data_bytes = raw # orjson: already utf-8
+
+    hasher = new_hasher()
+    hasher.update(data_bytes)
+    digest = f"{DIGEST_NAME}:{hasher.hexdigest()}"
 
-        if text == text_old:
+    existed = filepath.exists()
+    if existed:
+        if digest_unchanged(filepath, digest):
             Trace.info(f"'{filepath}' not modified")
             return Ok("")
 
         try:
-            with filepath.open(mode="w", encoding=encoding, newline=newline) as f:
-                f.write(text)
-        except OSError as e:
-            return Err(f"{e}")
-
-        if show_message:
-            Trace.update(f"'{filepath}' updated")
-
-    else:
-        try:
-            with filepath.open(mode="w", encoding=encoding, newline=newline) as f:
-                f.write(text)
+            if compression or filepath.stat().st_size == len(data_bytes):
+                data_old = filepath.read_bytes()
+                if compression:
+                    data_old = decompress(data_old, compression)
+
+                if data_old == data_bytes: # no digest yet
+                    store_digest(filepath, digest)
+                    Trace.info(f"'{filepath}' not modified")
+                    return Ok("")
+        except (EOFError, ValueError):
+            pass # corrupt file -> replaced
         except OSError as e:
             Trace.debug(f"{e}")
             return Err(f"{e}")
 
-        if show_message:
-            Trace.update(f"'{filepath}' created")
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(compress(data_bytes, compression) if compression else data_bytes)
+        tmp_path.replace(filepath) # atomic
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        Trace.debug(f"{e}")
+        return Err(f"{e}")
+
+    if show_message:
+        Trace.update(f"'{filepath}' {"updated" if existed else "created"}")
 
     # 4: optional: set file timestamp
 
@@ -428,8 +489,204 @@ def serialize_sets(obj: Any) -> Any:
             Trace.debug(f"{e}")
             return Err(f"timestamp: {e}")
 
+    store_digest(filepath, digest)
     return Ok("")
 
+def write_json_stream(filepath: Path | str, items: Iterable[Tuple[str, Any]], *, filename_timestamp: bool = False, chunk_size: int = 4096, create_dir: bool = True, show_message: bool=True) -> Result[int, str]:
+    """
+    ### write (key, value) pairs chunk by chunk - the pairs are never all in memory
+
+    #### Arguments
+     - filepath: Path or str - supported suffixes: '.json' (object), '.ndjson' (one {key: value} per line) (+ '.gz', '.zst')
+     - items: iterable of (key, value), e.g. a generator of hyphenated words
+     - filename_timestamp: bool - as write_file (the path is not changed)
+     - chunk_size: int - pairs per serialization/write
+     - create_dir: bool - create directory if not exists (default: True)
+
+    #### Returns [rustedpy]
+     - Ok: number of pairs
+     - Err: errortext as str
+    ----
+    #### Infos
+     - '.json': same text as write_file (orjson OPT_INDENT_2 or json indent=2)
+     - written to a temp file, compared with the old file by digest (DIGEST_FILE) or block by block (filecmp)
+       -> "not modified" (temp file removed) or replaced (os.replace)
+     - a repeated key in a later chunk is written again (keys must be unique)
+    """
+
+    filepath = Path(filepath)
+    dirpath  = filepath.parent
+
+    suffix, compression = split_compression(filepath)
+    if suffix not in [".json", ".ndjson"]:
+        err = f"Type '{suffix}' is not supported"
+        Trace.debug(err)
+        return Err(err)
+
+    if compression == ".zst" and "zstandard" not in sys.modules:
+        err = "module 'zstandard' not installed"
+        Trace.debug(err)
+        return Err(err)
+
+    if not dirpath.exists():
+        if create_dir:
+            try:
+                dirpath.mkdir(parents=True)
+                Trace.update(f"'{dirpath}' created")
+            except OSError as e:
+                Trace.debug(f"{e}")
+                return Err(f"{e}")
+        else:
+            return Err(f"DirNotFoundError: '{dirpath}'")
+
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+
+    hasher = new_hasher()
+
+    def write(text: str) -> None:
+        data_bytes = text.encode("utf-8")
+        hasher.update(data_bytes)
+        f.write(data_bytes)
+
+    count = 0
+    try:
+        with tmp_path.open(mode="wb") as file, open_compressed(file, compression) as f:
+            if suffix == ".ndjson":
+                chunk: List[str] = []
+                for key, value in items:
+                    chunk.append(dump_json({key: value}, indent=False))
+                    if len(chunk) == chunk_size:
+                        write("\n".join(chunk) + "\n")
+                        count += len(chunk)
+                        chunk.clear()
+                if chunk:
+                    write("\n".join(chunk) + "\n")
+                    count += len(chunk)
+
+            else:
+                separator = "{\n"
+                pairs: Dict[str, Any] = {}
+                for key, value in items:
+                    pairs[key] = value
+                    if len(pairs) == chunk_size:
+                        write(separator + dump_json(pairs, indent=True)[2:-2])
+                        separator = ",\n"
+                        count += len(pairs)
+                        pairs.clear()
+                if pairs:
+                    write(separator + dump_json(pairs, indent=True)[2:-2])
+                    count += len(pairs)
+                write("\n}" if count else "{}")
+
+    except (OSError, TypeError) as e:
+        tmp_path.unlink(missing_ok=True)
+        Trace.error(f"{e}")
+        return Err(f"{e}")
+
+    digest = f"{DIGEST_NAME}:{hasher.hexdigest()}"
+
+    existed = filepath.exists()
+    try:
+        if existed and (digest_unchanged(filepath, digest) or filecmp.cmp(tmp_path, filepath, shallow=False)):
+            tmp_path.unlink()
+            store_digest(filepath, digest)
+            Trace.info(f"'{filepath}' not modified")
+            return Ok(count)
+
+        tmp_path.replace(filepath)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        Trace.debug(f"{e}")
+        return Err(f"{e}")
+
+    store_digest(filepath, digest)
+
+    if show_message:
+        Trace.update(f"'{filepath}' {"updated" if existed else "created"}")
+
+    return Ok(count)
+
+def dump_json(data: Any, indent: bool) -> str:
+    if "orjson" in sys.modules:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None).decode("utf-8") # type: ignore[reportPossiblyUnboundVariable] # PyRight: "orjson" is possibly unbound
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False, separators=None if indent else (",", ":")) # type: ignore[reportPossiblyUnboundVariable] # PyRight: "json" is possibly unbound
+
+def split_compression(filepath: Path) -> Tuple[str, str]:
+    suffixes = filepath.suffixes
+    if len(suffixes) > 1 and suffixes[-1] in (".gz", ".zst"):
+        return suffixes[-2], suffixes[-1]
+    return filepath.suffix, ""
+
+def compress(data: bytes, compression: str) -> bytes:
+    if compression == ".zst":
+        return bytes(zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)) # type: ignore[reportPossiblyUnboundVariable] # PyRight: "zstandard" is possibly unbound
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+def decompress(data: bytes, compression: str) -> bytes:
+    if compression == ".zst":
+        return bytes(zstandard.ZstdDecompressor().decompress(data)) # type: ignore[reportPossiblyUnboundVariable] # PyRight: "zstandard" is possibly unbound
+    return gzip.decompress(data)
+
+def open_compressed(file: BinaryIO, compression: str) -> Any:
+    if compression == ".zst":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(file, closefd=False) # type: ignore[reportPossiblyUnboundVariable] # PyRight: "zstandard" is possibly unbound
+    if compression == ".gz":
+        return gzip.GzipFile(fileobj=file, mode="wb", compresslevel=GZIP_LEVEL, mtime=0, filename="")
+    return nullcontext(file)
+
+def new_hasher() -> Any:
+    if "xxhash" in sys.modules:
+        return xxhash.xxh3_128() # type: ignore[reportPossiblyUnboundVariable] # PyRight: "xxhash" is possibly unbound
+    return hashlib.sha256()
+
+def digest_unchanged(filepath: Path, digest: str) -> bool:
+    entry = read_digests(filepath.parent).get(filepath.name)
+    if entry is None:
+        return False
+
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return False
+
+    return bool(entry == [stat.st_size, stat.st_mtime_ns, digest])
+
+def store_digest(filepath: Path, digest: str) -> None:
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return
+
+    digests = read_digests(filepath.parent)
+    entry = [stat.st_size, stat.st_mtime_ns, digest]
+    if digests.get(filepath.name) == entry:
+        return
+
+    digests = {name: value for name, value in digests.items() if (filepath.parent / name).exists()}
+    digests[filepath.name] = entry
+
+    digest_path = filepath.parent / DIGEST_FILE
+    tmp_path = digest_path.with_name(f"{DIGEST_FILE}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(dump_json(dict(sorted(digests.items())), indent=True), encoding="utf-8")
+        tmp_path.replace(digest_path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        Trace.debug(f"{e}")
+
+def read_digests(dirpath: Path) -> Dict[str, Any]:
+    try:
+        text = (dirpath / DIGEST_FILE).read_text(encoding="utf-8")
+    except OSError:
+        return {}
+
+    try:
+        data = orjson.loads(text) if "orjson" in sys.modules else json.loads(text) # type: ignore[reportPossiblyUnboundVariable] # PyRight: "orjson"/"json" is possibly unbound
+    except ValueError:
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
 def listdir_ext(dirpath: Path | str, extensions: List[str] | None = None) -> Result[List[str], str]:
     """
     ### List all files in directory which matches the extentions
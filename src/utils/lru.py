@@ -0,0 +1,111 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 17:20
+
+    src/utils/lru.py
+
+    bounded in-memory cache (least recently used entries are evicted)
+     - limits: max_entries and/or max_bytes (0: no limit)
+     - bytes: sys.getsizeof of key and value (+ items of tuples/lists), only counted with max_bytes
+     - counters: hits, misses, evictions
+
+    PUBLIC:
+     - CacheStats( hits, misses, evictions, entries, bytes ) - NamedTuple
+     - sizeof( obj: Any ) -> int
+
+    class LRUCache:
+     - LRUCache( max_entries: int = 0, max_bytes: int = 0 )
+     - LRUCache.get( key: Hashable, default: Any = None ) -> Any
+     - LRUCache[key] = value
+     - LRUCache.resize( max_entries: int, max_bytes: int ) -> None
+     - LRUCache.clear() -> None
+     - LRUCache.stats() -> CacheStats
+"""
+from __future__ import annotations
+
+import sys
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple, Tuple
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+class CacheStats(NamedTuple):
+    hits:      int
+    misses:    int
+    evictions: int
+    entries:   int
+    bytes:     int
+
+class LRUCache:
+    """
+    ### bounded mapping - drop-in for a dict used with get() and [key] = value
+
+    e.g. pyphen.HyphDict.cache (unbounded dict) -> LRUCache( max_bytes = 4 * 1024 * 1024 )
+    """
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0) -> None:
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+
+        self.data: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict() # key -> value, size
+        self.size      = 0
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self.data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.data.move_to_end(key)
+        return item[0]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        size = sizeof(key) + sizeof(value) if self.max_bytes else 0
+
+        old = self.data.pop(key, None)
+        if old is not None:
+            self.size -= old[1]
+
+        self.data[key] = (value, size)
+        self.size += size
+        self.evict()
+
+    def resize(self, max_entries: int, max_bytes: int) -> None:
+        if max_bytes and not self.max_bytes:
+            self.data = OrderedDict((key, (value, sizeof(key) + sizeof(value))) for key, (value, _) in self.data.items())
+            self.size = sum(size for _, size in self.data.values())
+
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self.evict()
+
+    def clear(self) -> None:
+        self.data.clear()
+        self.size = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, len(self.data), self.size)
+
+    def evict(self) -> None:
+        data = self.data
+        while data and ((self.max_entries and len(data) > self.max_entries) or (self.max_bytes and self.size > self.max_bytes)):
+            _, (_, size) = data.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+def sizeof( obj: Any ) -> int:
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list)):
+        size += sum(sys.getsizeof(item) for item in obj)
+    return size
@@ -0,0 +1,157 @@
+"""
+    © Jürgen Schoenemeyer, 19.10.2026 18:40
+
+    src/utils/timing.py
+
+    timing statistics without storing each value
+     - Histogram: log-bucketed (HDR style) - values < 2 * SUB_BUCKETS exact, above SUB_BUCKETS buckets
+       per power of two -> percentiles with a relative error < 1 / SUB_BUCKETS (about 3 %)
+     - count, total, min, max are exact
+     - registry: one Histogram per name, e.g. @duration("get_pyphen", aggregate=True) (utils/decorator.py)
+
+    example:
+     - timing("get_pyphen").record( 12_345 ) # ns
+     - timing_report() -> {"get_pyphen": {"count": 1, "total": 1.2345e-05, ..., "p99": 1.2345e-05}}
+
+    PUBLIC:
+     - timing( name: str ) -> Histogram
+     - timing_report() -> Dict[str, Dict[str, float]]
+     - trace_timings() -> None
+     - reset_timings() -> None
+
+    class Histogram:
+     - Histogram()
+     - Histogram.record( value: int ) -> None
+     - Histogram.percentile( percent: float ) -> int
+     - Histogram.buckets() -> List[Tuple[int, int]]
+     - Histogram.merge( other: Histogram ) -> None
+     - Histogram.clear() -> None
+     - Histogram.stats( scale: float = 1e-9 ) -> Dict[str, float]
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from utils.trace import Color, Trace
+
+SUB_BITS    = 5
+SUB_BUCKETS = 1 << SUB_BITS # per power of two
+
+MAX_VALUE = (1 << 64) - 1   # e.g. 584 years in ns
+BUCKETS   = (MAX_VALUE.bit_length() - SUB_BITS - 1) * SUB_BUCKETS + 2 * SUB_BUCKETS
+
+PERCENTILES = (50, 95, 99)
+
+registry: Dict[str, Histogram] = {}
+
+class Histogram:
+    """
+    ### log-bucketed histogram of non-negative ints (e.g. ns from time.perf_counter_ns)
+
+    bucket of a value v:
+     - v < 2 * SUB_BUCKETS: v
+     - else: shift = v.bit_length() - SUB_BITS - 1, bucket = shift * SUB_BUCKETS + (v >> shift)
+       -> lowest value of the bucket: (v >> shift) << shift
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min   = MAX_VALUE # count = 0: stats() -> 0
+        self.max   = 0
+
+    def clear(self) -> None:
+        self.counts = [0] * BUCKETS
+        self.count = self.total = self.max = 0
+        self.min = MAX_VALUE
+
+    def record(self, value: int) -> None: # 0 <= value <= MAX_VALUE
+        shift = value.bit_length() - SUB_BITS - 1
+        self.counts[value if shift <= 0 else (shift << SUB_BITS) + (value >> shift)] += 1
+
+        self.count += 1
+        self.total += value
+        if value < self.min:  # noqa: PLR1730
+            self.min = value
+        if value > self.max:  # noqa: PLR1730
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        """
+        ### value at percent (0 .. 100) - the middle of its bucket, within min .. max
+        """
+
+        if self.count == 0:
+            return 0
+
+        rank = max(1, -(-self.count * percent // 100))
+        bucket = -1
+        seen = 0
+        while seen < rank:
+            bucket += 1
+            seen += self.counts[bucket]
+
+        if bucket < 2 * SUB_BUCKETS:
+            value = bucket
+        else:
+            shift = bucket // SUB_BUCKETS - 1
+            value = ((bucket - shift * SUB_BUCKETS) << shift) + (1 << shift) // 2
+
+        return min(max(value, self.min), self.max)
+
+    def buckets(self) -> List[Tuple[int, int]]:
+        """
+        ### (lowest value, count) of each non-empty bucket
+        """
+
+        result: List[Tuple[int, int]] = []
+        for bucket, count in enumerate(self.counts):
+            if count:
+                if bucket < 2 * SUB_BUCKETS:
+                    result.append((bucket, count))
+                else:
+                    shift = bucket // SUB_BUCKETS - 1
+                    result.append(((bucket - shift * SUB_BUCKETS) << shift, count))
+        return result
+
+    def merge(self, other: Histogram) -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def stats(self, scale: float = 1e-9) -> Dict[str, float]:
+        """
+        ### count, total, min, max, p50, p95, p99 - scaled (default: ns -> sec)
+        """
+
+        result: Dict[str, float] = {
+            "count": self.count,
+            "total": self.total * scale,
+            "min":   self.min * scale if self.count else 0.0,
+            "max":   self.max * scale,
+        }
+        for percent in PERCENTILES:
+            result[f"p{percent}"] = self.percentile(percent) * scale
+
+        return result
+
+def timing( name: str ) -> Histogram:
+    histogram = registry.get(name)
+    if histogram is None:
+        histogram = registry[name] = Histogram()
+    return histogram
+
+def timing_report() -> Dict[str, Dict[str, float]]:
+    return {name: histogram.stats() for name, histogram in registry.items()}
+
+def trace_timings() -> None:
+    for name, stats in timing_report().items():
+        text = ", ".join(f"{key} {stats[key] * 1e6:.1f} µs" for key in ("min", "p50", "p95", "p99", "max"))
+        Trace.decorator(f"{name}: {int(stats["count"])} calls, {Color.GREEN}{Color.BOLD}{stats["total"]:.3f} sec{Color.RESET} ({text})", path="timing")
+
+def reset_timings() -> None: # the histograms are kept (referenced by the decorated functions)
+    for histogram in registry.values():
+        histogram.clear()
@@ -11,6 +11,9 @@
       - Trace.set(timezone="Europe/Berlin") # "UTC", "America/New_York"
       - Trace.set(show_caller=False)
       - Trace.set(appl_folder="/trace/")
+      - Trace.set(hide=["result", "decorator"]) # not shown, not formatted (except fatal)
+      - Trace.set(buffered=True) # written every FLUSH_LINES messages / FLUSH_INTERVAL sec (timer thread), error/fatal/exit: at once
+      - Trace.set(background=True) # written by a background thread (queue, batched writes), Trace.flush() waits for it
 
       - Trace.action()
       - Trace.result()
@@ -30,6 +33,10 @@
       - Trace.file_save("./logs", "testTrace")
 
       - Trace.redirect(function) # -> e.g. qDebug (PySide6)
+      - Trace.flush()
+
+    costs per message: no inspect.stack() (sys._getframe, "[path:line » caller]" cached per call site),
+    timestamp formatted once per second, isatty() once per stream, hidden types are not formatted
 
     static class Color:
       - Color.<color_name>
@@ -37,20 +44,29 @@
 """
 from __future__ import annotations
 
+import atexit
 import importlib.util
-import inspect
+import os
 import platform
+import queue
 import re
 import sys
+import threading
+import time
 
 from datetime import datetime
 from enum import StrEnum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, FrozenSet, List, Tuple
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 if TYPE_CHECKING:
-    from types import FrameType
+    from types import CodeType
+
+FLUSH_LINES    = 1000
+FLUSH_INTERVAL = 0.5 # sec
+
+clear_colors = re.compile(r"\033\[[0-9;]*m").sub
 
 # https://en.wikipedia.org/wiki/ANSI_escape_code#Colors
 
@@ -103,7 +119,7 @@ class Color(StrEnum):
 
     @staticmethod
     def clear(text: str) -> str:
-        return re.sub(r"\033\[[0-9;]*m", "", text)
+        return clear_colors("", text)
 
 pattern: Dict[str, str] = {
     "time":      " --> ",
@@ -144,6 +160,10 @@ class Trace:
         "timezone":       True,
 
         "show_caller":    True,
+
+        "hide":           [],
+        "buffered":       False,
+        "background":     False,
     }
 
     pattern:  ClassVar[List[str]] = []
@@ -151,6 +171,19 @@ class Trace:
     csv: bool = False
     output: Callable[..., None] | None = None
 
+    hidden:   ClassVar[FrozenSet[str]] = frozenset()
+    buffer:   ClassVar[List[bytes]] = []
+    flushed:  float = 0.0
+    lock:     threading.RLock = threading.RLock()                 # buffer: caller <-> flush_timer thread
+    timer:    threading.Thread | None = None
+
+    sink:     ClassVar[queue.SimpleQueue[bytes | threading.Event]] = queue.SimpleQueue() # background mode -> write_sink thread
+    writer:   threading.Thread | None = None
+
+    callers:  ClassVar[Dict[Tuple[CodeType, int], str]] = {}       # (code, line) -> "[path:line » caller]"
+    clock:    ClassVar[Tuple[int, bool | str, str, str]] = (-1, False, "", "") # second, timezone, "%H:%M:%S", "%z"
+    terminal: ClassVar[Tuple[Any, bool]] = (None, False)           # stream, isatty
+
     @classmethod
     def set(cls, **kwargs: Any) -> None: # color, reduced_mode, debug_mode, show_timestamp, timezone, show_caller
 
@@ -158,6 +191,15 @@ def set(cls, **kwargs: Any) -> None: # color, reduced_mode, debug_mode, show_tim
             if key in cls.settings:
                 cls.settings[key] = value
 
+                if key == "appl_folder":
+                    cls.callers.clear()
+
+                if key == "hide":
+                    cls.hidden = frozenset(value) - {"fatal"}
+
+                if key in ("buffered", "background") and not value:
+                    cls.flush()
+
                 if key == "timezone" and isinstance(value, str):
 
                     # timezone valid: "UTC", "Europe/Berlin"), "America/New_York" ...
@@ -180,19 +222,19 @@ def set(cls, **kwargs: Any) -> None: # color, reduced_mode, debug_mode, show_tim
 
     @classmethod
     def info(cls, message: str = "", *optional: Any) -> None:
-        if not cls.settings["reduced_mode"]:
+        if not cls.settings["reduced_mode"] and "info" not in cls.hidden:
             pre = f"{cls._get_time()}{cls._get_pattern()}{cls._get_caller()}"
             cls._show_message(cls._check_file_output(), pre, message, *optional)
 
     @classmethod
     def update(cls, message: str = "", *optional: Any) -> None:
-        if not cls.settings["reduced_mode"]:
+        if not cls.settings["reduced_mode"] and "update" not in cls.hidden:
             pre = f"{cls._get_time()}{cls._get_pattern()}{cls._get_caller()}"
             cls._show_message(cls._check_file_output(), pre, message, *optional)
 
     @classmethod
     def download(cls, message: str = "", *optional: Any) -> None:
-        if not cls.settings["reduced_mode"]:
+        if not cls.settings["reduced_mode"] and "download" not in cls.hidden:
             pre = f"{cls._get_time()}{cls._get_pattern()}{cls._get_caller()}"
             cls._show_message(cls._check_file_output(), pre, message, *optional)
 
@@ -200,11 +242,17 @@ def download(cls, message: str = "", *optional: Any) -> None:
 
     @classmethod
     def action(cls, message: str = "", *optional: Any) -> None:
+        if "action" in cls.hidden:
+            return
+
         pre = f"{cls._get_time()}{cls._get_pattern()}{cls._get_caller()}"
         cls._show_message(cls._check_file_output(), pre, message, *optional)
 
     @classmethod
     def result(cls, message: str = "", *optional: Any) -> None:
+        if "result" in cls.hidden:
+            return
+
         pre = f"{cls._get_time()}{cls._get_pattern()}{cls._get_caller()}"
         cls._show_message(cls._check_file_output(), pre, message, *optional)
 
@@ -212,6 +260,9 @@ def result(cls, message: str = "", *optional: Any) -> None:
 
     @classmethod
     def important(cls, message: str = "", *optional: Any) -> None:
+        if "important" in cls.hidden:
+            return
+
         pre = f"{cls._get_time()}{Color.MAGENTA}{cls._get_pattern()}{cls._get_caller()}"
         cls._show_message(cls._check_file_output(), pre, f"{Color.MAGENTA}{Color.BOLD}{message}{Color.RESET}", *optional)
 
@@ -219,30 +270,42 @@ def important(cls, message: str = "", *optional: Any) -> None:
 
     @classmethod
     def warning(cls, message: str = "", *optional: Any) -> None:
+        if "warning" in cls.hidden:
+            return
+
         pre = f"{cls._get_time()}{cls._get_pattern()}{cls._get_caller()}"
         cls._show_message(cls._check_file_output(), pre, message, *optional)
 
     @classmethod
     def error(cls, message: str = "", *optional: Any) -> None:
+        if "error" in cls.hidden:
+            return
+
         pre = f"{cls._get_time()}{Color.RED}{cls._get_pattern()}{cls._get_caller()}"
         cls._show_message(cls._check_file_output(), pre, message, *optional)
+        cls.flush()
 
     @classmethod
     def exception(cls, message: str = "", *optional: Any) -> None:
+        if "exception" in cls.hidden:
+            return
+
         pre = f"{cls._get_time()}{Color.RED}{cls._get_pattern()}{cls._get_caller()}"
         cls._show_message(cls._check_file_output(), pre, message, *optional)
+        cls.flush()
 
     @classmethod
     def fatal(cls, message: str = "", *optional: Any) -> None:
         pre = f"{cls._get_time()}{Color.RED}{Color.BOLD}{cls._get_pattern()}{cls._get_caller()}"
         cls._show_message(cls._check_file_output(), pre, message, *optional)
+        cls.flush()
         raise SystemExit
 
     # debug, wait (only in debug mode)
 
     @classmethod
     def debug(cls, message: str = "", *optional: Any) -> None:
-        if cls.settings["debug_mode"] and not cls.settings["reduced_mode"]:
+        if cls.settings["debug_mode"] and not cls.settings["reduced_mode"] and "debug" not in cls.hidden:
             pre = f"{cls._get_time()}{cls._get_pattern()}{cls._get_caller()}"
             cls._show_message(cls._check_file_output(), pre, message, *optional)
 
@@ -251,6 +314,7 @@ def wait(cls, message: str = "", *optional: Any) -> None:
         if cls.settings["debug_mode"]:
             pre = f"{cls._get_time()}{cls._get_pattern()}{cls._get_caller()}"
             cls._show_message(cls._check_file_output(), pre, message, *optional)
+            cls.flush()
             try:
                 print(f"{Color.RED}{Color.BOLD} >>> Press Any key to continue or ESC to exit <<< {Color.RESET}", end="", flush=True)  # noqa: T201
 
@@ -288,6 +352,9 @@ def wait(cls, message: str = "", *optional: Any) -> None:
 
     @classmethod
     def decorator(cls, message: str = "", *optional: Any, path: str = "decorator") -> None:
+        if "decorator" in cls.hidden:
+            return
+
         pre = f"{cls._get_time()}{cls._get_pattern()}{cls._get_decorator_caller(path)}"
         cls._show_message(cls._check_file_output(), pre, message, *optional)
 
@@ -306,10 +373,6 @@ def file_init(cls, pattern_list: None | List[str] = None, csv: bool = False) ->
     def file_save(cls, path: Path | str, filename: str) -> None:
         trace_path = Path(path)
 
-        text = ""
-        for message in Trace.messages:
-            text += message + "\n"
-
         curr_time = cls._get_time_timezone(cls.settings["timezone"]).replace(":", "-")
 
         try:
@@ -318,7 +381,7 @@ def file_save(cls, path: Path | str, filename: str) -> None:
 
             file_path = trace_path / f"{filename} • {curr_time}.txt"
             with file_path.open(mode="w", encoding="utf-8", newline="\n") as file:
-                file.write(text)
+                file.writelines(f"{message}\n" for message in cls.messages) # streamed, no text of the whole log
 
         except OSError as e:
             Trace.error(f"write {e}")
@@ -331,19 +394,25 @@ def file_save(cls, path: Path | str, filename: str) -> None:
     def redirect(cls, output: Callable[..., None]) -> None:
         cls.output = output
 
+    # flush() - buffered/background mode: all pending messages are written
+
+    @classmethod
+    def flush(cls) -> None:
+        cls._flush_buffer()
+
+        if cls.writer is not None and cls.writer is not threading.current_thread():
+            written = threading.Event() # set by the sink thread after all data before it
+            cls.sink.put(written)
+            written.wait()
+
     # INTERNAL
 
     @classmethod
     def _check_file_output(cls) -> bool:
-        current_frame: FrameType | None = inspect.currentframe()
-        if current_frame is None:
-            return False
-
-        caller_frame: FrameType | None = current_frame.f_back
-        if caller_frame is None:
+        if not cls.pattern:
             return False
 
-        trace_type = caller_frame.f_code.co_name
+        trace_type = sys._getframe(1).f_code.co_name  # noqa: SLF001
         return trace_type in cls.pattern
 
     # show_timestamp=False -> ""
@@ -361,37 +430,34 @@ def _get_time(cls) -> str:
 
     @classmethod
     def _get_time_timezone(cls, tz: bool | str) -> str:
-        if tz is False:
-            return datetime.now().astimezone().strftime("%H:%M:%S.%f")[:-3]
+        now = time.time()
+        second = int(now)
 
-        elif tz is True:
-            d = datetime.now().astimezone()
-            return d.strftime("%H:%M:%S.%f")[:-3] + d.strftime("%z")
+        cached_second, cached_tz, hms, zone = cls.clock
+        if second != cached_second or tz != cached_tz: # formatted once per second
+            if tz is False:
+                hms, zone = datetime.fromtimestamp(second).astimezone().strftime("%H:%M:%S"), ""
 
-        # "UTC", "Europe/Berlin", "America/New_York", ...
+            elif tz is True:
+                d = datetime.fromtimestamp(second).astimezone()
+                hms, zone = d.strftime("%H:%M:%S"), d.strftime("%z")
 
-        else:
-            timezone = ZoneInfo(tz)
-            d = datetime.now().astimezone(timezone)
-            return d.strftime("%H:%M:%S.%f")[:-3] + d.strftime("%z")
+            # "UTC", "Europe/Berlin", "America/New_York", ...
 
-    # " --> ", " >>> ", " ==> ", "-----", ..., " ooo "
+            else:
+                d = datetime.fromtimestamp(second, ZoneInfo(tz))
+                hms, zone = d.strftime("%H:%M:%S"), d.strftime("%z")
 
-    @staticmethod
-    def _get_pattern() -> str:
-        current_frame: FrameType | None = inspect.currentframe()
-        if current_frame is None:
-            return pattern["unknown"] # should never happens
+            cls.clock = (second, tz, hms, zone)
 
-        caller_frame: FrameType | None = current_frame.f_back
-        if caller_frame is None:
-            return pattern["unknown"] # should never happens
+        return f"{hms}.{int((now - second) * 1000):03d}{zone}"
 
-        trace_type = caller_frame.f_code.co_name # info, update, download ...
-        if trace_type in pattern:
-            return pattern[trace_type]
+    # " --> ", " >>> ", " ==> ", "-----", ..., " ooo "
 
-        return pattern["unknown"]      # should never happens
+    @staticmethod
+    def _get_pattern() -> str:
+        trace_type = sys._getframe(1).f_code.co_name # info, update, download ...  # noqa: SLF001
+        return pattern.get(trace_type, pattern["unknown"])
 
     # [utils/file.py:413 » export_file]
 
@@ -400,30 +466,25 @@ def _get_caller(cls) -> str:
         if cls.settings["show_caller"] is False:
             return f"{Color.RESET} "
 
-        path = inspect.stack()[2][1].replace("\\", "/")
-        path = path.split(cls.settings["appl_folder"])[-1]
-
-        current_frame: FrameType | None = inspect.currentframe()
-        if current_frame is None:
-            return ""
+        trace_frame = sys._getframe(2) # caller of Trace.info, Trace.result ...  # noqa: SLF001
 
-        caller_frame: FrameType | None = current_frame.f_back
-        if caller_frame is None:
-            return ""
+        key = (trace_frame.f_code, trace_frame.f_lineno)
+        text = cls.callers.get(key)
+        if text is None: # once per call site
+            path = trace_frame.f_code.co_filename.replace("\\", "/").split(cls.settings["appl_folder"])[-1]
+            line_no = str(trace_frame.f_lineno).zfill(3)
 
-        trace_frame: FrameType | None = caller_frame.f_back
-        if trace_frame is None:
-            return ""
+            caller = trace_frame.f_code.co_qualname
+            caller = caller.replace(".<locals>.", " → ")
 
-        line_no = str(trace_frame.f_lineno).zfill(3)
+            if caller == "<module>":
+                text = f"\t{Color.BLUE}[{path}:{line_no}]{Color.RESET}\t"
+            else:
+                text = f"\t{Color.BLUE}[{path}:{line_no} » {caller}]{Color.RESET}\t"
 
-        caller = trace_frame.f_code.co_qualname
-        caller = caller.replace(".<locals>.", " → ")
+            cls.callers[key] = text
 
-        if caller == "<module>":
-            return f"\t{Color.BLUE}[{path}:{line_no}]{Color.RESET}\t"
-        else:
-            return f"\t{Color.BLUE}[{path}:{line_no} » {caller}]{Color.RESET}\t"
+        return text
 
     @classmethod
     def _get_decorator_caller(cls, text: str) -> str:
@@ -455,18 +516,114 @@ def _show_message(cls, file_output: bool, pre: str, message: str, *optional: Any
 
         # https://docs.python.org/3/library/io.html#io.IOBase.isatty
 
-        def is_redirected(stream: Any) -> bool:
-            return not hasattr(stream, "isatty") or not stream.isatty()
+        stream, terminal = cls.terminal
+        if stream is not sys.stdout: # once per stream
+            terminal = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+            cls.terminal = (sys.stdout, terminal)
 
-        if not cls.settings["color"] or is_redirected(stream=sys.stdout):
+        if not cls.settings["color"] or not terminal:
             text_no_tabs = Color.clear(text_no_tabs)
 
         # https://docs.python.org/3/library/sys.html#sys.displayhook
 
         data = (text_no_tabs + "\n").encode("utf-8", "backslashreplace")
+
+        if cls.settings["buffered"]:
+            with cls.lock:
+                cls.buffer.append(data)
+                if len(cls.buffer) >= FLUSH_LINES or time.monotonic() - cls.flushed >= FLUSH_INTERVAL:
+                    cls._flush_buffer()
+
+            if cls.timer is None: # the tail of a burst: written after FLUSH_INTERVAL without a new message
+                cls.timer = threading.Thread(target=cls._flush_timer, name="trace-flush", daemon=True)
+                cls.timer.start()
+            return
+
+        cls._write(data)
+
+    @classmethod
+    def _flush_buffer(cls) -> None:
+        with cls.lock:
+            cls.flushed = time.monotonic()
+            if cls.buffer:
+                data = b"".join(cls.buffer)
+                cls.buffer.clear()
+                cls._write(data)
+
+    @classmethod
+    def _flush_timer(cls) -> None:
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            if cls.buffer and time.monotonic() - cls.flushed >= FLUSH_INTERVAL:
+                try:
+                    cls._flush_buffer()
+                except (OSError, ValueError): # e.g. closed stdout at exit
+                    pass
+
+    # background mode: the caller only puts the data into the queue
+
+    @classmethod
+    def _write(cls, data: bytes) -> None:
+        if not cls.settings["background"]:
+            cls._write_stdout(data)
+            return
+
+        if cls.writer is None:
+            cls.writer = threading.Thread(target=cls._write_sink, name="trace-sink", daemon=True)
+            cls.writer.start()
+
+        cls.sink.put(data)
+
+    # all queued messages of a wake-up -> one write, one flush
+
+    @classmethod
+    def _write_sink(cls) -> None:
+        while True:
+            batch: List[bytes] = []
+            events: List[threading.Event] = []
+
+            item = cls.sink.get()
+            while True:
+                if isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    batch.append(item)
+
+                if len(batch) >= FLUSH_LINES or cls.sink.empty():
+                    break
+                item = cls.sink.get()
+
+            try:
+                if batch:
+                    cls._write_stdout(b"".join(batch))
+            except (OSError, ValueError): # e.g. closed stdout at exit
+                pass
+
+            for event in events:
+                event.set()
+
+    # forked child (e.g. ProcessPoolExecutor in helper/workers.py): the threads of the parent do not exist,
+    # the pending messages are the parent's -> own queue, own thread (started with the first message), empty buffer
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        cls.writer = None
+        cls.timer = None
+        cls.lock = threading.RLock()
+        cls.sink = queue.SimpleQueue()
+        cls.buffer = []
+        cls.flushed = time.monotonic()
+
+    @staticmethod
+    def _write_stdout(data: bytes) -> None:
         if hasattr(sys.stdout, "buffer"):
             sys.stdout.buffer.write(data)
             sys.stdout.flush()
         else:
             text = data.decode("utf-8", "strict")
             sys.stdout.write(text)
+
+atexit.register(Trace.flush) # buffered/background mode: pending messages
+
+if hasattr(os, "register_at_fork"): # not on Windows (spawn only)
+    os.register_at_fork(after_in_child=Trace._after_fork)  # noqa: SLF001